@@ -1,4 +1,8 @@
+import os
+
 from .base import BaseAdapter
+from .engine import AdapterEngine, get_engine
+from .streaming import L2Book, StreamingAdapter
 from .lbank import LBankAdapter
 from .hashkey import HashKeyAdapter
 from .biconomy import BiconomyAdapter
@@ -7,8 +11,8 @@ from .bitrue import BitrueAdapter
 from .ascendex import AscendEXAdapter
 from .bitmart import BitMartAdapter
 from .dextrade import DexTradeAdapter
-from .poloniex import PoloniexAdapter
-from .gateio import GateIOAdapter
+from .poloniex import PoloniexAdapter, PoloniexStream
+from .gateio import GateIOAdapter, GateIOStream
 from .niza import NizaAdapter
 from .xt import XTAdapter
 from .coinstore import CoinstoreAdapter
@@ -19,12 +23,61 @@ from .p2pb2b import P2PB2BAdapter
 from .digifinex import DigiFinexAdapter
 from .azbit import AzbitAdapter
 from .latoken import LatokenAdapter
-from .kraken import KrakenAdapter
-from .bingx import BingXAdapter
+from .kraken import KrakenAdapter, KrakenStream
+from .bingx import BingXAdapter, BingXStream
 from .btse import BTSEAdapter
 from .whitebit import WhiteBitAdapter
 from .htx import HTXAdapter
 from .binancealpha import BinanceAlphaAdapter
 from .uzx import UZXAdapter
 
-__all__ = ['BaseAdapter', 'LBankAdapter', 'HashKeyAdapter', 'BiconomyAdapter', 'MEXCAdapter', 'BitrueAdapter', 'AscendEXAdapter', 'BitMartAdapter', 'DexTradeAdapter', 'PoloniexAdapter', 'GateIOAdapter', 'NizaAdapter', 'XTAdapter', 'CoinstoreAdapter', 'VindaxAdapter', 'FameEXAdapter', 'BigOneAdapter', 'P2PB2BAdapter', 'DigiFinexAdapter', 'AzbitAdapter', 'LatokenAdapter', 'KrakenAdapter', 'BingXAdapter', 'BTSEAdapter', 'WhiteBitAdapter', 'HTXAdapter', 'BinanceAlphaAdapter', 'UZXAdapter']
+ADAPTERS = {
+    'LBANK': LBankAdapter, 'HASHKEY': HashKeyAdapter, 'BICONOMY': BiconomyAdapter,
+    'MEXC': MEXCAdapter, 'BITRUE': BitrueAdapter, 'ASCENDEX': AscendEXAdapter,
+    'BITMART': BitMartAdapter, 'DEXTRADE': DexTradeAdapter, 'POLONIEX': PoloniexAdapter,
+    'GATEIO': GateIOAdapter, 'NIZA': NizaAdapter, 'XT': XTAdapter,
+    'COINSTORE': CoinstoreAdapter, 'VINDAX': VindaxAdapter, 'FAMEEX': FameEXAdapter,
+    'BIGONE': BigOneAdapter, 'P2PB2B': P2PB2BAdapter, 'DIGIFINEX': DigiFinexAdapter,
+    'AZBIT': AzbitAdapter, 'LATOKEN': LatokenAdapter, 'KRAKEN': KrakenAdapter,
+    'BINGX': BingXAdapter, 'BTSE': BTSEAdapter, 'WHITEBIT': WhiteBitAdapter,
+    'HTX': HTXAdapter, 'BINANCEALPHA': BinanceAlphaAdapter, 'UZX': UZXAdapter,
+}
+
+# One long-lived instance per exchange, so per-adapter metadata caches
+# (currency/pair maps, symbol indexes) stay warm across requests.
+_INSTANCES = {name: cls() for name, cls in ADAPTERS.items()}
+
+
+def get_adapter(exchange: str):
+    """Return the shared adapter instance for an exchange name, or None."""
+    return _INSTANCES.get(exchange.upper())
+
+
+# WebSocket depth feeds; enabled per exchange with STREAMING_EXCHANGES
+# (comma-separated names, or "all"). A feed connects on its first read.
+STREAMS = {
+    'KRAKEN': KrakenStream, 'GATEIO': GateIOStream,
+    'POLONIEX': PoloniexStream, 'BINGX': BingXStream,
+}
+
+_enabled_streams = {
+    name.strip().upper() for name in os.environ.get('STREAMING_EXCHANGES', '').split(',') if name.strip()
+}
+_STREAM_INSTANCES = {
+    name: cls(_INSTANCES[name]) for name, cls in STREAMS.items()
+    if 'ALL' in _enabled_streams or name in _enabled_streams
+}
+
+
+def get_stream(exchange: str):
+    """Return the enabled streaming feed for an exchange name, or None."""
+    return _STREAM_INSTANCES.get(exchange.upper())
+
+
+def stream_orderbook(exchange: str, symbol: str, limit: int = 20):
+    """Orderbook from the exchange's streamed local book, or None to fall back to REST."""
+    stream = get_stream(exchange)
+    return stream.orderbook(symbol, limit) if stream else None
+
+
+__all__ = ['ADAPTERS', 'get_adapter', 'STREAMS', 'get_stream', 'stream_orderbook', 'L2Book', 'StreamingAdapter', 'GateIOStream', 'PoloniexStream', 'KrakenStream', 'BingXStream', 'AdapterEngine', 'get_engine', 'BaseAdapter', 'LBankAdapter', 'HashKeyAdapter', 'BiconomyAdapter', 'MEXCAdapter', 'BitrueAdapter', 'AscendEXAdapter', 'BitMartAdapter', 'DexTradeAdapter', 'PoloniexAdapter', 'GateIOAdapter', 'NizaAdapter', 'XTAdapter', 'CoinstoreAdapter', 'VindaxAdapter', 'FameEXAdapter', 'BigOneAdapter', 'P2PB2BAdapter', 'DigiFinexAdapter', 'AzbitAdapter', 'LatokenAdapter', 'KrakenAdapter', 'BingXAdapter', 'BTSEAdapter', 'WhiteBitAdapter', 'HTXAdapter', 'BinanceAlphaAdapter', 'UZXAdapter']
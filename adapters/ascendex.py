@@ -15,7 +15,7 @@ class AscendEXAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/api/pro/v1/spot/ticker",
                 timeout=30
             )
@@ -71,8 +71,9 @@ class AscendEXAdapter(BaseAdapter):
     
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/api/pro/v1/depth",
+                kind='depth',
                 params={"symbol": symbol},
                 timeout=30
             )
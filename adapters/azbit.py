@@ -15,7 +15,7 @@ class AzbitAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/tickers",
                 timeout=30
             )
@@ -64,8 +64,9 @@ class AzbitAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').replace('/', '')
             ticker_id = f"{base}_USDT"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/marketdata/coingecko/orderbook",
+                kind='depth',
                 params={
                     "ticker_id": ticker_id,
                     "depth": limit
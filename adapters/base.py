@@ -1,7 +1,22 @@
+import asyncio
+import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
+import requests
+
+from .http_session import get_session
+from .ratelimit import get_limiter, retry_after
+
+logger = logging.getLogger(__name__)
+
+# Per-thread deadline (time.monotonic()) for the adapter call running on it
+_call = threading.local()
+
 
 @dataclass
 class NormalizedOrderbook:
@@ -50,6 +65,31 @@ class NormalizedTicker:
 
 
 class BaseAdapter(ABC):
+    # Connection pool size and request timeout for this exchange's shared session.
+    # Override on the subclass or with <EXCHANGE>_HTTP_POOL_SIZE / <EXCHANGE>_HTTP_TIMEOUT.
+    # HTTP_TIMEOUT = None keeps the timeout passed by each call.
+    HTTP_POOL_SIZE = 16
+    HTTP_TIMEOUT: Optional[float] = None
+    # Requests the async engine keeps in flight against this exchange at once
+    # (<EXCHANGE>_MAX_CONCURRENCY overrides).
+    MAX_CONCURRENCY = 8
+    # Seconds a full ticker refresh may take before the orchestrator gives up on it
+    # (<EXCHANGE>_TICKER_DEADLINE overrides).
+    TICKER_DEADLINE = 60
+    # Seconds one orderbook request may take, rate-limit waits and retries
+    # included (<EXCHANGE>_DEPTH_DEADLINE overrides).
+    DEPTH_DEADLINE = 15
+    # Token bucket shared by every caller of this exchange: RATE_LIMIT requests/sec
+    # with bursts up to RATE_BURST (<EXCHANGE>_RATE_LIMIT / <EXCHANGE>_RATE_BURST
+    # override). REQUEST_WEIGHTS sets the tokens each request kind consumes.
+    RATE_LIMIT = 10.0
+    RATE_BURST = 20.0
+    REQUEST_WEIGHTS = {'ticker': 1, 'depth': 1}
+    RATE_LIMIT_RETRIES = 2
+    RATE_LIMIT_BACKOFF = 1.5
+    # Report from the last ticker refresh (pairs listed / fetched / failed) for
+    # adapters that fetch pairs one by one; None when not tracked.
+    last_coverage: Optional[dict] = None
     
     @property
     @abstractmethod
@@ -64,6 +104,49 @@ class BaseAdapter(ABC):
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         pass
     
+    async def fetch_usdt_tickers_async(self, timeout: Optional[float] = None) -> List[NormalizedTicker]:
+        """Async variant of fetch_usdt_tickers; blocking adapters run on the loop's executor.
+
+        `timeout` becomes a deadline enforced by every _get() of the call, so
+        the executor thread itself finishes instead of outliving the caller.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return await loop.run_in_executor(None, self._run_with_deadline, deadline, self.fetch_usdt_tickers)
+    
+    async def fetch_orderbook_async(self, symbol: str, limit: int = 20,
+                                    timeout: Optional[float] = None) -> NormalizedOrderbook:
+        """Async variant of fetch_orderbook; blocking adapters run on the loop's executor.
+
+        `timeout` is enforced inside the call as for fetch_usdt_tickers_async.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return await loop.run_in_executor(None, self._run_with_deadline, deadline,
+                                          self.fetch_orderbook, symbol, limit)
+    
+    @staticmethod
+    def _run_with_deadline(deadline: Optional[float], fn, *args):
+        """Run fn(*args) on this thread with every _get() bounded by `deadline` (monotonic)."""
+        previous = getattr(_call, 'deadline', None)
+        _call.deadline = deadline
+        try:
+            return fn(*args)
+        finally:
+            _call.deadline = previous
+
+    @property
+    def ticker_deadline(self) -> float:
+        return self._http_setting('TICKER_DEADLINE', self.TICKER_DEADLINE)
+    
+    @property
+    def depth_deadline(self) -> float:
+        return self._http_setting('DEPTH_DEADLINE', self.DEPTH_DEADLINE)
+    
+    @property
+    def max_concurrency(self) -> int:
+        return max(1, int(self._http_setting('MAX_CONCURRENCY', self.MAX_CONCURRENCY)))
+    
     def _safe_float(self, value, default=0.0) -> float:
         if value is None:
             return default
@@ -71,3 +154,65 @@ class BaseAdapter(ABC):
             return float(value)
         except (ValueError, TypeError):
             return default
+    
+    def _http_setting(self, name, default):
+        value = os.environ.get(f"{self.exchange_name}_{name}")
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    
+    @property
+    def session(self) -> requests.Session:
+        pool_size = int(self._http_setting('HTTP_POOL_SIZE', self.HTTP_POOL_SIZE))
+        return get_session(self.exchange_name, pool_size)
+    
+    @property
+    def rate_limiter(self):
+        return get_limiter(
+            self.exchange_name,
+            self._http_setting('RATE_LIMIT', self.RATE_LIMIT),
+            self._http_setting('RATE_BURST', self.RATE_BURST),
+        )
+    
+    def _get(self, url: str, kind: str = 'ticker', **kwargs) -> requests.Response:
+        """GET through the exchange's pooled session and shared rate limiter.
+        
+        `kind` ('ticker' or 'depth') picks the request weight. Rate-limited
+        responses (see _rate_limited) pause the whole exchange for Retry-After
+        (or an exponential backoff) and are retried up to RATE_LIMIT_RETRIES times. Inside a call with a
+        deadline (see _run_with_deadline) waits and request timeouts are cut
+        to the time left, and TimeoutError is raised once it has passed.
+        """
+        timeout = self._http_setting('HTTP_TIMEOUT', self.HTTP_TIMEOUT)
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        deadline = getattr(_call, 'deadline', None)
+        limiter = self.rate_limiter
+        weight = self.REQUEST_WEIGHTS.get(kind, 1)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            if deadline is None:
+                limiter.acquire(weight)
+            else:
+                left = deadline - time.monotonic()
+                if left <= 0 or not limiter.acquire(weight, timeout=left):
+                    raise TimeoutError(f"{self.exchange_name}: deadline passed before {url}")
+                left = deadline - time.monotonic()
+                kwargs['timeout'] = min(kwargs.get('timeout') or left, max(left, 0.1))
+            response = self.session.get(url, **kwargs)
+            if not self._rate_limited(response):
+                limiter.observe(response.headers)
+                return response
+            delay = retry_after(response.headers)
+            if delay is None:
+                delay = self.RATE_LIMIT_BACKOFF * (2 ** attempt)
+            logger.warning(f"{self.exchange_name}: rate limited ({response.status_code}), "
+                           f"pausing {delay:.1f}s")
+            limiter.block_for(delay)
+        return response
+    
+    def _rate_limited(self, response: requests.Response) -> bool:
+        """Whether `response` is a throttling rejection; venues that signal it in the body override this."""
+        return response.status_code in (429, 418)
@@ -21,7 +21,7 @@ class BiconomyAdapter(BaseAdapter):
         url = f"{self.BASE_URL}/api/v1/tickers"
         
         try:
-            response = requests.get(url, headers=self.HEADERS, timeout=30)
+            response = self._get(url, headers=self.HEADERS, timeout=30)
             response.raise_for_status()
             data = response.json()
         except requests.RequestException as e:
@@ -74,7 +74,7 @@ class BiconomyAdapter(BaseAdapter):
         params = {"symbol": api_symbol, "size": str(limit)}
 
         try:
-            response = requests.get(url, params=params, headers=self.HEADERS, timeout=10)
+            response = self._get(url, kind='depth', params=params, headers=self.HEADERS, timeout=10)
             response.raise_for_status()
             data = response.json()
         except requests.RequestException as e:
@@ -15,7 +15,7 @@ class BigOneAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/asset_pairs/tickers",
                 timeout=30
             )
@@ -77,8 +77,9 @@ class BigOneAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '')
             api_symbol = f"{base}-USDT"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/asset_pairs/{api_symbol}/depth",
+                kind='depth',
                 timeout=10
             )
             response.raise_for_status()
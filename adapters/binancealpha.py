@@ -1,13 +1,12 @@
 import requests
 import logging
+import time
 from typing import List
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .metadata import MetadataCache
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache: base_symbol_upper -> alphaId (e.g. "NEX" -> "ALPHA_971")
-_ALPHA_ID_CACHE: dict = {}
-
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Accept": "application/json",
@@ -26,41 +25,51 @@ class BinanceAlphaAdapter(BaseAdapter):
         "https://www.binance.com/bapi/defi/v1/public/alpha-trade/depth"
     )
 
+    # The token list is also refreshed by every ticker fetch
+    ALPHA_ID_TTL = 1800
+    MISSING_TTL = 600
+
     @property
     def exchange_name(self) -> str:
         return "BINANCEALPHA"
 
     def _fetch_token_list(self) -> list:
-        resp = requests.get(self.TOKEN_LIST_URL, headers=HEADERS, timeout=30)
+        resp = self._get(self.TOKEN_LIST_URL, headers=HEADERS, timeout=30)
         resp.raise_for_status()
         data = resp.json()
         if not data.get("success"):
             raise Exception(f"Binance Alpha token list error: {data.get('message')}")
         return data.get("data", [])
 
+    def _select_tokens(self, tokens: list) -> dict:
+        """Active tokens keyed by base symbol, keeping the highest turnover per symbol."""
+        best: dict = {}
+        for token in tokens:
+            if token.get("offline", False) or token.get("fullyDelisted", False):
+                continue
+            raw_symbol = token.get("symbol", "")
+            alpha_id = token.get("alphaId", "")
+            if not raw_symbol or not alpha_id:
+                continue
+            base = raw_symbol.upper()
+            turnover = self._safe_float(token.get("volume24h")) or 0.0
+            prev = best.get(base)
+            if prev is None or turnover > (self._safe_float(prev.get("volume24h")) or 0.0):
+                best[base] = token
+        return best
+
+    def _load_alpha_ids(self) -> dict:
+        """Download the token list as {base_symbol: alphaId} (e.g. "NEX" -> "ALPHA_971")."""
+        best = self._select_tokens(self._fetch_token_list())
+        return {base: token["alphaId"] for base, token in best.items()}
+
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            tokens = self._fetch_token_list()
-            # Deduplicate by base symbol — keep highest turnover per symbol
-            best: dict = {}
-            for token in tokens:
-                if token.get("offline", False) or token.get("fullyDelisted", False):
-                    continue
-                raw_symbol = token.get("symbol", "")
-                alpha_id = token.get("alphaId", "")
-                if not raw_symbol or not alpha_id:
-                    continue
-                base = raw_symbol.upper()
-                turnover = self._safe_float(token.get("volume24h")) or 0.0
-                prev = best.get(base)
-                if prev is None or turnover > (self._safe_float(prev.get("volume24h")) or 0.0):
-                    best[base] = token
+            best = self._select_tokens(self._fetch_token_list())
+            _ALPHA_IDS.put({base: token["alphaId"] for base, token in best.items()})
 
             tickers = []
             for base, token in best.items():
-                alpha_id = token.get("alphaId", "")
-                _ALPHA_ID_CACHE[base] = alpha_id
-
                 price = self._safe_float(token.get("price"))
                 turnover = self._safe_float(token.get("volume24h"))
                 change = self._safe_float(token.get("percentChange24h"))
@@ -90,27 +99,34 @@ class BinanceAlphaAdapter(BaseAdapter):
             logger.error(f"BinanceAlpha processing error: {e}")
             raise
 
+    def _note_missing(self, base: str) -> bool:
+        """Record a symbol without an alphaId; False if any worker already did within MISSING_TTL."""
+        _MISSING_ALPHA_IDS.adopt_snapshot()
+        now = time.time()
+        missing = _MISSING_ALPHA_IDS.get()
+        if now - missing.get(base, 0) <= self.MISSING_TTL:
+            return False
+        missing = {b: ts for b, ts in missing.items() if now - ts <= self.MISSING_TTL}
+        missing[base] = now
+        _MISSING_ALPHA_IDS.put(missing)
+        return True
+
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
             base = symbol.split("/")[0].upper()
 
-            # Ensure cache is populated
-            if base not in _ALPHA_ID_CACHE:
-                for token in self._fetch_token_list():
-                    sym = token.get("symbol", "").upper()
-                    aid = token.get("alphaId", "")
-                    if sym and aid:
-                        _ALPHA_ID_CACHE[sym] = aid
-
-            alpha_id = _ALPHA_ID_CACHE.get(base)
+            alpha_id = _ALPHA_IDS.get().get(base)
             if not alpha_id:
+                if self._note_missing(base):
+                    _ALPHA_IDS.refresh_async(force=True)
                 return NormalizedOrderbook(
                     exchange=self.exchange_name, symbol=symbol, asks=[], bids=[]
                 )
 
             trading_symbol = f"{alpha_id}USDT"
-            resp = requests.get(
+            resp = self._get(
                 self.DEPTH_URL,
+                kind='depth',
                 params={"symbol": trading_symbol, "limit": limit},
                 headers=HEADERS,
                 timeout=30,
@@ -136,3 +152,21 @@ class BinanceAlphaAdapter(BaseAdapter):
             return NormalizedOrderbook(
                 exchange=self.exchange_name, symbol=symbol, asks=[], bids=[]
             )
+
+
+# base symbol -> alphaId, shared across workers through the on-disk snapshot
+_ALPHA_IDS = MetadataCache(
+    'binancealpha_alpha_ids',
+    lambda: BinanceAlphaAdapter()._load_alpha_ids(),
+    ttl=BinanceAlphaAdapter.ALPHA_ID_TTL,
+    min_refresh_interval=300,
+)
+
+# Symbols with no alphaId: base symbol -> time of the miss. Avoids a token-list
+# refresh per depth request for delisted/unknown symbols; like _ALPHA_IDS it is
+# shared across workers through the on-disk snapshot. Only written via put().
+_MISSING_ALPHA_IDS = MetadataCache(
+    'binancealpha_missing_ids',
+    dict,
+    ttl=float('inf'),
+)
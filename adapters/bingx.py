@@ -1,8 +1,12 @@
+import gzip
+import json
 import requests
 import logging
 import time
-from typing import List
+import uuid
+from typing import List, Optional
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .streaming import StreamingAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +21,7 @@ class BingXAdapter(BaseAdapter):
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
             ts = int(time.time() * 1000)
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/ticker/24hr",
                 params={'timestamp': ts},
                 timeout=30,
@@ -69,8 +73,9 @@ class BingXAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '')
             bingx_symbol = f"{base}-USDT"
 
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/market/depth",
+                kind='depth',
                 params={'symbol': bingx_symbol, 'depth': limit},
                 timeout=10,
             )
@@ -106,3 +111,41 @@ class BingXAdapter(BaseAdapter):
         except requests.RequestException as e:
             logger.error(f"BINGX orderbook error: {str(e)}")
             raise Exception(f"Failed to fetch BINGX orderbook: {str(e)}")
+
+
+class BingXStream(StreamingAdapter):
+    """BingX `<symbol>@depth20` channel: gzip-compressed full top-20 snapshots.
+
+    Each push replaces the book, so there is no sequence to track. The
+    server sends a "Ping" text frame that must be answered with "Pong".
+    """
+
+    URL = "wss://open-api-ws.bingx.com/market"
+
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        base = symbol.replace('/USDT', '')
+        return f"{base}-USDT"
+
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"id": uuid.uuid4().hex, "reqType": "sub", "dataType": f"{s}@depth20"}
+                for s in venue_symbols]
+
+    def unsubscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"id": uuid.uuid4().hex, "reqType": "unsub", "dataType": f"{s}@depth20"}
+                for s in venue_symbols]
+
+    def decode(self, raw):
+        text = gzip.decompress(raw).decode() if isinstance(raw, bytes) else raw
+        return text if text == 'Ping' else json.loads(text)
+
+    def handle_message(self, message):
+        if message == 'Ping':
+            self._send(['Pong'])
+            return
+        data_type = message.get('dataType') or ''
+        data = message.get('data')
+        if not data_type.endswith('@depth20') or not isinstance(data, dict):
+            return
+        symbol = data_type.rsplit('@', 1)[0]
+        if self._watched(symbol):
+            self._book(symbol).reset(data.get('bids', []), data.get('asks', []))
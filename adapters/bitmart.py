@@ -15,7 +15,7 @@ class BitMartAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/spot/quotation/v3/tickers",
                 timeout=30
             )
@@ -74,8 +74,9 @@ class BitMartAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '_')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/spot/quotation/v3/books",
+                kind='depth',
                 params={"symbol": api_symbol, "limit": min(limit, 50)},
                 timeout=30
             )
@@ -15,7 +15,7 @@ class BTSEAdapter(BaseAdapter):
 
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/market_summary",
                 timeout=30
             )
@@ -65,8 +65,9 @@ class BTSEAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '-')
 
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/orderbook/L2",
+                kind='depth',
                 params={'symbol': api_symbol, 'depth': limit},
                 timeout=10
             )
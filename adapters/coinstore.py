@@ -15,7 +15,7 @@ class CoinstoreAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/tickers",
                 timeout=30
             )
@@ -68,8 +68,9 @@ class CoinstoreAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/depth/{api_symbol}",
+                kind='depth',
                 timeout=10
             )
             response.raise_for_status()
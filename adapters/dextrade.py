@@ -1,7 +1,8 @@
+import asyncio
 import requests
 import logging
-from typing import List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from typing import List, Optional
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
 
 logger = logging.getLogger(__name__)
@@ -9,69 +10,153 @@ logger = logging.getLogger(__name__)
 
 class DexTradeAdapter(BaseAdapter):
     BASE_URL = "https://api.dex-trade.com/v1/public"
+    TICKER_DEADLINE = 120
+    # Dex-Trade has no bulk ticker endpoint, so tickers are fetched per pair
+    # with an adaptive number of requests in flight, on the adapter engine's
+    # shared executor.
+    RATE_LIMIT = 30.0
+    RATE_BURST = 60.0
+    HTTP_POOL_SIZE = 32
+    TICKER_MIN_CONCURRENCY = 4
+    TICKER_MAX_CONCURRENCY = 32
+    TICKER_RETRY_ROUNDS = 2
+    _ticker_concurrency = 16
     
     @property
     def exchange_name(self) -> str:
         return "DEXTRADE"
     
-    def _fetch_single_ticker(self, session, pair_info):
+    def _fetch_single_ticker(self, pair_info):
+        """Fetch one pair's ticker; returns (ticker or None, retryable).
+
+        Transport and HTTP errors are retryable; an empty, error or
+        malformed (non-object) payload means the pair has no market data
+        and is not retried.
+        """
         pair_name = pair_info.get('pair', '')
         base = pair_info.get('base', '')
         
         try:
-            ticker_response = session.get(
+            ticker_response = self._get(
                 f"{self.BASE_URL}/ticker",
                 params={"pair": pair_name},
                 timeout=5
             )
-            
             if ticker_response.status_code != 200:
-                return None
-            
+                return None, True
             ticker_data = ticker_response.json()
-            
-            if not ticker_data or 'error' in ticker_data:
-                return None
-            
-            data = ticker_data.get('data', ticker_data)
-            
-            last_price = self._safe_float(data.get('last'))
-            volume_24h = self._safe_float(data.get('volume_24H', data.get('volume')))
-            high_24h = self._safe_float(data.get('high'))
-            low_24h = self._safe_float(data.get('low'))
-            change_24h = self._safe_float(data.get('percent_сhange', data.get('percent_change', 0)))
-            
-            turnover_24h = volume_24h * last_price if volume_24h and last_price else 0
-            
-            return NormalizedTicker(
-                exchange=self.exchange_name,
-                symbol=f"{base}/USDT",
-                base_currency=base,
-                quote_currency='USDT',
-                price=last_price,
-                volume_24h=volume_24h,
-                high_24h=high_24h,
-                low_24h=low_24h,
-                change_24h=change_24h,
-                turnover_24h=turnover_24h
-            )
-        except Exception as e:
+        except (requests.RequestException, ValueError, TimeoutError) as e:
             logger.debug(f"Dex-Trade: Failed to fetch ticker for {pair_name}: {e}")
-            return None
+            return None, True
+        
+        if not isinstance(ticker_data, dict) or not ticker_data or 'error' in ticker_data:
+            return None, False
+        
+        data = ticker_data.get('data', ticker_data)
+        if not isinstance(data, dict):
+            logger.debug(f"Dex-Trade: Unexpected ticker payload for {pair_name}: {data!r:.100}")
+            return None, False
+        
+        last_price = self._safe_float(data.get('last'))
+        volume_24h = self._safe_float(data.get('volume_24H', data.get('volume')))
+        high_24h = self._safe_float(data.get('high'))
+        low_24h = self._safe_float(data.get('low'))
+        change_24h = self._safe_float(data.get('percent_сhange', data.get('percent_change', 0)))
+        
+        turnover_24h = volume_24h * last_price if volume_24h and last_price else 0
+        
+        return NormalizedTicker(
+            exchange=self.exchange_name,
+            symbol=f"{base}/USDT",
+            base_currency=base,
+            quote_currency='USDT',
+            price=last_price,
+            volume_24h=volume_24h,
+            high_24h=high_24h,
+            low_24h=low_24h,
+            change_24h=change_24h,
+            turnover_24h=turnover_24h
+        ), False
     
-    def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
+    async def _fetch_pairs_adaptive(self, pairs, deadline):
+        """Fan out per-pair ticker requests with AIMD concurrency.
+
+        The in-flight limit grows by one after each window of `limit` clean
+        responses and halves (at most once per window) on a retryable
+        failure. Returns (tickers, failed_pairs); pairs not attempted before
+        `deadline` count as failed. Requests still running at the deadline
+        are abandoned; their _get() calls stop at the same deadline.
+        """
+        loop = asyncio.get_running_loop()
+        tickers = []
+        failed = []
+        queue = list(pairs)
+        in_flight = {}
+        limit = self._ticker_concurrency
+        clean = 0
+        since_cut = limit
+        
+        while queue or in_flight:
+            while queue and len(in_flight) < limit and time.monotonic() < deadline:
+                pair = queue.pop()
+                task = loop.run_in_executor(None, self._run_with_deadline, deadline,
+                                            self._fetch_single_ticker, pair)
+                in_flight[task] = pair
+            if not in_flight:
+                break
+            done, _ = await asyncio.wait(in_flight, timeout=max(0.0, deadline - time.monotonic()),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                pair = in_flight.pop(future)
+                try:
+                    ticker, retryable = future.result()
+                except Exception as e:
+                    # One bad pair must not abort the refresh: count it as a retryable failure
+                    logger.warning(f"Dex-Trade: ticker for {pair.get('pair')} failed: {e}")
+                    ticker, retryable = None, True
+                since_cut += 1
+                if retryable:
+                    failed.append(pair)
+                    clean = 0
+                    if since_cut >= limit:
+                        limit = max(self.TICKER_MIN_CONCURRENCY, limit // 2)
+                        since_cut = 0
+                    continue
+                if ticker:
+                    tickers.append(ticker)
+                clean += 1
+                if clean >= limit:
+                    limit = min(self.TICKER_MAX_CONCURRENCY, limit + 1)
+                    clean = 0
+        
+        self._ticker_concurrency = limit
+        failed.extend(in_flight.values())
+        failed.extend(queue)
+        return tickers, failed
+    
+    def _fetch_symbols(self):
+        symbols_response = self._get(
+            f"{self.BASE_URL}/symbols",
+            timeout=30
+        )
+        symbols_response.raise_for_status()
+        symbols_data = symbols_response.json()
+        
+        if not symbols_data.get('status'):
+            raise Exception("Failed to fetch symbols from Dex-Trade")
+        return symbols_data
+    
+    async def fetch_usdt_tickers_async(self, timeout: Optional[float] = None) -> List[NormalizedTicker]:
+        loop = asyncio.get_running_loop()
         try:
-            session = requests.Session()
+            started = time.monotonic()
+            deadline = started + (self.ticker_deadline if timeout is None else timeout) * 0.9
             
-            symbols_response = session.get(
-                f"{self.BASE_URL}/symbols",
-                timeout=30
+            symbols_data = await loop.run_in_executor(
+                None, self._run_with_deadline, deadline, self._fetch_symbols
             )
-            symbols_response.raise_for_status()
-            symbols_data = symbols_response.json()
-            
-            if not symbols_data.get('status'):
-                raise Exception("Failed to fetch symbols from Dex-Trade")
             
             usdt_pairs = [
                 s for s in symbols_data.get('data', [])
@@ -81,16 +166,32 @@ class DexTradeAdapter(BaseAdapter):
             logger.info(f"Dex-Trade: Found {len(usdt_pairs)} USDT pairs, fetching tickers concurrently...")
             
             tickers = []
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                futures = {executor.submit(self._fetch_single_ticker, session, pair): pair 
-                          for pair in usdt_pairs}
-                
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result:
-                        tickers.append(result)
-            
-            logger.info(f"Dex-Trade: Fetched {len(tickers)} USDT pairs")
+            pending = usdt_pairs
+            retried = 0
+            for attempt in range(self.TICKER_RETRY_ROUNDS + 1):
+                if attempt:
+                    # Only the pairs that failed go round again, after a short pause
+                    retried += len(pending)
+                    await asyncio.sleep(min(2 ** (attempt - 1), max(0.0, deadline - time.monotonic())))
+                fetched, pending = await self._fetch_pairs_adaptive(pending, deadline)
+                tickers.extend(fetched)
+                if not pending or time.monotonic() >= deadline:
+                    break
+            
+            listed = len(usdt_pairs)
+            self.last_coverage = {
+                'listed': listed,
+                'fetched': len(tickers),
+                'failed': len(pending),
+                'no_data': listed - len(tickers) - len(pending),
+                'retried': retried,
+                'coverage_pct': round(len(tickers) / listed * 100, 1) if listed else 100.0,
+                'concurrency': self._ticker_concurrency,
+                'elapsed': round(time.monotonic() - started, 1),
+            }
+            logger.info(f"Dex-Trade: Fetched {len(tickers)}/{listed} USDT pairs "
+                        f"({len(pending)} failed, {retried} retried) "
+                        f"in {self.last_coverage['elapsed']}s")
             return tickers
             
         except requests.RequestException as e:
@@ -100,12 +201,18 @@ class DexTradeAdapter(BaseAdapter):
             logger.error(f"Dex-Trade processing error: {str(e)}")
             raise
     
+    def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
+        """Blocking entry point: runs the async fetch on the shared engine (never call from its loop)."""
+        from .engine import get_engine
+        return get_engine().run(self.fetch_usdt_tickers_async())
+    
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
             api_pair = symbol.replace('/', '')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/book",
+                kind='depth',
                 params={"pair": api_pair},
                 timeout=30
             )
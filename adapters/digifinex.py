@@ -15,7 +15,7 @@ class DigiFinexAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/ticker",
                 timeout=30
             )
@@ -68,8 +68,9 @@ class DigiFinexAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').replace('/', '')
             api_symbol = f"{base.lower()}_usdt"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/order_book",
+                kind='depth',
                 params={
                     "symbol": api_symbol,
                     "limit": limit
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import BaseAdapter, NormalizedOrderbook
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on blocking adapter calls in flight across the whole process
+MAX_IO_WORKERS = 64
+
+
+class AdapterEngine:
+    """Event loop on a background thread that runs adapter calls concurrently.
+
+    Requests are scheduled as coroutines against the async adapter contract
+    (fetch_usdt_tickers_async / fetch_orderbook_async) and capped per exchange
+    by BaseAdapter.max_concurrency. Blocking adapters share one bounded
+    executor, so fan-out no longer spawns a thread pool per request.
+    """
+
+    def __init__(self, max_workers: int = MAX_IO_WORKERS):
+        self._max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix='adapter-io'
+                ))
+                thread = threading.Thread(target=loop.run_forever, name='adapter-engine', daemon=True)
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def _semaphore(self, adapter: BaseAdapter) -> asyncio.Semaphore:
+        sem = self._semaphores.get(adapter.exchange_name)
+        if sem is None:
+            sem = asyncio.Semaphore(adapter.max_concurrency)
+            self._semaphores[adapter.exchange_name] = sem
+        return sem
+
+    async def fetch_orderbook(self, adapter: BaseAdapter, symbol: str, limit: int = 20,
+                              timeout: Optional[float] = None) -> NormalizedOrderbook:
+        """One orderbook bounded by `timeout` (default: adapter.depth_deadline), enforced inside the call."""
+        if timeout is None:
+            timeout = adapter.depth_deadline
+        async with self._semaphore(adapter):
+            return await asyncio.wait_for(adapter.fetch_orderbook_async(symbol, limit, timeout), timeout)
+
+    async def fetch_tickers(self, adapter: BaseAdapter, timeout: Optional[float] = None):
+        """Ticker refresh bounded by `timeout`; the adapter enforces it too, so its thread is freed."""
+        async with self._semaphore(adapter):
+            return await asyncio.wait_for(adapter.fetch_usdt_tickers_async(timeout), timeout)
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the engine loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the engine loop from synchronous code and wait for it.
+
+        On timeout the coroutine is cancelled and TimeoutError is raised.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    @staticmethod
+    def batch_timeout(jobs: List[Tuple[BaseAdapter, str]]) -> float:
+        """Upper bound for an orderbook batch: per exchange, its jobs run max_concurrency
+        at a time and each one stops at depth_deadline."""
+        per_exchange: Dict[str, Tuple[BaseAdapter, int]] = {}
+        for adapter, _ in jobs:
+            _, count = per_exchange.get(adapter.exchange_name, (adapter, 0))
+            per_exchange[adapter.exchange_name] = (adapter, count + 1)
+        return max((math.ceil(count / adapter.max_concurrency) * adapter.depth_deadline
+                    for adapter, count in per_exchange.values()), default=0.0) + 5.0
+
+    def fetch_orderbooks(self, jobs: Iterable[Tuple[BaseAdapter, str]], limit: int = 20,
+                         timeout: Optional[float] = None) -> List[Any]:
+        """Fetch many orderbooks at once; returns an orderbook or the raised exception per job.
+
+        Each call stops at its adapter's depth_deadline; the batch as a whole
+        waits at most `timeout` (default: batch_timeout(jobs)).
+        """
+        jobs = list(jobs)
+        if timeout is None:
+            timeout = self.batch_timeout(jobs)
+
+        async def _gather():
+            return await asyncio.gather(
+                *(self.fetch_orderbook(adapter, symbol, limit) for adapter, symbol in jobs),
+                return_exceptions=True
+            )
+
+        return self.run(_gather(), timeout) if jobs else []
+
+
+_engine: Optional[AdapterEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> AdapterEngine:
+    """Return the process-wide adapter engine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AdapterEngine()
+    return _engine
@@ -15,7 +15,7 @@ class FameEXAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/v2/public/ticker",
                 timeout=30
             )
@@ -65,8 +65,9 @@ class FameEXAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '')
             api_symbol = f"{base}USDT"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/sapi/v1/depth",
+                kind='depth',
                 params={"symbol": api_symbol, "limit": limit},
                 timeout=10
             )
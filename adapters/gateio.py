@@ -1,7 +1,10 @@
 import requests
 import logging
-from typing import List
+import threading
+import time
+from typing import List, Optional
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .streaming import StreamingAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +18,7 @@ class GateIOAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/spot/tickers",
                 timeout=30
             )
@@ -63,8 +66,9 @@ class GateIOAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').replace('/', '')
             api_symbol = f"{base}_USDT"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/spot/order_book",
+                kind='depth',
                 params={
                     "currency_pair": api_symbol,
                     "limit": limit
@@ -98,3 +102,95 @@ class GateIOAdapter(BaseAdapter):
         except requests.RequestException as e:
             logger.error(f"Gate.io orderbook error: {str(e)}")
             raise Exception(f"Failed to fetch Gate.io orderbook: {str(e)}")
+
+
+class GateIOStream(StreamingAdapter):
+    """Gate.io `spot.order_book_update` diffs applied on top of a REST snapshot.
+
+    Updates are buffered until the snapshot (fetched with its update id)
+    arrives; after that each update's first id U must follow the previous
+    last id u, otherwise the book is resynced from a new snapshot.
+    """
+
+    URL = "wss://api.gateio.ws/ws/v4/"
+    SNAPSHOT_DEPTH = 100
+    MAX_BUFFERED = 500
+
+    def __init__(self, adapter):
+        super().__init__(adapter)
+        self._pending = {}   # venue symbol -> updates received before the snapshot
+
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        base = symbol.replace('/USDT', '').replace('/', '')
+        return f"{base}_USDT"
+
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"time": int(time.time()), "channel": "spot.order_book_update",
+                 "event": "subscribe", "payload": [s, "100ms"]} for s in venue_symbols]
+
+    def unsubscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"time": int(time.time()), "channel": "spot.order_book_update",
+                 "event": "unsubscribe", "payload": [s, "100ms"]} for s in venue_symbols]
+
+    def _on_open(self, ws):
+        self._pending.clear()
+        super()._on_open(ws)
+
+    def on_resync(self, venue_symbol: str):
+        self._pending[venue_symbol] = []
+        threading.Thread(target=self._load_snapshot, args=(venue_symbol,), daemon=True).start()
+
+    def handle_message(self, message):
+        if message.get('channel') != 'spot.order_book_update' or message.get('event') != 'update':
+            return
+        update = message.get('result') or {}
+        symbol = update.get('s')
+        if not self._watched(symbol):
+            return
+        book = self._book(symbol)
+        if not book.synced:
+            pending = self._pending.get(symbol)
+            if pending is None:
+                # First update for this symbol: fetch the snapshot to anchor it
+                self._resync(symbol, 'initial snapshot')
+                pending = self._pending[symbol]
+            if len(pending) < self.MAX_BUFFERED:
+                pending.append(update)
+            return
+        self._apply(symbol, book, update)
+
+    def _apply(self, symbol, book, update) -> bool:
+        first, last = update.get('U'), update.get('u')
+        if last <= book.seq:
+            return True
+        if first > book.seq + 1:
+            self._resync(symbol, f"gap {book.seq} -> {first}")
+            return False
+        book.update(update.get('b', []), update.get('a', []), seq=last)
+        return True
+
+    def _load_snapshot(self, symbol: str):
+        try:
+            response = self.adapter._get(
+                f"{self.adapter.BASE_URL}/spot/order_book",
+                kind='depth',
+                params={"currency_pair": symbol, "limit": self.SNAPSHOT_DEPTH, "with_id": "true"},
+                timeout=10
+            )
+            response.raise_for_status()
+            snapshot = response.json()
+            if snapshot.get('id') is None:
+                raise Exception("snapshot has no update id")
+        except Exception as e:
+            logger.warning(f"Gate.io stream snapshot {symbol} failed: {e}")
+            # Keep buffering for a while, then let the next update retry
+            time.sleep(5)
+            with self._lock:
+                self._pending.pop(symbol, None)
+            return
+        with self._lock:
+            book = self._book(symbol)
+            book.reset(snapshot.get('bids', []), snapshot.get('asks', []), seq=snapshot.get('id'))
+            for update in self._pending.pop(symbol, []):
+                if not self._apply(symbol, book, update):
+                    break
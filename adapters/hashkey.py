@@ -15,7 +15,7 @@ class HashKeyAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/quote/v1/ticker/24hr",
                 timeout=30
             )
@@ -67,8 +67,9 @@ class HashKeyAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/quote/v1/depth",
+                kind='depth',
                 params={"symbol": api_symbol, "limit": min(limit, 100)},
                 timeout=30
             )
@@ -0,0 +1,25 @@
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# exchange name -> keep-alive session shared by every adapter instance and thread
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(exchange: str, pool_size: int) -> requests.Session:
+    """Return the process-wide pooled session for an exchange, creating it once."""
+    session = _SESSIONS.get(exchange)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(exchange)
+        if session is None:
+            session = requests.Session()
+            pool = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', pool)
+            session.mount('http://', pool)
+            _SESSIONS[exchange] = session
+    return session
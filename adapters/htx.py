@@ -18,7 +18,7 @@ class HTXAdapter(BaseAdapter):
 
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/market/tickers",
                 headers={"User-Agent": "Mozilla/5.0"},
                 timeout=30
@@ -77,8 +77,9 @@ class HTXAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').lower()
             htx_symbol = f"{base}usdt"
 
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/market/depth",
+                kind='depth',
                 params={"symbol": htx_symbol, "type": "step0", "depth": limit},
                 headers={"User-Agent": "Mozilla/5.0"},
                 timeout=10
@@ -1,7 +1,12 @@
+import heapq
 import requests
 import logging
-from typing import List, Dict
+import time
+import zlib
+from typing import List, Dict, Optional
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .metadata import MetadataCache
+from .streaming import L2Book, StreamingAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -18,29 +23,45 @@ BASE_RENAME = {
     'XXMR': 'XMR',
 }
 
-DISPLAY_TO_KRAKEN = {
-    'BTC': 'XBT',
-    'DOGE': 'XDG',
-    'ETH': 'ETH',
-    'XRP': 'XRP',
-    'LTC': 'LTC',
-    'XLM': 'XLM',
-    'ZEC': 'ZEC',
-    'XMR': 'XMR',
-}
-
 BATCH_SIZE = 100
 
+# Kraken throttles with HTTP 200 and one of these in the body's `error` list
+RATE_LIMIT_ERRORS = ('EAPI:Rate limit exceeded', 'EGeneral:Too many requests')
+
 
 class KrakenAdapter(BaseAdapter):
     BASE_URL = "https://api.kraken.com/0/public"
+    # Kraken's public REST endpoints allow roughly one call per second
+    RATE_LIMIT = 1.0
+    RATE_BURST = 5.0
+    # The instrument list changes only on listings/delistings
+    CATALOG_TTL = 3600
 
     @property
     def exchange_name(self) -> str:
         return "KRAKEN"
 
-    def _get_all_pairs(self) -> Dict[str, dict]:
-        response = requests.get(f"{self.BASE_URL}/AssetPairs", timeout=30)
+    def _rate_limited(self, response) -> bool:
+        if super()._rate_limited(response):
+            return True
+        # Cheap byte scan first so normal responses are not parsed twice
+        if not any(e.encode() in response.content for e in RATE_LIMIT_ERRORS):
+            return False
+        try:
+            errors = response.json().get('error') or []
+        except (ValueError, AttributeError):
+            return False
+        return any(e in errors for e in RATE_LIMIT_ERRORS)
+
+    def _load_catalog(self) -> dict:
+        """Download /AssetPairs and index the USDT/USD instruments.
+
+        Returns {'pairs': {pair_key: info}} with one pair per base (USDT
+        preferred over USD), 'symbols': {display_symbol: pair_key} for the
+        same selection, and 'ws': {wsname: display_symbol} over every
+        USDT/USD pair for the websocket monitor.
+        """
+        response = self._get(f"{self.BASE_URL}/AssetPairs", timeout=30)
         response.raise_for_status()
         data = response.json()
         if data.get('error'):
@@ -49,6 +70,7 @@ class KrakenAdapter(BaseAdapter):
         usdt_bases = set()
         usdt_pairs = {}
         usd_pairs = {}
+        ws = {}
 
         for pair_key, info in data.get('result', {}).items():
             quote = info.get('quote', '')
@@ -61,19 +83,33 @@ class KrakenAdapter(BaseAdapter):
                 usdt_pairs[pair_key] = {'base': base, 'wsname': wsname, 'quote_type': 'USDT'}
             elif quote in ('ZUSD', 'USD'):
                 usd_pairs[pair_key] = {'base': base, 'wsname': wsname, 'quote_type': 'USD'}
+            else:
+                continue
+
+            if '/' in wsname:
+                ws[wsname] = f"{base}/USDT"
 
         combined = dict(usdt_pairs)
         for pair_key, info in usd_pairs.items():
             if info['base'] not in usdt_bases:
                 combined[pair_key] = info
 
-        return combined
+        symbols = {f"{info['base']}/USDT": pair_key for pair_key, info in combined.items()}
+        return {'pairs': combined, 'symbols': symbols, 'ws': ws}
+
+    def catalog(self) -> dict:
+        """Shared AssetPairs index (see _load_catalog), refreshed in the background."""
+        return _CATALOG.get()
+
+    def ws_symbols(self) -> Dict[str, str]:
+        """Kraken websocket pair name -> display symbol (e.g. 'XBT/USD' -> 'BTC/USDT')."""
+        return self.catalog()['ws']
 
     def _fetch_tickers_batch(self, pair_keys: List[str]) -> dict:
         results = {}
         for i in range(0, len(pair_keys), BATCH_SIZE):
             batch = pair_keys[i:i + BATCH_SIZE]
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/Ticker",
                 params={'pair': ','.join(batch)},
                 timeout=30,
@@ -88,7 +124,7 @@ class KrakenAdapter(BaseAdapter):
 
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            pairs = self._get_all_pairs()
+            pairs = self.catalog()['pairs']
             if not pairs:
                 return []
 
@@ -135,21 +171,21 @@ class KrakenAdapter(BaseAdapter):
 
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
-            base = symbol.replace('/USDT', '')
-            kraken_base = DISPLAY_TO_KRAKEN.get(base, base)
-
-            data = None
-            for quote in ('USDT', 'USD'):
-                pair_key = f"{kraken_base}{quote}"
-                response = requests.get(
-                    f"{self.BASE_URL}/Depth",
-                    params={'pair': pair_key, 'count': limit},
-                    timeout=10,
-                )
-                response.raise_for_status()
-                data = response.json()
-                if not (data.get('error') and data['error']):
-                    break
+            pair_key = self.catalog()['symbols'].get(symbol)
+            if not pair_key:
+                _CATALOG.refresh_async(force=True)
+                raise Exception(f"Kraken pair not found: {symbol}")
+
+            response = self._get(
+                f"{self.BASE_URL}/Depth",
+                kind='depth',
+                params={'pair': pair_key, 'count': limit},
+                timeout=10,
+            )
+            response.raise_for_status()
+            data = response.json()
+            if data.get('error'):
+                raise Exception(f"Kraken Depth error: {data['error']}")
 
             result = data.get('result', {})
             book = list(result.values())[0] if result else {}
@@ -178,3 +214,167 @@ class KrakenAdapter(BaseAdapter):
         except requests.RequestException as e:
             logger.error(f"KRAKEN orderbook error: {str(e)}")
             raise Exception(f"Failed to fetch KRAKEN orderbook: {str(e)}")
+
+
+# One AssetPairs catalog per process, shared by the adapter and the monitor
+_CATALOG = MetadataCache(
+    'kraken_asset_pairs',
+    lambda: KrakenAdapter()._load_catalog(),
+    ttl=KrakenAdapter.CATALOG_TTL,
+    min_refresh_interval=300,
+)
+
+
+class KrakenBook(L2Book):
+    """L2Book that also keeps Kraken's price/volume strings, which its checksum is computed over."""
+
+    __slots__ = ('raw_bids', 'raw_asks')
+
+    CHECKSUM_DEPTH = 10
+
+    def __init__(self):
+        super().__init__()
+        self.raw_bids: Dict[float, tuple] = {}
+        self.raw_asks: Dict[float, tuple] = {}
+
+    def reset(self, bids, asks, seq=None):
+        self.raw_bids = {}
+        self.raw_asks = {}
+        super().reset(bids, asks, seq)
+
+    def update(self, bids, asks, seq=None):
+        for raw, levels in ((self.raw_bids, bids), (self.raw_asks, asks)):
+            for level in levels:
+                if float(level[1]):
+                    raw[float(level[0])] = (level[0], level[1])
+                else:
+                    raw.pop(float(level[0]), None)
+        super().update(bids, asks, seq)
+
+    def truncate(self, depth: int):
+        super().truncate(depth)
+        if len(self.raw_bids) > len(self.bids):
+            self.raw_bids = {p: self.raw_bids[p] for p in self.bids}
+        if len(self.raw_asks) > len(self.asks):
+            self.raw_asks = {p: self.raw_asks[p] for p in self.asks}
+
+    def checksum(self) -> int:
+        """CRC32 of the top 10 asks then top 10 bids, each price and volume without '.' and leading zeros."""
+        parts = []
+        for raw, prices in ((self.raw_asks, heapq.nsmallest(self.CHECKSUM_DEPTH, self.asks)),
+                            (self.raw_bids, heapq.nlargest(self.CHECKSUM_DEPTH, self.bids))):
+            for price in prices:
+                for value in raw[price]:
+                    parts.append(value.replace('.', '').lstrip('0'))
+        return zlib.crc32(''.join(parts).encode())
+
+
+class KrakenStream(StreamingAdapter):
+    """Kraken v1 `book` channel: snapshot then diffs, truncated to BOOK_DEPTH.
+
+    The v1 feed has no sequence numbers; instead each update carries a CRC32
+    (`c`) of the top 10 levels. After every update the local book is checked
+    against it, and on a mismatch it is marked unsynced and the pair is
+    re-subscribed for a fresh snapshot.
+    """
+
+    URL = "wss://ws.kraken.com"
+    BOOK_DEPTH = 25
+    BOOK_CLASS = KrakenBook
+
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        catalog = _CATALOG.get()
+        pair_key = catalog['symbols'].get(symbol)
+        return catalog['pairs'][pair_key]['wsname'] if pair_key else None
+
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"event": "subscribe", "pair": venue_symbols,
+                 "subscription": {"name": "book", "depth": self.BOOK_DEPTH}}]
+
+    def unsubscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"event": "unsubscribe", "pair": venue_symbols,
+                 "subscription": {"name": "book", "depth": self.BOOK_DEPTH}}]
+
+    def on_resync(self, venue_symbol: str):
+        self._send(self.unsubscribe_messages([venue_symbol]) + self.subscribe_messages([venue_symbol]))
+
+    def handle_message(self, message):
+        if isinstance(message, dict):
+            if message.get('event') == 'subscriptionStatus' and message.get('status') == 'error':
+                logger.warning(f"KRAKEN stream subscription error: {message.get('errorMessage')}")
+            return
+        # [channelID, payload, (payload,) channelName, pair]
+        pair = message[-1]
+        if not self._watched(pair):
+            return
+        book = self._book(pair)
+        checksum = None
+        for payload in message[1:-2]:
+            if 'as' in payload or 'bs' in payload:
+                book.reset(payload.get('bs', []), payload.get('as', []))
+            elif book.synced:
+                book.update(payload.get('b', []), payload.get('a', []))
+                checksum = payload.get('c', checksum)
+        book.truncate(self.BOOK_DEPTH)
+        if checksum is not None and book.synced and book.checksum() != int(checksum):
+            self._resync(pair, f"checksum {book.checksum()} != {checksum}")
+
+
+class KrakenTickerStream(StreamingAdapter):
+    """Kraken v1 `ticker` channel for every display symbol in the catalog.
+
+    Keeps the latest best bid/ask per display symbol and hands each change
+    to `on_ticker(symbol, tick)`; used by the server-side live monitor.
+    """
+
+    URL = "wss://ws.kraken.com"
+    SYMBOL_TTL = float('inf')
+    MAX_SYMBOLS = 10 ** 6
+    SUBSCRIBE_BATCH = 50
+
+    def __init__(self, adapter, on_ticker=None):
+        super().__init__(adapter)
+        self.on_ticker = on_ticker
+        self.tickers: Dict[str, dict] = {}
+
+    def start(self):
+        """Subscribe the catalog's pair for every display symbol (connects on the first call)."""
+        for info in self.adapter.catalog()['pairs'].values():
+            if '/' in info['wsname']:
+                self._watch(info['wsname'], f"{info['base']}/USDT")
+
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        return None
+
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"event": "subscribe", "pair": venue_symbols[i:i + self.SUBSCRIBE_BATCH],
+                 "subscription": {"name": "ticker"}}
+                for i in range(0, len(venue_symbols), self.SUBSCRIBE_BATCH)]
+
+    def handle_message(self, message):
+        if not isinstance(message, list) or message[-2] != 'ticker':
+            return
+        wsname = message[-1]
+        symbol = self._display.get(wsname)
+        payload = message[1]
+        if not symbol:
+            return
+        bid = self.adapter._safe_float(payload.get('b', [0])[0])
+        ask = self.adapter._safe_float(payload.get('a', [0])[0])
+        if not bid or not ask:
+            return
+        prev = self.tickers.get(symbol)
+        if prev and prev['bid'] == bid and prev['ask'] == ask:
+            return
+        tick = {
+            'bid': bid,
+            'ask': ask,
+            'bid_qty': self.adapter._safe_float(payload.get('b', [0, 0, 0])[2]),
+            'ask_qty': self.adapter._safe_float(payload.get('a', [0, 0, 0])[2]),
+            'last': self.adapter._safe_float(payload.get('c', [0])[0]),
+            'ws_symbol': wsname,
+            'ts': time.time(),
+        }
+        self.tickers[symbol] = tick
+        if self.on_ticker:
+            self.on_ticker(symbol, tick)
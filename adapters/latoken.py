@@ -2,59 +2,47 @@ import requests
 import logging
 from typing import List
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .metadata import MetadataCache
 
 logger = logging.getLogger(__name__)
 
 
 class LatokenAdapter(BaseAdapter):
     BASE_URL = "https://api.latoken.com/v2"
-    
-    def __init__(self):
-        super().__init__()
-        self._currencies = {}
-        self._pairs = {}
+    # Currency ids rarely change; refreshed in the background once stale
+    METADATA_TTL = 6 * 3600
     
     @property
     def exchange_name(self) -> str:
         return "LATOKEN"
     
-    def _load_currencies(self):
-        if not self._currencies:
-            response = requests.get(f"{self.BASE_URL}/currency", timeout=30)
-            response.raise_for_status()
-            for curr in response.json():
-                self._currencies[curr.get('id')] = curr.get('tag', '')
-    
-    def _load_pairs(self):
-        if not self._pairs:
-            response = requests.get(f"{self.BASE_URL}/pair", timeout=30)
-            response.raise_for_status()
-            for pair in response.json():
-                self._pairs[pair.get('id')] = {
-                    'baseCurrency': pair.get('baseCurrency'),
-                    'quoteCurrency': pair.get('quoteCurrency'),
-                    'symbol': pair.get('symbol', '')
-                }
+    def _load_currencies(self) -> dict:
+        """Download the currency list as {'tags': {id: tag}, 'ids': {tag: id}}."""
+        response = self._get(f"{self.BASE_URL}/currency", timeout=30)
+        response.raise_for_status()
+        tags = {}
+        ids = {}
+        for curr in response.json():
+            curr_id, tag = curr.get('id'), curr.get('tag', '')
+            if curr_id:
+                tags[curr_id] = tag
+                ids.setdefault(tag, curr_id)
+        return {'tags': tags, 'ids': ids}
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            self._load_currencies()
-            self._load_pairs()
+            currencies = _CURRENCIES.get()
+            usdt_id = currencies['ids'].get('USDT')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/ticker",
                 timeout=30
             )
             response.raise_for_status()
             data = response.json()
             
-            usdt_id = None
-            for curr_id, symbol in self._currencies.items():
-                if symbol == 'USDT':
-                    usdt_id = curr_id
-                    break
-            
             tickers = []
+            unknown = 0
             
             for item in data:
                 quote_currency = item.get('quoteCurrency', '')
@@ -62,9 +50,11 @@ class LatokenAdapter(BaseAdapter):
                     continue
                 
                 base_currency_id = item.get('baseCurrency', '')
-                base = self._currencies.get(base_currency_id, '')
+                base = currencies['tags'].get(base_currency_id, '')
                 
                 if not base:
+                    if base_currency_id not in currencies['tags']:
+                        unknown += 1
                     continue
                 
                 price = self._safe_float(item.get('lastPrice'))
@@ -88,6 +78,10 @@ class LatokenAdapter(BaseAdapter):
                 )
                 tickers.append(normalized)
             
+            if unknown:
+                # Newly listed currencies: pick them up on the next refresh
+                _CURRENCIES.refresh_async(force=True)
+            
             logger.info(f"LATOKEN: Fetched {len(tickers)} USDT pairs")
             return tickers
             
@@ -97,23 +91,19 @@ class LatokenAdapter(BaseAdapter):
     
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
-            self._load_currencies()
-            
             base = symbol.replace('/USDT', '').replace('/', '')
             
-            base_id = None
-            usdt_id = None
-            for curr_id, curr_symbol in self._currencies.items():
-                if curr_symbol == base:
-                    base_id = curr_id
-                if curr_symbol == 'USDT':
-                    usdt_id = curr_id
+            currency_ids = _CURRENCIES.get()['ids']
+            base_id = currency_ids.get(base)
+            usdt_id = currency_ids.get('USDT')
             
             if not base_id or not usdt_id:
+                _CURRENCIES.refresh_async(force=True)
                 raise Exception(f"Currency not found: {base}")
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/book/{base_id}/{usdt_id}",
+                kind='depth',
                 params={"limit": limit},
                 timeout=10
             )
@@ -144,3 +134,12 @@ class LatokenAdapter(BaseAdapter):
         except requests.RequestException as e:
             logger.error(f"LATOKEN orderbook error: {str(e)}")
             raise Exception(f"Failed to fetch LATOKEN orderbook: {str(e)}")
+
+
+# Shared by every LatokenAdapter instance (and persisted across restarts)
+_CURRENCIES = MetadataCache(
+    'latoken_currencies',
+    lambda: LatokenAdapter()._load_currencies(),
+    ttl=LatokenAdapter.METADATA_TTL,
+    min_refresh_interval=600,
+)
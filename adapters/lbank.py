@@ -15,7 +15,7 @@ class LBankAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/v1/ticker.do",
                 params={"symbol": "all"},
                 timeout=30
@@ -61,8 +61,9 @@ class LBankAdapter(BaseAdapter):
         try:
             api_symbol = symbol.lower().replace('/', '_')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/v1/depth.do",
+                kind='depth',
                 params={"symbol": api_symbol, "size": min(limit, 60)},
                 timeout=30
             )
@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Snapshots survive restarts here so a cold process does not re-download catalogs
+CACHE_DIR = os.environ.get('ADAPTER_CACHE_DIR', '/tmp/arbit-cache')
+
+
+class MetadataCache:
+    """Process-wide TTL cache for slowly changing exchange metadata.
+
+    The first get() loads synchronously (from the disk snapshot if there is
+    one, otherwise via `loader`). After `ttl` seconds the stale value keeps
+    being served while a background thread reloads it, so callers on the hot
+    path never wait for a catalog download once the cache is warm. The
+    snapshot is shared by every process on the host: a refresh first adopts
+    a newer snapshot written by another worker before going to the network.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any], ttl: float,
+                 min_refresh_interval: float = 60, persist: bool = True):
+        self.name = name
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._loader = loader
+        self._persist = persist
+        self._data = None
+        self._ts = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def path(self) -> str:
+        return os.path.join(CACHE_DIR, f'{self.name}.json')
+
+    @property
+    def age(self) -> float:
+        return time.time() - self._ts if self._ts else float('inf')
+
+    def get(self) -> Any:
+        if self._data is None:
+            with self._lock:
+                if self._data is None and not self._read_snapshot():
+                    self._store(self._loader())
+        if self.age > self.ttl:
+            self.refresh_async()
+        return self._data
+
+    def refresh(self) -> Any:
+        """Reload synchronously and return the new value."""
+        data = self._loader()
+        with self._lock:
+            self._store(data)
+        return data
+
+    def put(self, data):
+        """Store a value obtained elsewhere (e.g. as a by-product of a ticker fetch)."""
+        with self._lock:
+            self._store(data)
+
+    def adopt_snapshot(self) -> bool:
+        """Take a newer snapshot written by another process, if there is one."""
+        with self._lock:
+            return self._read_snapshot(newer_than=self._ts)
+
+    def refresh_async(self, force: bool = False):
+        """Reload in a background thread unless one is running or ran very recently.
+
+        `force` skips the TTL check (e.g. when a caller saw an unknown id) but
+        still honours min_refresh_interval.
+        """
+        max_age = self.min_refresh_interval if force else self.ttl
+        if self.age < max_age:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, args=(max_age,),
+                         name=f'meta-{self.name}', daemon=True).start()
+
+    def _background_refresh(self, max_age: float):
+        try:
+            with self._lock:
+                ts = self._ts
+                if self._read_snapshot(newer_than=ts) and self.age < max_age:
+                    return
+            self.refresh()
+        except Exception as e:
+            logger.warning(f'{self.name}: metadata refresh failed: {e}')
+        finally:
+            self._refreshing = False
+
+    def _store(self, data):
+        self._data = data
+        self._ts = time.time()
+        if self._persist:
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp = f'{self.path}.{os.getpid()}.tmp'
+                with open(tmp, 'w') as f:
+                    json.dump({'ts': self._ts, 'data': data}, f)
+                os.replace(tmp, self.path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f'{self.name}: could not persist metadata: {e}')
+
+    def _read_snapshot(self, newer_than: float = 0) -> bool:
+        if not self._persist:
+            return False
+        try:
+            if newer_than and os.path.getmtime(self.path) <= newer_than:
+                return False
+            with open(self.path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return False
+        data: Optional[Any] = snapshot.get('data')
+        if data is None or float(snapshot.get('ts') or 0) <= newer_than:
+            return False
+        self._data = data
+        self._ts = float(snapshot.get('ts') or 0)
+        return True
@@ -15,7 +15,7 @@ class MEXCAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/api/v3/ticker/24hr",
                 timeout=30
             )
@@ -59,8 +59,9 @@ class MEXCAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/api/v3/depth",
+                kind='depth',
                 params={"symbol": api_symbol, "limit": min(limit, 100)},
                 timeout=30
             )
@@ -15,7 +15,7 @@ class NizaAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/tickers",
                 timeout=30
             )
@@ -61,8 +61,9 @@ class NizaAdapter(BaseAdapter):
     
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/orderbook",
+                kind='depth',
                 params={
                     "ticker_id": symbol,
                     "depth": 100
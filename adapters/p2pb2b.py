@@ -15,7 +15,7 @@ class P2PB2BAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/tickers",
                 timeout=30
             )
@@ -72,8 +72,9 @@ class P2PB2BAdapter(BaseAdapter):
             bids = []
             
             for side in ['sell', 'buy']:
-                response = requests.get(
+                response = self._get(
                     f"{self.BASE_URL}/book",
+                    kind='depth',
                     params={
                         "market": api_symbol,
                         "side": side,
@@ -1,7 +1,8 @@
 import requests
 import logging
-from typing import List
+from typing import List, Optional
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
+from .streaming import StreamingAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ class PoloniexAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/markets/ticker24h",
                 timeout=30
             )
@@ -64,8 +65,9 @@ class PoloniexAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').replace('/', '')
             api_symbol = f"{base}_USDT"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/markets/{api_symbol}/orderBook",
+                kind='depth',
                 params={"limit": limit},
                 timeout=10
             )
@@ -98,3 +100,47 @@ class PoloniexAdapter(BaseAdapter):
         except requests.RequestException as e:
             logger.error(f"Poloniex orderbook error: {str(e)}")
             raise Exception(f"Failed to fetch Poloniex orderbook: {str(e)}")
+
+
+class PoloniexStream(StreamingAdapter):
+    """Poloniex v3 `book_lv2` channel: snapshot then diffs chained by id.
+
+    Every update carries the id of the previous one (lastId); a mismatch
+    means a message was lost and the symbol is re-subscribed for a fresh
+    snapshot.
+    """
+
+    URL = "wss://ws.poloniex.com/ws/public"
+
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        base = symbol.replace('/USDT', '').replace('/', '')
+        return f"{base}_USDT"
+
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"event": "subscribe", "channel": ["book_lv2"], "symbols": venue_symbols}]
+
+    def unsubscribe_messages(self, venue_symbols: List[str]) -> List[dict]:
+        return [{"event": "unsubscribe", "channel": ["book_lv2"], "symbols": venue_symbols}]
+
+    def keepalive_message(self) -> dict:
+        return {"event": "ping"}
+
+    def on_resync(self, venue_symbol: str):
+        self._send(self.unsubscribe_messages([venue_symbol]) + self.subscribe_messages([venue_symbol]))
+
+    def handle_message(self, message):
+        if message.get('channel') != 'book_lv2':
+            return
+        action = message.get('action')
+        for item in message.get('data', []):
+            symbol = item.get('symbol')
+            if not self._watched(symbol):
+                continue
+            book = self._book(symbol)
+            if action == 'snapshot':
+                book.reset(item.get('bids', []), item.get('asks', []), seq=item.get('id'))
+            elif book.synced:
+                if item.get('lastId') != book.seq:
+                    self._resync(symbol, f"gap {book.seq} -> {item.get('lastId')}")
+                    continue
+                book.update(item.get('bids', []), item.get('asks', []), seq=item.get('id'))
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+# Headers venues use to report the remaining quota and when it resets
+REMAINING_HEADERS = (
+    'X-RateLimit-Remaining', 'RateLimit-Remaining', 'X-Gate-RateLimit-Requests-Remain',
+)
+RESET_HEADERS = (
+    'X-RateLimit-Reset', 'RateLimit-Reset', 'X-Gate-RateLimit-Reset-Timestamp',
+)
+# Longest pause a reset header can impose; larger values are treated as bogus
+MAX_RESET_DELAY = 300.0
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every caller hitting one exchange."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 0.001)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, weight: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until `weight` tokens are available; False if `timeout` runs out first."""
+        weight = min(weight, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= weight:
+                        self._tokens -= weight
+                        return True
+                    wait = (weight - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """Stop handing out tokens for `seconds` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+    def observe(self, headers: Mapping[str, str]):
+        """Pause until the venue's reset time once it reports an exhausted quota."""
+        remaining = _first_header(headers, REMAINING_HEADERS)
+        if remaining is None or remaining > 0:
+            return
+        reset = _first_header(headers, RESET_HEADERS)
+        if reset is not None:
+            self.block_for(_reset_delay(reset))
+
+
+def _first_header(headers: Mapping[str, str], names) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def _reset_delay(value: float) -> float:
+    """Reset headers are either epoch seconds/milliseconds or a delay in seconds.
+
+    The delay is capped at MAX_RESET_DELAY so one malformed header cannot
+    stall an exchange for hours.
+    """
+    if value > 1e12:
+        delay = value / 1000 - time.time()
+    elif value > 1e9:
+        delay = value - time.time()
+    else:
+        delay = value
+    return _capped(delay, f"Rate limit reset {value!r}")
+
+
+def _capped(delay: float, source: str) -> float:
+    """Clamp a pause to [0, MAX_RESET_DELAY], warning when a header asked for more."""
+    if not delay <= MAX_RESET_DELAY:
+        logger.warning(f"{source} implies a {delay:.0f}s pause, capping at {MAX_RESET_DELAY:.0f}s")
+        return MAX_RESET_DELAY
+    return max(0.0, delay)
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Parse a Retry-After header (delay seconds or HTTP date) into seconds, capped at MAX_RESET_DELAY."""
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return _capped(delay, f"Retry-After {value!r}")
+
+
+_LIMITERS: Dict[str, TokenBucket] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(exchange: str, rate: float, capacity: float) -> TokenBucket:
+    """Return the process-wide token bucket for an exchange, creating it once."""
+    limiter = _LIMITERS.get(exchange)
+    if limiter is not None:
+        return limiter
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(exchange)
+        if limiter is None:
+            limiter = TokenBucket(rate, capacity)
+            _LIMITERS[exchange] = limiter
+    return limiter
@@ -0,0 +1,265 @@
+import heapq
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+import websocket
+
+from .base import BaseAdapter, NormalizedOrderbook
+
+logger = logging.getLogger(__name__)
+
+
+class L2Book:
+    """Local price-level book kept up to date from a snapshot + diff stream."""
+
+    __slots__ = ('bids', 'asks', 'seq', 'updated_at', 'synced')
+
+    def __init__(self):
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.seq = None
+        self.updated_at = 0.0
+        self.synced = False
+
+    def reset(self, bids: Iterable, asks: Iterable, seq=None):
+        self.bids = {}
+        self.asks = {}
+        self.update(bids, asks, seq)
+        self.synced = True
+
+    def update(self, bids: Iterable, asks: Iterable, seq=None):
+        """Apply [price, size] levels; a zero size removes the level."""
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            for level in levels:
+                price, size = float(level[0]), float(level[1])
+                if size:
+                    side[price] = size
+                else:
+                    side.pop(price, None)
+        if seq is not None:
+            self.seq = seq
+        self.updated_at = time.time()
+
+    def truncate(self, depth: int):
+        """Drop levels beyond `depth` (venues that only stream the top N)."""
+        if len(self.bids) > depth:
+            self.bids = {p: self.bids[p] for p in heapq.nlargest(depth, self.bids)}
+        if len(self.asks) > depth:
+            self.asks = {p: self.asks[p] for p in heapq.nsmallest(depth, self.asks)}
+
+    def top(self, limit: int):
+        bids = [[p, self.bids[p]] for p in heapq.nlargest(limit, self.bids)]
+        asks = [[p, self.asks[p]] for p in heapq.nsmallest(limit, self.asks)]
+        return bids, asks
+
+
+class StreamingAdapter(ABC):
+    """Public WebSocket depth feed for one exchange, maintaining local L2 books.
+
+    Symbols are subscribed on demand through orderbook(); the first call for
+    a symbol returns None (callers fall back to REST) and later calls are
+    served from memory. Subclasses implement the venue protocol: symbol
+    mapping, subscribe messages and message handling, calling _resync() when
+    they detect a sequence gap. The connection reconnects with exponential
+    backoff and re-subscribes every watched symbol on open.
+    """
+
+    URL = ''
+    PING_INTERVAL = 20
+    MAX_BACKOFF = 30
+    # Symbols not read for SYMBOL_TTL seconds are dropped on reconnect;
+    # at most MAX_SYMBOLS are watched per exchange (least recently read go first).
+    SYMBOL_TTL = 1800
+    MAX_SYMBOLS = 100
+    BOOK_DEPTH = 50
+    BOOK_CLASS = L2Book
+
+    def __init__(self, adapter: BaseAdapter):
+        self.adapter = adapter
+        self._books: Dict[str, L2Book] = {}      # venue symbol -> book
+        self._symbols: Dict[str, float] = {}     # venue symbol -> last read
+        self._display: Dict[str, str] = {}       # venue symbol -> display symbol
+        self._lock = threading.RLock()
+        self._ws = None
+        self._connected = False
+        self._last_message = 0.0
+        self._thread = None
+        self.stats = {'messages': 0, 'resyncs': 0, 'reconnects': 0, 'last_error': None}
+
+    @property
+    def exchange_name(self) -> str:
+        return self.adapter.exchange_name
+
+    # ── venue protocol ────────────────────────────────────────────────────
+
+    @abstractmethod
+    def venue_symbol(self, symbol: str) -> Optional[str]:
+        """Map a display symbol ('BTC/USDT') to the venue's stream symbol."""
+
+    @abstractmethod
+    def subscribe_messages(self, venue_symbols: List[str]) -> List[Any]:
+        """Messages that subscribe the given symbols' depth channels."""
+
+    @abstractmethod
+    def handle_message(self, message: Any):
+        """Apply one decoded message to the books."""
+
+    def unsubscribe_messages(self, venue_symbols: List[str]) -> List[Any]:
+        """Messages that drop the given symbols' subscriptions (optional)."""
+        return []
+
+    def keepalive_message(self) -> Optional[Any]:
+        """Application-level ping sent every PING_INTERVAL, for venues that need one."""
+        return None
+
+    def decode(self, raw) -> Any:
+        return json.loads(raw)
+
+    def on_resync(self, venue_symbol: str):
+        """Rebuild one book after a gap; the default reconnects, which re-snapshots every book."""
+        ws = self._ws
+        if ws is not None:
+            ws.close()
+
+    # ── reads ─────────────────────────────────────────────────────────────
+
+    def orderbook(self, symbol: str, limit: int = 20, max_age: float = 30.0) -> Optional[NormalizedOrderbook]:
+        """Top `limit` levels from the local book, or None if it is not usable.
+
+        Diff streams are silent while a book does not change, so freshness is
+        judged by the connection: it must be up and have delivered a message
+        within `max_age` seconds, and the book must be synced.
+        """
+        venue_symbol = self.venue_symbol(symbol)
+        if not venue_symbol:
+            return None
+        self._watch(venue_symbol, symbol)
+        with self._lock:
+            book = self._books.get(venue_symbol)
+            if (book is None or not book.synced or not self._connected
+                    or time.time() - self._last_message > max_age):
+                return None
+            bids, asks = book.top(limit)
+        return NormalizedOrderbook(exchange=self.exchange_name, symbol=symbol,
+                                   asks=asks, bids=bids, timestamp=int(book.updated_at * 1000))
+
+    def status(self) -> dict:
+        now = time.time()
+        with self._lock:
+            synced = sum(1 for b in self._books.values() if b.synced)
+        return dict(self.stats, connected=self._connected, symbols=len(self._symbols), books=synced,
+                    last_message_age=round(now - self._last_message, 1) if self._last_message else None)
+
+    # ── helpers for subclasses ────────────────────────────────────────────
+
+    def _watched(self, venue_symbol: str) -> bool:
+        return venue_symbol in self._symbols
+
+    def _book(self, venue_symbol: str) -> L2Book:
+        book = self._books.get(venue_symbol)
+        if book is None:
+            book = self._books[venue_symbol] = self.BOOK_CLASS()
+        return book
+
+    def _resync(self, venue_symbol: str, reason: str):
+        logger.warning(f"{self.exchange_name} stream: resync {venue_symbol} ({reason})")
+        self.stats['resyncs'] += 1
+        with self._lock:
+            # Unusable until a fresh snapshot arrives
+            self._book(venue_symbol).synced = False
+        self.on_resync(venue_symbol)
+
+    def _send(self, messages: List[Any]):
+        ws = self._ws if self._connected else None
+        if ws is None:
+            return
+        for message in messages:
+            try:
+                ws.send(message if isinstance(message, str) else json.dumps(message))
+            except Exception as e:
+                logger.warning(f"{self.exchange_name} stream send failed: {e}")
+                return
+
+    # ── connection ────────────────────────────────────────────────────────
+
+    def _watch(self, venue_symbol: str, symbol: str):
+        with self._lock:
+            is_new = venue_symbol not in self._symbols
+            self._symbols[venue_symbol] = time.time()
+            self._display[venue_symbol] = symbol
+            evicted = None
+            if is_new and len(self._symbols) > self.MAX_SYMBOLS:
+                evicted = min(self._symbols, key=self._symbols.get)
+                self._symbols.pop(evicted)
+                self._books.pop(evicted, None)
+                self._display.pop(evicted, None)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name=f'stream-{self.exchange_name.lower()}')
+                self._thread.start()
+                if self.keepalive_message() is not None:
+                    threading.Thread(target=self._keepalive, daemon=True,
+                                     name=f'stream-{self.exchange_name.lower()}-ping').start()
+        if evicted:
+            self._send(self.unsubscribe_messages([evicted]))
+        if is_new:
+            self._send(self.subscribe_messages([venue_symbol]))
+
+    def _on_open(self, ws):
+        cutoff = time.time() - self.SYMBOL_TTL
+        with self._lock:
+            self._connected = True
+            self._symbols = {s: ts for s, ts in self._symbols.items() if ts >= cutoff}
+            self._display = {s: d for s, d in self._display.items() if s in self._symbols}
+            self._books = {}
+            symbols = list(self._symbols)
+        if symbols:
+            self._send(self.subscribe_messages(symbols))
+
+    def _on_message(self, ws, raw):
+        try:
+            message = self.decode(raw)
+        except Exception as e:
+            logger.debug(f"{self.exchange_name} stream decode error: {e}")
+            return
+        self.stats['messages'] += 1
+        self._last_message = time.time()
+        try:
+            with self._lock:
+                self.handle_message(message)
+        except Exception as e:
+            logger.warning(f"{self.exchange_name} stream message error: {e}")
+
+    def _on_error(self, ws, err):
+        logger.error(f"{self.exchange_name} stream error: {err}")
+        self.stats['last_error'] = str(err)
+
+    def _keepalive(self):
+        while True:
+            time.sleep(self.PING_INTERVAL)
+            self._send([self.keepalive_message()])
+
+    def _run(self):
+        backoff = 1
+        while True:
+            started = time.time()
+            ws = websocket.WebSocketApp(self.URL, on_open=self._on_open,
+                                        on_message=self._on_message, on_error=self._on_error)
+            self._ws = ws
+            try:
+                ws.run_forever(ping_interval=self.PING_INTERVAL, ping_timeout=self.PING_INTERVAL / 2)
+            except Exception as e:
+                self._on_error(ws, e)
+            with self._lock:
+                self._connected = False
+                self._ws = None
+            if time.time() - started > 60:
+                backoff = 1
+            self.stats['reconnects'] += 1
+            logger.info(f"{self.exchange_name} stream disconnected; reconnecting in {backoff}s")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF)
@@ -2,7 +2,8 @@ import json
 import gzip
 import logging
 import threading
-from typing import List
+import time
+from typing import Dict, List, Optional
 import websocket
 from .base import BaseAdapter, NormalizedTicker, NormalizedOrderbook
 
@@ -11,64 +12,216 @@ logger = logging.getLogger(__name__)
 WSS_URL = "wss://api.uzx.com/notification/ws"
 
 
-class UZXAdapter(BaseAdapter):
+class UZXStream:
+    """Process-wide UZX WebSocket connection.
 
-    @property
-    def exchange_name(self) -> str:
-        return "UZX"
+    Keeps `spot.overview` subscribed for the whole market and `spot.ticker`
+    for every symbol asked for in the last SYMBOL_TTL seconds, caching the
+    latest message per channel. Ticker frames are cached under the symbol
+    the client subscribed with, matched against whatever identifier the
+    frame echoes; frames that match no subscription are counted and logged.
+    The socket reconnects with exponential backoff and re-sends all
+    subscriptions on open.
+    """
 
-    def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
-        results = []
-        done = threading.Event()
-        error_holder = []
+    PING_INTERVAL = 20
+    MAX_BACKOFF = 30
+    SYMBOL_TTL = 1800
+    TICKER_RESEND_AGE = 15
+    UNMATCHED_LOG_INTERVAL = 60
 
-        def on_message(ws, msg):
-            try:
-                try:
-                    data = gzip.decompress(msg)
-                except Exception:
-                    data = msg if isinstance(msg, bytes) else msg.encode()
-                j = json.loads(data)
-                if j.get("code") == 200 and isinstance(j.get("data"), list) and len(j["data"]) > 1:
-                    results.extend(j["data"])
-                    done.set()
-                    ws.close()
-            except Exception as e:
-                logger.warning(f"UZX ws parse error: {e}")
+    def __init__(self, url: str = WSS_URL):
+        self.url = url
+        self._ws = None
+        self._connected = False
+        self._overview = None               # (items, received_at)
+        self._tickers: Dict[str, tuple] = {}  # 'BTC-USDT' -> (data, received_at)
+        self._symbols: Dict[str, float] = {}  # 'BTC-USDT' -> last requested
+        self._sub_keys: Dict[str, str] = {}   # 'BTCUSDT' -> 'BTC-USDT'
+        self.unmatched = 0
+        self._unmatched_logged = 0.0
+        self._cond = threading.Condition()
+        self._thread = None
+        self.last_error = None
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='uzx-ws', daemon=True)
+                self._thread.start()
+
+    # ── reads ─────────────────────────────────────────────────────────────
+
+    def overview(self, max_age: float, timeout: float) -> list:
+        """Latest spot.overview items, waiting up to `timeout` for a fresh one."""
+        self.start()
+        if not self._fresh(self._overview, max_age):
+            self._resend("spot.overview")
+        with self._cond:
+            self._cond.wait_for(lambda: self._fresh(self._overview, max_age), timeout)
+            if not self._fresh(self._overview, max_age):
+                reason = f": {self.last_error}" if self.last_error else ""
+                raise Exception(f"UZX: No ticker data received within timeout{reason}")
+            return self._overview[0]
+
+    def ticker(self, symbol: str, max_age: float, timeout: float) -> Optional[dict]:
+        """Latest spot.ticker payload for 'BTC-USDT', subscribing on first use."""
+        self.start()
+        self._subscribe_ticker(symbol)
+        with self._cond:
+            self._cond.wait_for(lambda: self._fresh(self._tickers.get(symbol), max_age), timeout)
+            entry = self._tickers.get(symbol)
+            return entry[0] if self._fresh(entry, max_age) else None
+
+    @staticmethod
+    def _fresh(entry, max_age: float) -> bool:
+        return entry is not None and time.time() - entry[1] <= max_age
+
+    @staticmethod
+    def _sub_key(symbol) -> str:
+        """'btc_usdt', 'BTC-USDT' and 'BTCUSDT' all map to 'BTCUSDT'."""
+        return ''.join(ch for ch in str(symbol).upper() if ch.isalnum())
 
-        def on_open(ws):
-            sub = json.dumps({
+    def _subscription_for(self, j: dict, payload: dict) -> Optional[str]:
+        """The subscribed symbol a spot.ticker frame belongs to (caller holds the lock)."""
+        params = j.get("params") if isinstance(j.get("params"), dict) else {}
+        for value in (params.get("symbol"), j.get("symbol"), payload.get("symbol"),
+                      j.get("channel"), j.get("topic"), j.get("ch")):
+            if not value:
+                continue
+            # Channel names embed the symbol last, e.g. 'spot.ticker.BTC-USDT'
+            for candidate in (value, str(value).rsplit(".", 1)[-1]):
+                symbol = self._sub_keys.get(self._sub_key(candidate))
+                if symbol:
+                    return symbol
+        return None
+
+    def _log_unmatched(self, j: dict, now: float):
+        """Count a ticker frame no subscription claims; warn at most once per interval (caller holds the lock)."""
+        self.unmatched += 1
+        if now - self._unmatched_logged >= self.UNMATCHED_LOG_INTERVAL:
+            self._unmatched_logged = now
+            keys = sorted(k for k in j if k != "data")
+            logger.warning(f"UZX ws: ticker frame matches no subscription "
+                           f"({self.unmatched} so far; keys {keys}, symbol {j.get('symbol')!r})")
+
+    # ── connection ────────────────────────────────────────────────────────
+
+    def _subscribe_ticker(self, symbol: str):
+        with self._cond:
+            self._symbols[symbol] = time.time()
+            self._sub_keys[self._sub_key(symbol)] = symbol
+            stale = not self._fresh(self._tickers.get(symbol), self.TICKER_RESEND_AGE)
+        # New symbols, or ones that went quiet, get a (re-)subscription
+        if stale:
+            self._resend("spot.ticker", symbol)
+
+    def _resend(self, channel: str, symbol: str = ""):
+        with self._cond:
+            ws = self._ws if self._connected else None
+        if ws is not None:
+            self._send_sub(ws, channel, symbol)
+
+    @staticmethod
+    def _send_sub(ws, channel: str, symbol: str = ""):
+        try:
+            ws.send(json.dumps({
                 "event": "sub",
                 "params": {
                     "biz": "market",
-                    "type": "spot.overview",
-                    "symbol": "",
+                    "type": channel,
+                    "symbol": symbol,
                     "interval": ""
                 },
                 "zip": False
-            })
-            ws.send(sub)
-
-        def on_error(ws, err):
-            logger.error(f"UZX ws error: {err}")
-            error_holder.append(str(err))
-            done.set()
-
-        ws = websocket.WebSocketApp(
-            WSS_URL,
-            on_message=on_message,
-            on_open=on_open,
-            on_error=on_error,
-        )
-        t = threading.Thread(target=ws.run_forever)
-        t.daemon = True
-        t.start()
-        done.wait(timeout=20)
+            }))
+        except Exception as e:
+            logger.warning(f"UZX ws subscribe {channel} {symbol}: {e}")
 
-        if error_holder and not results:
-            raise Exception(f"UZX WebSocket error: {error_holder[0]}")
-        if not results:
-            raise Exception("UZX: No ticker data received within timeout")
+    def _on_open(self, ws):
+        cutoff = time.time() - self.SYMBOL_TTL
+        with self._cond:
+            self._connected = True
+            self._symbols = {s: ts for s, ts in self._symbols.items() if ts >= cutoff}
+            self._sub_keys = {self._sub_key(s): s for s in self._symbols}
+            symbols = list(self._symbols)
+        self._send_sub(ws, "spot.overview")
+        for symbol in symbols:
+            self._send_sub(ws, "spot.ticker", symbol)
+
+    def _on_message(self, ws, msg):
+        try:
+            try:
+                data = gzip.decompress(msg)
+            except Exception:
+                data = msg if isinstance(msg, bytes) else msg.encode()
+            j = json.loads(data)
+        except Exception as e:
+            logger.warning(f"UZX ws parse error: {e}")
+            return
+
+        payload = j.get("data")
+        now = time.time()
+        with self._cond:
+            if j.get("code") == 200 and isinstance(payload, list) and len(payload) > 1:
+                self._overview = (payload, now)
+            elif "ticker" in j.get("type", "") and isinstance(payload, dict):
+                symbol = self._subscription_for(j, payload)
+                if symbol is None:
+                    self._log_unmatched(j, now)
+                    return
+                self._tickers[symbol] = (payload, now)
+            else:
+                return
+            self.last_error = None
+            self._cond.notify_all()
+
+    def _on_error(self, ws, err):
+        logger.error(f"UZX ws error: {err}")
+        self.last_error = str(err)
+
+    def _run(self):
+        backoff = 1
+        while True:
+            started = time.time()
+            ws = websocket.WebSocketApp(
+                self.url,
+                on_message=self._on_message,
+                on_open=self._on_open,
+                on_error=self._on_error,
+            )
+            with self._cond:
+                self._ws = ws
+            try:
+                ws.run_forever(ping_interval=self.PING_INTERVAL, ping_timeout=self.PING_INTERVAL / 2)
+            except Exception as e:
+                self._on_error(ws, e)
+            with self._cond:
+                self._connected = False
+                self._ws = None
+            # A connection that stayed up for a while resets the backoff
+            if time.time() - started > 60:
+                backoff = 1
+            logger.info(f"UZX ws disconnected; reconnecting in {backoff}s")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF)
+
+
+_STREAM = UZXStream()
+
+
+class UZXAdapter(BaseAdapter):
+
+    @property
+    def exchange_name(self) -> str:
+        return "UZX"
+
+    # Cached overview/ticker messages older than this are not served
+    OVERVIEW_MAX_AGE = 30
+    TICKER_MAX_AGE = 15
+
+    def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
+        results = _STREAM.overview(max_age=self.OVERVIEW_MAX_AGE, timeout=20)
 
         tickers = []
         for item in results:
@@ -111,57 +264,10 @@ class UZXAdapter(BaseAdapter):
 
     def fetch_orderbook(self, symbol: str, limit: int = 20) -> NormalizedOrderbook:
         """UZX has no orderbook depth channel — use spot.ticker for best bid/ask."""
-        uzx_symbol = symbol.replace("/", "-")
-        result_holder = []
-        done = threading.Event()
-
-        def on_message(ws, msg):
-            try:
-                try:
-                    data = gzip.decompress(msg)
-                except Exception:
-                    data = msg if isinstance(msg, bytes) else msg.encode()
-                j = json.loads(data)
-                msg_type = j.get("type", "")
-                if "ticker" in msg_type and j.get("data"):
-                    result_holder.append(j["data"])
-                    done.set()
-                    ws.close()
-            except Exception as e:
-                logger.warning(f"UZX orderbook parse: {e}")
-
-        def on_open(ws):
-            sub = json.dumps({
-                "event": "sub",
-                "params": {
-                    "biz": "market",
-                    "type": "spot.ticker",
-                    "symbol": uzx_symbol,
-                    "interval": ""
-                },
-                "zip": False
-            })
-            ws.send(sub)
-
-        def on_error(ws, err):
-            logger.error(f"UZX orderbook ws error: {err}")
-            done.set()
-
-        ws = websocket.WebSocketApp(
-            WSS_URL,
-            on_message=on_message,
-            on_open=on_open,
-            on_error=on_error,
-        )
-        t = threading.Thread(target=ws.run_forever)
-        t.daemon = True
-        t.start()
-        done.wait(timeout=10)
-
-        if not result_holder:
+        ticker = _STREAM.ticker(symbol.replace("/", "-"), max_age=self.TICKER_MAX_AGE, timeout=10)
+        if not ticker:
             return NormalizedOrderbook(exchange=self.exchange_name, symbol=symbol, asks=[], bids=[])
 
-        ticker = result_holder[0]
         ask_price = self._safe_float(ticker.get("ask_price"))
         ask_vol   = self._safe_float(ticker.get("ask_vol"))
         bid_price = self._safe_float(ticker.get("bid_price"))
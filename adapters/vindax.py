@@ -15,7 +15,7 @@ class VindaxAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/ticker/24hr",
                 timeout=30
             )
@@ -66,8 +66,9 @@ class VindaxAdapter(BaseAdapter):
         try:
             api_symbol = symbol.replace('/', '')
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/depth",
+                kind='depth',
                 params={
                     "symbol": api_symbol,
                     "limit": limit
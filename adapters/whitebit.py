@@ -15,7 +15,7 @@ class WhiteBitAdapter(BaseAdapter):
 
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/tickers",
                 timeout=30
             )
@@ -68,8 +68,9 @@ class WhiteBitAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '')
             market = f"{base}_USDT"
 
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/depth/result",
+                kind='depth',
                 params={"market": market, "limit": limit},
                 timeout=10
             )
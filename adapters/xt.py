@@ -15,7 +15,7 @@ class XTAdapter(BaseAdapter):
     
     def fetch_usdt_tickers(self) -> List[NormalizedTicker]:
         try:
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/v4/public/ticker",
                 timeout=30
             )
@@ -68,8 +68,9 @@ class XTAdapter(BaseAdapter):
             base = symbol.replace('/USDT', '').replace('/', '').lower()
             api_symbol = f"{base}_usdt"
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/v4/public/depth",
+                kind='depth',
                 params={
                     "symbol": api_symbol,
                     "limit": limit
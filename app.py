@@ -27,6 +27,117 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
 
 db.init_app(app)
 
+
+def sync_schema():
+    """Add columns and indexes that create_all() skips on tables that already exist.
+
+    Additive only: nothing is dropped or altered. Each statement runs in its
+    own transaction so a worker racing another one just logs and moves on.
+    """
+    from sqlalchemy import inspect, text
+    inspector = inspect(db.engine)
+    existing = set(inspector.get_table_names())
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        columns = {c['name'] for c in inspector.get_columns(table.name)}
+        indexes = {i['name'] for i in inspector.get_indexes(table.name)}
+        for column in table.columns:
+            if column.name in columns:
+                continue
+            col_type = column.type.compile(dialect=db.engine.dialect)
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'))
+                logging.info(f'Schema: added {table.name}.{column.name}')
+            except Exception as e:
+                logging.warning(f'Schema: could not add {table.name}.{column.name}: {e}')
+        for index in table.indexes:
+            if index.name in indexes:
+                continue
+            try:
+                with db.engine.begin() as conn:
+                    index.create(conn)
+                logging.info(f'Schema: created index {index.name}')
+            except Exception as e:
+                logging.warning(f'Schema: could not create index {index.name}: {e}')
+
+
+def drop_retired_indexes():
+    """Drop indexes listed in models.RETIRED_INDEXES that still exist."""
+    from sqlalchemy import inspect, text
+    from models import RETIRED_INDEXES
+    inspector = inspect(db.engine)
+    existing = set(inspector.get_table_names())
+    for table, names in RETIRED_INDEXES.items():
+        if table not in existing:
+            continue
+        present = {i['name'] for i in inspector.get_indexes(table)}
+        for name in names:
+            if name not in present:
+                continue
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(text(f'DROP INDEX IF EXISTS {name}'))
+                logging.info(f'Schema: dropped retired index {name}')
+            except Exception as e:
+                logging.warning(f'Schema: could not drop index {name}: {e}')
+
+
+def migrate_orderbook_levels(batch=500):
+    """Pack legacy JSON orderbook_snapshots.bids/asks into bid_levels/ask_levels, then drop them.
+
+    One-off: runs only while the old columns still exist. Backfill and DROP
+    COLUMN share one transaction, so a failure leaves the table untouched
+    and a worker racing another one just logs and moves on.
+    """
+    import json
+    from sqlalchemy import inspect, text
+    import bookcodec
+    columns = {c['name'] for c in inspect(db.engine).get_columns('orderbook_snapshots')}
+    legacy = [c for c in ('bids', 'asks') if c in columns]
+    if not legacy:
+        return 0
+    if legacy != ['bids', 'asks']:
+        logging.warning(f'Schema: orderbook_snapshots has only legacy {legacy}, dropping without backfill')
+
+    def levels(value):
+        if isinstance(value, (str, bytes)):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return []
+        return value if isinstance(value, list) else []
+
+    migrated = 0
+    try:
+        with db.engine.begin() as conn:
+            if legacy == ['bids', 'asks']:
+                rows = conn.execute(text(
+                    'SELECT id, bids, asks FROM orderbook_snapshots '
+                    'WHERE bid_levels IS NULL AND ask_levels IS NULL'
+                )).all()
+                update = text('UPDATE orderbook_snapshots SET bid_levels = :bid_levels, '
+                              'ask_levels = :ask_levels WHERE id = :id')
+                for i in range(0, len(rows), batch):
+                    conn.execute(update, [
+                        {'id': r.id,
+                         'bid_levels': bookcodec.encode_bids(levels(r.bids)),
+                         'ask_levels': bookcodec.encode_asks(levels(r.asks))}
+                        for r in rows[i:i + batch]
+                    ])
+                migrated = len(rows)
+            for column in legacy:
+                conn.execute(text(f'ALTER TABLE orderbook_snapshots DROP COLUMN {column}'))
+        logging.info(f'Schema: packed {migrated} legacy orderbook snapshots, dropped {", ".join(legacy)}')
+    except Exception as e:
+        logging.warning(f'Schema: could not migrate legacy orderbook snapshots: {e}')
+    return migrated
+
+
 with app.app_context():
     import models  # noqa: F401
     db.create_all()
+    sync_schema()
+    drop_retired_indexes()
+    migrate_orderbook_levels()
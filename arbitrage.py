@@ -0,0 +1,212 @@
+"""In-memory cross-exchange arbitrage state behind /api/arbitrage.
+
+save_tickers() hands each exchange's changed and removed rows to the engine,
+which recomputes min/max/spread for those symbols only. Filtered, sorted
+views are cached per index version, so paging through them or toggling a
+filter back does not touch every listing again. The index is re-primed
+from SpotTicker after INDEX_TTL_SEC so writes made by other workers (e.g.
+the scheduler process) are picked up.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from app import db
+from models import SpotTicker
+
+INDEX_TTL_SEC = 300
+VIEW_CACHE_SIZE = 32
+
+LEVERAGED_PATTERN = re.compile(r'\d+[LSls](USDT)?$')
+
+SORT_KEYS = {
+    'spread': lambda r: r['spread_pct'],
+    'turnover': lambda r: r['total_turnover'] or 0,
+    'exchanges': lambda r: r['exchange_count'],
+    'symbol': lambda r: r['symbol'],
+}
+
+
+def _entry(exchange, base_currency, price, turnover, change):
+    return {
+        'exchange': exchange,
+        'base_currency': base_currency,
+        'price': price,
+        'turnover_24h': turnover,
+        'change_24h': change
+    }
+
+
+def build_row(symbol, entries):
+    """Arbitrage row for one symbol, or None when fewer than two exchanges list it."""
+    if len(entries) < 2:
+        return None
+    max_entry = max(entries, key=lambda e: e['price'])
+    min_entry = min(entries, key=lambda e: e['price'])
+    spread_pct = ((max_entry['price'] - min_entry['price']) / min_entry['price']) * 100
+
+    exchange_list = sorted([{
+        'exchange': e['exchange'],
+        'price': e['price'],
+        'turnover_24h': e['turnover_24h'],
+        'change_24h': e['change_24h']
+    } for e in entries], key=lambda x: x['price'], reverse=True)
+
+    return {
+        'symbol': symbol,
+        'base_currency': entries[0]['base_currency'],
+        'exchange_count': len(entries),
+        'max_price': max_entry['price'],
+        'max_exchange': max_entry['exchange'],
+        'max_turnover': max_entry['turnover_24h'],
+        'min_price': min_entry['price'],
+        'min_exchange': min_entry['exchange'],
+        'min_turnover': min_entry['turnover_24h'],
+        'spread_pct': round(spread_pct, 4),
+        'total_turnover': sum(e['turnover_24h'] for e in entries if e['turnover_24h']),
+        'exchanges': exchange_list
+    }
+
+
+class ArbitrageEngine:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}     # symbol -> {exchange: entry}
+        self._rows = {}        # symbol -> row, only symbols on >= 2 exchanges
+        self._views = OrderedDict()   # filter key -> (rows, summary)
+        self._primed_at = 0.0
+        self.version = 0
+
+    # ── maintenance ───────────────────────────────────────────────────────
+
+    def prime(self):
+        """Rebuild everything from SpotTicker (caller holds the lock)."""
+        entries = {}
+        for t in db.session.query(
+            SpotTicker.symbol, SpotTicker.exchange, SpotTicker.base_currency,
+            SpotTicker.price, SpotTicker.turnover_24h, SpotTicker.change_24h
+        ).filter(
+            SpotTicker.price.isnot(None),
+            SpotTicker.price > 0
+        ).all():
+            entries.setdefault(t.symbol, {})[t.exchange] = _entry(
+                t.exchange, t.base_currency, t.price, t.turnover_24h, t.change_24h)
+        self._entries = entries
+        self._rows = {}
+        for symbol, by_exchange in entries.items():
+            row = build_row(symbol, list(by_exchange.values()))
+            if row:
+                self._rows[symbol] = row
+        self._primed_at = time.time()
+        self._changed()
+
+    def apply(self, exchange, changed, vanished):
+        """Patch one exchange's saved rows (dicts with SpotTicker columns) and removed symbols."""
+        if not (changed or vanished):
+            return
+        with self._lock:
+            if not self._primed_at:
+                return  # not primed yet; the first read loads everything
+            touched = set(vanished)
+            for symbol in vanished:
+                self._entries.get(symbol, {}).pop(exchange, None)
+            for r in changed:
+                symbol = r['symbol']
+                touched.add(symbol)
+                if r['price'] and r['price'] > 0:
+                    self._entries.setdefault(symbol, {})[exchange] = _entry(
+                        exchange, r['base_currency'], r['price'], r['turnover_24h'], r['change_24h'])
+                else:
+                    self._entries.get(symbol, {}).pop(exchange, None)
+            for symbol in touched:
+                by_exchange = self._entries.get(symbol)
+                if not by_exchange:
+                    self._entries.pop(symbol, None)
+                row = build_row(symbol, list(by_exchange.values())) if by_exchange else None
+                if row:
+                    self._rows[symbol] = row
+                else:
+                    self._rows.pop(symbol, None)
+            self._changed()
+
+    def _changed(self):
+        self.version += 1
+        self._views.clear()
+
+    # ── reads ─────────────────────────────────────────────────────────────
+
+    def view(self, exclude_leveraged=True, min_spread=0.0, max_spread=None, min_exchanges=2,
+             min_volume=0.0, max_volume=None, list_filter='', exclude_exchanges=(),
+             search='', sort='spread', descending=True,
+             blacklist=frozenset(), wishlist=frozenset()):
+        """(filtered and sorted rows, summary) for one combination of filters.
+
+        Computed once per index version and cached; rows are shared, so
+        callers must copy them before adding per-request fields.
+        """
+        key = (exclude_leveraged, min_spread, max_spread, min_exchanges, min_volume, max_volume,
+               list_filter, frozenset(exclude_exchanges), search, sort, descending,
+               frozenset(blacklist), frozenset(wishlist))
+        with self._lock:
+            if time.time() - self._primed_at >= INDEX_TTL_SEC:
+                self.prime()
+            cached = self._views.get(key)
+            if cached is not None:
+                self._views.move_to_end(key)
+                return cached
+            rows = []
+            for symbol, row in self._rows.items():
+                if exclude_leveraged and LEVERAGED_PATTERN.search(row['base_currency'] or ''):
+                    continue
+                if search and search not in symbol:
+                    continue
+                if list_filter == 'hide_blacklist' and symbol in blacklist:
+                    continue
+                if list_filter == 'only_blacklist' and symbol not in blacklist:
+                    continue
+                if list_filter == 'only_wishlist' and symbol not in wishlist:
+                    continue
+                if list_filter == 'hide_wishlist' and symbol in wishlist:
+                    continue
+                if exclude_exchanges and any(e['exchange'] in exclude_exchanges for e in row['exchanges']):
+                    row = build_row(symbol, [e for e in self._entries[symbol].values()
+                                             if e['exchange'] not in exclude_exchanges])
+                    if row is None:
+                        continue
+                if row['exchange_count'] < min_exchanges:
+                    continue
+                if row['spread_pct'] < min_spread or (max_spread is not None and row['spread_pct'] > max_spread):
+                    continue
+                volume = row['total_turnover'] or 0
+                if volume < min_volume or (max_volume is not None and volume > max_volume):
+                    continue
+                rows.append(row)
+            rows.sort(key=SORT_KEYS.get(sort, SORT_KEYS['spread']), reverse=descending)
+            summary = {
+                'high': sum(1 for r in rows if r['spread_pct'] >= 5),
+                'medium': sum(1 for r in rows if r['spread_pct'] >= 1),
+                'max_spread': max((r['spread_pct'] for r in rows), default=0),
+                'wishlisted': sum(1 for r in rows if r['symbol'] in wishlist),
+                'records_total': len(self._rows),
+                'version': self.version
+            }
+            self._views[key] = (rows, summary)
+            if len(self._views) > VIEW_CACHE_SIZE:
+                self._views.popitem(last=False)
+            return rows, summary
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_arbitrage_engine():
+    """Return the process-wide arbitrage engine (primed on first read)."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ArbitrageEngine()
+    return _engine
@@ -0,0 +1,54 @@
+"""Fixed-width binary encoding for stored orderbook levels.
+
+One side of a book is stored as little-endian float64 (price, qty) pairs,
+best level first, so N levels take exactly 16*N bytes. decode() returns an
+array('d') of the interleaved values, filled by a single C-level copy with
+no per-level Python objects. The format is NumPy-compatible:
+np.frombuffer(blob, '<f8').reshape(-1, 2) reads the same bytes.
+"""
+import sys
+from array import array
+
+_SWAP = sys.byteorder != 'little'
+
+
+def encode(levels, descending):
+    """Pack [[price, qty], ...] sorted best first (bids descending, asks ascending)."""
+    pairs = []
+    for level in levels:
+        try:
+            price, qty = float(level[0]), float(level[1])
+        except (TypeError, ValueError, IndexError):
+            continue
+        if price > 0 and qty > 0:
+            pairs.append((price, qty))
+    pairs.sort(reverse=descending)
+    flat = array('d', [v for pair in pairs for v in pair])
+    if _SWAP:
+        flat.byteswap()
+    return flat.tobytes()
+
+
+def encode_bids(levels):
+    return encode(levels, descending=True)
+
+
+def encode_asks(levels):
+    return encode(levels, descending=False)
+
+
+def decode(blob):
+    """Interleaved array('d') [price0, qty0, price1, qty1, ...] from a packed side."""
+    flat = array('d')
+    if blob:
+        flat.frombytes(bytes(blob))
+        if _SWAP:
+            flat.byteswap()
+    return flat
+
+
+def to_levels(blob, limit=None):
+    """[[price, qty], ...] for JSON responses; only the first `limit` levels are materialized."""
+    flat = decode(blob)
+    end = len(flat) if limit is None else min(len(flat), 2 * limit)
+    return [[flat[i], flat[i + 1]] for i in range(0, end, 2)]
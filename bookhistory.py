@@ -0,0 +1,142 @@
+"""Bounded history of orderbook snapshots for replaying past scope results.
+
+save_orderbook_snapshots() appends every snapshot it upserts to
+orderbook_snapshot_history in the same transaction, reusing the packed
+levels (see bookcodec), so a 5-level book costs about 160 bytes per row.
+Retention is enforced per exchange right after a write, at most once per
+ORDERBOOK_HISTORY_PRUNE_SEC: rows older than ORDERBOOK_HISTORY_MINUTES are
+deleted, and only the newest ORDERBOOK_HISTORY_KEEP snapshots are kept per
+(exchange, symbol). Setting either bound to 0 disables it.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, tuple_
+
+from app import db
+from models import OrderbookSnapshotHistory
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+ENABLED = os.environ.get('ORDERBOOK_HISTORY_ENABLED', '1') == '1'
+RETENTION_MINUTES = _env_float('ORDERBOOK_HISTORY_MINUTES', 60)
+KEEP_PER_SYMBOL = int(_env_float('ORDERBOOK_HISTORY_KEEP', 120))
+PRUNE_SEC = _env_float('ORDERBOOK_HISTORY_PRUNE_SEC', 60)
+INSERT_CHUNK = 1000
+
+_last_prune = {}
+_prune_lock = threading.Lock()
+
+
+def record_books(rows):
+    """Append snapshot rows (dicts with OrderbookSnapshotHistory columns); the caller commits."""
+    if not ENABLED or not rows:
+        return
+    table = OrderbookSnapshotHistory.__table__
+    for i in range(0, len(rows), INSERT_CHUNK):
+        db.session.execute(table.insert(), rows[i:i + INSERT_CHUNK])
+
+
+def maybe_prune(exchange):
+    """Apply retention to one exchange's history unless it ran within PRUNE_SEC."""
+    if not ENABLED:
+        return
+    now = time.time()
+    with _prune_lock:
+        if now - _last_prune.get(exchange, 0.0) < PRUNE_SEC:
+            return
+        _last_prune[exchange] = now
+    try:
+        prune(exchange)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f'Orderbook history prune failed for {exchange}: {e}')
+
+
+def prune(exchange):
+    """Delete one exchange's rows past the age and per-symbol count bounds."""
+    H = OrderbookSnapshotHistory
+    deleted = 0
+    if RETENTION_MINUTES > 0:
+        cutoff = datetime.utcnow() - timedelta(minutes=RETENTION_MINUTES)
+        deleted += H.query.filter(H.exchange == exchange, H.fetched_at < cutoff).delete(
+            synchronize_session=False)
+    if KEEP_PER_SYMBOL > 0:
+        ranked = db.session.query(
+            H.exchange, H.symbol, H.fetched_at,
+            func.row_number().over(partition_by=H.symbol, order_by=H.fetched_at.desc()).label('rn')
+        ).filter(H.exchange == exchange).subquery()
+        excess = db.session.query(ranked.c.exchange, ranked.c.symbol, ranked.c.fetched_at).filter(
+            ranked.c.rn > KEEP_PER_SYMBOL)
+        deleted += H.query.filter(
+            tuple_(H.exchange, H.symbol, H.fetched_at).in_(excess)
+        ).delete(synchronize_session=False)
+    db.session.commit()
+    if deleted:
+        logger.debug(f'Orderbook history: pruned {deleted} rows for {exchange}')
+    return deleted
+
+
+# ── queries ───────────────────────────────────────────────────────────────
+
+def books_at(symbols, at):
+    """Latest stored snapshot at or before `at` for every (exchange, symbol) in `symbols`."""
+    H = OrderbookSnapshotHistory
+    latest = db.session.query(
+        H.exchange, H.symbol, func.max(H.fetched_at).label('last_t')
+    ).filter(H.symbol.in_(symbols), H.fetched_at <= at).group_by(H.exchange, H.symbol).subquery()
+    return H.query.join(latest, (H.exchange == latest.c.exchange) & (H.symbol == latest.c.symbol)
+                        & (H.fetched_at == latest.c.last_t)).all()
+
+
+def spread_timeline(symbol, since, until, max_age_sec):
+    """Top-of-book cross-exchange spread of one symbol at every stored fetch time.
+
+    Each exchange's book counts until it is `max_age_sec` old at a point.
+    Uses only best_bid/best_ask, so no levels are decoded; replay a single
+    point (books_at) for depth and executable sizes.
+    """
+    H = OrderbookSnapshotHistory
+    rows = db.session.query(H.fetched_at, H.exchange, H.best_bid, H.best_ask).filter(
+        H.symbol == symbol,
+        H.fetched_at >= since - timedelta(seconds=max_age_sec),
+        H.fetched_at <= until
+    ).order_by(H.fetched_at).all()
+
+    last = {}
+    points = []
+    i = 0
+    while i < len(rows):
+        t = rows[i][0]
+        while i < len(rows) and rows[i][0] == t:
+            _, exchange, bid, ask = rows[i]
+            last[exchange] = (bid, ask, t)
+            i += 1
+        if t < since:
+            continue
+        live = {ex: (bid, ask) for ex, (bid, ask, ts) in last.items()
+                if bid and ask and (t - ts).total_seconds() <= max_age_sec}
+        if len(live) < 2:
+            continue
+        sell_ex = max(live, key=lambda ex: live[ex][0])
+        buy_ex = min((ex for ex in live if ex != sell_ex), key=lambda ex: live[ex][1])
+        bid, ask = live[sell_ex][0], live[buy_ex][1]
+        points.append({
+            't': t.isoformat(),
+            'sell_exchange': sell_ex, 'best_bid': bid,
+            'buy_exchange': buy_ex, 'best_ask': ask,
+            'real_spread': round((bid - ask) / ask * 100, 3),
+            'exchange_count': len(live)
+        })
+    return points
@@ -0,0 +1,177 @@
+"""Size-aware (executable) spreads from orderbook depth.
+
+Top-of-book spreads overstate opportunities whose best level is dust. Each
+book side is turned once into cumulative quantity/notional arrays; the VWAP
+for any target notional is then a bisect plus one partial level, and every
+exchange pair of a coin is evaluated against the same arrays. Pairs whose
+best bid does not cross the other venue's best ask are skipped, since they
+cannot be profitable at any size.
+
+Fees are taker fees in percent per leg: the buy leg pays them on the USDT
+spent, the sell leg on the USDT received.
+"""
+import operator
+from bisect import bisect_left
+from itertools import accumulate
+
+
+class BookSide:
+    """One side of a book, best level first, with cumulative qty and notional."""
+
+    __slots__ = ('prices', 'qtys', 'cum_qty', 'cum_notional')
+
+    def __init__(self, levels, descending):
+        parsed = []
+        for level in levels:
+            try:
+                price, qty = float(level[0]), float(level[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            if price > 0 and qty > 0:
+                parsed.append((price, qty))
+        parsed.sort(reverse=descending)
+        self.prices = [p for p, _ in parsed]
+        self.qtys = [q for _, q in parsed]
+        self.cum_qty = list(accumulate(self.qtys))
+        self.cum_notional = list(accumulate(p * q for p, q in parsed))
+
+    @classmethod
+    def from_packed(cls, flat):
+        """From an interleaved, best-first array('d') as returned by bookcodec.decode()."""
+        side = cls.__new__(cls)
+        side.prices = flat[0::2]
+        side.qtys = flat[1::2]
+        side.cum_qty = list(accumulate(side.qtys))
+        side.cum_notional = list(accumulate(map(operator.mul, side.prices, side.qtys)))
+        return side
+
+    @classmethod
+    def bids(cls, levels):
+        return cls(levels, descending=True)
+
+    @classmethod
+    def asks(cls, levels):
+        return cls(levels, descending=False)
+
+    @property
+    def best(self):
+        return self.prices[0] if self.prices else None
+
+    @property
+    def notional(self):
+        return self.cum_notional[-1] if self.cum_notional else 0.0
+
+    def qty_for_notional(self, notional):
+        """Base quantity traded for `notional` USDT, or None if the book is too thin."""
+        i = bisect_left(self.cum_notional, notional)
+        if i == len(self.cum_notional):
+            return None
+        prev_qty = self.cum_qty[i - 1] if i else 0.0
+        prev_notional = self.cum_notional[i - 1] if i else 0.0
+        return prev_qty + (notional - prev_notional) / self.prices[i]
+
+    def notional_for_qty(self, qty):
+        """USDT value of trading `qty` base units, or None if the book is too thin."""
+        i = bisect_left(self.cum_qty, qty)
+        if i == len(self.cum_qty):
+            return None
+        prev_qty = self.cum_qty[i - 1] if i else 0.0
+        prev_notional = self.cum_notional[i - 1] if i else 0.0
+        return prev_notional + (qty - prev_qty) * self.prices[i]
+
+
+def max_profitable(asks, bids, buy_fee, sell_fee):
+    """(size_usdt, profit_usdt) at the size where the marginal unit stops paying.
+
+    Walks both books level by level; the marginal unit is profitable while
+    the current bid after the sell fee beats the current ask after the buy fee.
+    """
+    buy_mult, sell_mult = 1 + buy_fee / 100, 1 - sell_fee / 100
+    i = j = 0
+    ask_left = asks.qtys[0] if asks.qtys else 0.0
+    bid_left = bids.qtys[0] if bids.qtys else 0.0
+    size = profit = 0.0
+    while i < len(asks.prices) and j < len(bids.prices):
+        ask, bid = asks.prices[i], bids.prices[j]
+        if bid * sell_mult <= ask * buy_mult:
+            break
+        qty = min(ask_left, bid_left)
+        size += qty * ask
+        profit += qty * (bid * sell_mult - ask * buy_mult)
+        ask_left -= qty
+        bid_left -= qty
+        if ask_left <= 0:
+            i += 1
+            ask_left = asks.qtys[i] if i < len(asks.qtys) else 0.0
+        if bid_left <= 0:
+            j += 1
+            bid_left = bids.qtys[j] if j < len(bids.qtys) else 0.0
+    return size, profit
+
+
+def pair_execution(buy_exchange, asks, sell_exchange, bids, target_usdt, buy_fee, sell_fee):
+    """Buy `target_usdt` on one venue's asks and sell the same quantity into another's bids."""
+    max_size, max_profit = max_profitable(asks, bids, buy_fee, sell_fee)
+    result = {
+        'buy_exchange': buy_exchange,
+        'sell_exchange': sell_exchange,
+        'best_ask': asks.best,
+        'best_bid': bids.best,
+        'target_usdt': target_usdt,
+        'filled': False,
+        'vwap_buy': None,
+        'vwap_sell': None,
+        'buy_slippage_pct': None,
+        'sell_slippage_pct': None,
+        'gross_spread_pct': None,
+        'net_spread_pct': None,
+        'profit_usdt': None,
+        'max_size_usdt': round(max_size, 2),
+        'max_profit_usdt': round(max_profit, 2),
+        'buy_depth_usdt': round(asks.notional, 2),
+        'sell_depth_usdt': round(bids.notional, 2)
+    }
+    qty = asks.qty_for_notional(target_usdt)
+    proceeds = bids.notional_for_qty(qty) if qty else None
+    if not proceeds:
+        return result
+
+    vwap_buy = target_usdt / qty
+    vwap_sell = proceeds / qty
+    profit = proceeds * (1 - sell_fee / 100) - target_usdt * (1 + buy_fee / 100)
+    result.update({
+        'filled': True,
+        'vwap_buy': vwap_buy,
+        'vwap_sell': vwap_sell,
+        'buy_slippage_pct': round((vwap_buy - asks.best) / asks.best * 100, 3),
+        'sell_slippage_pct': round((bids.best - vwap_sell) / bids.best * 100, 3),
+        'gross_spread_pct': round((vwap_sell - vwap_buy) / vwap_buy * 100, 3),
+        'net_spread_pct': round(profit / target_usdt * 100, 3),
+        'profit_usdt': round(profit, 2)
+    })
+    return result
+
+
+def executable_spreads(books, target_usdt, fees=None, default_fee=0.2):
+    """Evaluate every crossing exchange pair of one coin.
+
+    `books` maps exchange -> (bid BookSide, ask BookSide); `fees` maps
+    exchange -> taker fee percent, falling back to `default_fee`. Returns
+    pair results sorted best first: filled pairs by net spread, then
+    unfilled ones (book too thin for the target) by max profit.
+    """
+    fees = fees or {}
+    pairs = []
+    for buy_exchange, (_, asks) in books.items():
+        if not asks.prices:
+            continue
+        for sell_exchange, (bids, _) in books.items():
+            if sell_exchange == buy_exchange or not bids.prices or bids.best <= asks.best:
+                continue
+            pairs.append(pair_execution(
+                buy_exchange, asks, sell_exchange, bids, target_usdt,
+                fees.get(buy_exchange, default_fee), fees.get(sell_exchange, default_fee)
+            ))
+    pairs.sort(key=lambda p: (p['filled'], p['net_spread_pct'] if p['filled'] else p['max_profit_usdt']),
+               reverse=True)
+    return pairs
@@ -0,0 +1,174 @@
+"""Ticker fetch log with per-exchange latest status and hourly rollups.
+
+log_fetch() appends the FetchLog row and, in the same transaction, upserts
+the exchange's exchange_status row and its fetch_logs_1h bucket, so
+/api/status reads one row per exchange instead of scanning the log.
+FetchLog rows older than FETCH_LOG_RETENTION_DAYS and rollups older than
+FETCH_LOG_1H_DAYS are deleted at most once per PRUNE_SEC per process.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import case
+
+from app import db
+from models import ExchangeStatus, FetchLog, FetchLogHourly, SpotTicker
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+RETENTION_DAYS = _env_float('FETCH_LOG_RETENTION_DAYS', 7)
+HOURLY_RETENTION_DAYS = _env_float('FETCH_LOG_1H_DAYS', 90)
+PRUNE_SEC = 3600
+
+_last_prune = {'ts': 0.0}
+_prune_lock = threading.Lock()
+
+
+def log_fetch(exchange_name, status, pairs_count=0, error_message=None, duration_ms=None):
+    """Record one ticker fetch attempt (duration_ms: fetch and save time, if measured)."""
+    from routes import _dialect_insert
+    now = datetime.utcnow()
+    ok = status == 'success'
+    duration_ms = int(duration_ms) if duration_ms is not None else None
+    try:
+        db.session.add(FetchLog(
+            exchange=exchange_name,
+            status=status,
+            pairs_count=pairs_count,
+            error_message=error_message,
+            duration_ms=duration_ms,
+            fetched_at=now
+        ))
+
+        stmt = _dialect_insert(ExchangeStatus).values(
+            exchange=exchange_name, status=status, last_fetch=now,
+            last_success=now if ok else None, last_error=None if ok else now,
+            error_message=error_message, pairs_count=pairs_count if ok else 0,
+            duration_ms=duration_ms, consecutive_failures=0 if ok else 1
+        )
+        updates = {'status': status, 'last_fetch': now, 'duration_ms': duration_ms}
+        if ok:
+            updates.update(last_success=now, pairs_count=pairs_count, consecutive_failures=0)
+        else:
+            updates.update(last_error=now, error_message=error_message,
+                           consecutive_failures=ExchangeStatus.consecutive_failures + 1)
+        db.session.execute(stmt.on_conflict_do_update(index_elements=['exchange'], set_=updates))
+
+        H = FetchLogHourly
+        timed = 1 if duration_ms is not None else 0
+        stmt = _dialect_insert(H).values(
+            bucket=now.replace(minute=0, second=0, microsecond=0), exchange=exchange_name,
+            attempts=1, successes=int(ok), timed=timed,
+            total_duration_ms=duration_ms or 0, max_duration_ms=duration_ms
+        )
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['bucket', 'exchange'],
+            set_={
+                'attempts': H.attempts + 1,
+                'successes': H.successes + stmt.excluded.successes,
+                'timed': H.timed + stmt.excluded.timed,
+                'total_duration_ms': H.total_duration_ms + stmt.excluded.total_duration_ms,
+                'max_duration_ms': case(
+                    (H.max_duration_ms.is_(None), stmt.excluded.max_duration_ms),
+                    (stmt.excluded.max_duration_ms > H.max_duration_ms, stmt.excluded.max_duration_ms),
+                    else_=H.max_duration_ms),
+            }
+        ))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    maybe_prune()
+
+
+def maybe_prune():
+    """Apply retention unless it ran within PRUNE_SEC in this process."""
+    now = time.time()
+    with _prune_lock:
+        if now - _last_prune['ts'] < PRUNE_SEC:
+            return
+        _last_prune['ts'] = now
+    try:
+        prune()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f'Fetch log prune failed: {e}')
+
+
+def prune():
+    now = datetime.utcnow()
+    deleted = FetchLog.query.filter(
+        FetchLog.fetched_at < now - timedelta(days=RETENTION_DAYS)
+    ).delete(synchronize_session=False)
+    FetchLogHourly.query.filter(
+        FetchLogHourly.bucket < now - timedelta(days=HOURLY_RETENTION_DAYS)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    if deleted:
+        logger.info(f'Fetch log: pruned {deleted} rows older than {RETENTION_DAYS:g} days')
+    return deleted
+
+
+def backfill_status():
+    """Seed exchange_status from the existing log (one-off, when the table is still empty).
+
+    Rows are inserted with ON CONFLICT DO NOTHING, so a concurrent backfill
+    or a log_fetch() that got there first wins instead of raising.
+    """
+    from sqlalchemy import func
+    from routes import _dialect_insert
+    ranked = db.session.query(
+        FetchLog.exchange, FetchLog.status, FetchLog.fetched_at, FetchLog.error_message,
+        func.row_number().over(partition_by=FetchLog.exchange, order_by=FetchLog.fetched_at.desc()).label('rn')
+    ).subquery()
+    latest = db.session.query(ranked).filter(ranked.c.rn == 1).all()
+    if not latest:
+        return 0
+    counts = dict(db.session.query(
+        SpotTicker.exchange, func.count(SpotTicker.id)
+    ).group_by(SpotTicker.exchange).all())
+    values = []
+    for row in latest:
+        ok = row.status == 'success'
+        values.append(dict(
+            exchange=row.exchange, status=row.status, last_fetch=row.fetched_at,
+            last_success=row.fetched_at if ok else None, last_error=None if ok else row.fetched_at,
+            error_message=row.error_message, pairs_count=counts.get(row.exchange, 0),
+            duration_ms=None, consecutive_failures=0 if ok else 1
+        ))
+    try:
+        db.session.execute(_dialect_insert(ExchangeStatus).values(values)
+                           .on_conflict_do_nothing(index_elements=['exchange']))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(latest)
+
+
+def exchange_statuses():
+    """{exchange: ExchangeStatus} for every exchange that has been fetched."""
+    rows = ExchangeStatus.query.all()
+    if not rows and backfill_status():
+        rows = ExchangeStatus.query.all()
+    return {r.exchange: r for r in rows}
+
+
+def hourly(exchange=None, hours=24):
+    """Hourly rollups for the last `hours`, newest first."""
+    since = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=hours)
+    q = FetchLogHourly.query.filter(FetchLogHourly.bucket >= since)
+    if exchange:
+        q = q.filter(FetchLogHourly.exchange == exchange)
+    return q.order_by(FetchLogHourly.bucket.desc(), FetchLogHourly.exchange).all()
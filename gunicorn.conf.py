@@ -0,0 +1,6 @@
+import os
+
+# Threaded workers: long-lived SSE streams (fetch-all progress, the Kraken
+# live monitor) each hold a thread, not a whole worker process.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
@@ -0,0 +1,377 @@
+"""Append-only ticker history with 1-minute and 1-hour OHLC rollups.
+
+save_tickers() passes the rows it just wrote to record_tickers(), which only appends
+them to an in-memory queue. A writer thread per process flushes the queue in
+bulk every TICKER_HISTORY_FLUSH seconds, so the live refresh path never waits
+on history I/O. When the queue is full, new samples are dropped and counted
+in stats instead of blocking.
+
+Each flush appends raw samples to ticker_history and merges them into
+ticker_history_1m / ticker_history_1h. On PostgreSQL the raw table is
+range-partitioned by day: partitions are created a few days ahead, and whole
+days past TICKER_HISTORY_RAW_DAYS are dropped rather than deleted row by row.
+Rollups are pruned by bucket.
+
+Between heartbeats only changed tickers are written (save_tickers skips
+unchanged rows), so a price series is a step function: a price holds until
+the next sample. Every TICKER_HISTORY_HEARTBEAT seconds per exchange all
+listed rows are recorded, so a flat price on an illiquid venue keeps being
+sampled within the carry-forward limits in INTERVALS.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, text
+
+from app import app, db
+from models import TickerHistory, TickerRollup1m, TickerRollup1h
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+ENABLED = os.environ.get('TICKER_HISTORY_ENABLED', '1') == '1'
+FLUSH_SEC = _env_float('TICKER_HISTORY_FLUSH', 5)
+QUEUE_MAX = int(_env_float('TICKER_HISTORY_QUEUE', 200000))
+RAW_RETENTION_DAYS = _env_float('TICKER_HISTORY_RAW_DAYS', 3)
+MINUTE_RETENTION_DAYS = _env_float('TICKER_HISTORY_1M_DAYS', 14)
+HOUR_RETENTION_DAYS = _env_float('TICKER_HISTORY_1H_DAYS', 365)
+# Keep below the shortest carry-forward limit in INTERVALS (1800s)
+HEARTBEAT_SEC = _env_float('TICKER_HISTORY_HEARTBEAT', 600)
+MAINTENANCE_SEC = 3600
+PARTITIONS_AHEAD = 2
+INSERT_CHUNK = 1000
+
+PARTITION_PREFIX = 'ticker_history_p'
+
+# interval -> (model, time column, price column, bucket width in seconds,
+#              how long a price is carried forward without a new sample, longest window)
+INTERVALS = {
+    'raw': (TickerHistory, 'ts', 'price', 0, 1800, timedelta(days=2)),
+    '1m': (TickerRollup1m, 'bucket', 'close', 60, 1800, timedelta(days=14)),
+    '1h': (TickerRollup1h, 'bucket', 'close', 3600, 7200, timedelta(days=365)),
+}
+
+
+def _bucket(ts, width):
+    """Start of the `width`-second bucket (a divisor of one day) containing `ts`."""
+    seconds = ts.hour * 3600 + ts.minute * 60 + ts.second
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(seconds=seconds // width * width)
+
+
+class TickerHistoryWriter:
+
+    def __init__(self):
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._partitions = set()      # days known to have a partition
+        self._heartbeats = {}         # exchange -> last full sample (epoch)
+        self._last_maintenance = 0.0
+        self.stats = {'queued': 0, 'written': 0, 'dropped': 0, 'requeued': 0, 'flushes': 0,
+                      'last_flush': None, 'last_error': None}
+
+    # ── ingest ────────────────────────────────────────────────────────────
+
+    def record(self, rows):
+        """Queue saved ticker rows (dicts with SpotTicker columns); never blocks on the DB."""
+        samples = [(r['fetched_at'], r['exchange'], r['symbol'], r['price'],
+                    r['volume_24h'], r['turnover_24h'])
+                   for r in rows if r['price'] and r['price'] > 0]
+        if not samples:
+            return
+        with self._lock:
+            room = max(QUEUE_MAX - len(self._queue), 0)
+            if room < len(samples):
+                self.stats['dropped'] += len(samples) - room
+                samples = samples[:room]
+            self._queue.extend(samples)
+            self.stats['queued'] += len(samples)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='ticker-history', daemon=True)
+                self._thread.start()
+
+    def heartbeat_due(self, exchange):
+        """True (and reset) when `exchange` is due a sample of every listed row."""
+        now = time.time()
+        with self._lock:
+            if now - self._heartbeats.get(exchange, 0.0) < HEARTBEAT_SEC:
+                return False
+            self._heartbeats[exchange] = now
+            return True
+
+    def _run(self):
+        while True:
+            time.sleep(FLUSH_SEC)
+            try:
+                with app.app_context():
+                    try:
+                        if time.time() - self._last_maintenance >= MAINTENANCE_SEC:
+                            self.maintain()
+                        self.flush()
+                    finally:
+                        db.session.remove()
+            except Exception as e:
+                self.stats['last_error'] = str(e)
+                logger.error(f'Ticker history writer error: {e}')
+
+    def flush(self):
+        """Write everything queued so far; returns the number of samples written.
+
+        On failure the batch goes back to the front of the queue (as much as
+        fits under QUEUE_MAX) and is retried by the next flush.
+        """
+        with self._lock:
+            batch = list(self._queue)
+            self._queue.clear()
+        if not batch:
+            return 0
+        batch.sort(key=lambda s: s[0])
+        from routes import _dialect_insert
+        try:
+            self._ensure_partitions({s[0].date() for s in batch})
+            raw = [{'ts': ts, 'exchange': ex, 'symbol': sym, 'price': price,
+                    'volume_24h': volume, 'turnover_24h': turnover}
+                   for ts, ex, sym, price, volume, turnover in batch]
+            for i in range(0, len(raw), INSERT_CHUNK):
+                db.session.execute(
+                    _dialect_insert(TickerHistory).values(raw[i:i + INSERT_CHUNK]).on_conflict_do_nothing()
+                )
+            for model, width in ((TickerRollup1m, 60), (TickerRollup1h, 3600)):
+                self._merge_rollup(model, width, batch, _dialect_insert)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            self._requeue(batch)
+            raise
+        self.stats['written'] += len(batch)
+        self.stats['flushes'] += 1
+        self.stats['last_flush'] = datetime.utcnow().isoformat()
+        return len(batch)
+
+    def _requeue(self, batch):
+        """Put a failed batch back ahead of newer samples, dropping its oldest if the queue is full."""
+        with self._lock:
+            room = max(QUEUE_MAX - len(self._queue), 0)
+            if room < len(batch):
+                self.stats['dropped'] += len(batch) - room
+                batch = batch[len(batch) - room:] if room else []
+            self._queue.extendleft(reversed(batch))
+            self.stats['requeued'] += len(batch)
+
+    @staticmethod
+    def _merge_rollup(model, width, batch, dialect_insert):
+        """Fold time-ordered samples into OHLC buckets and upsert them."""
+        buckets = {}
+        for ts, ex, sym, price, _, turnover in batch:
+            key = (_bucket(ts, width), ex, sym)
+            agg = buckets.get(key)
+            if agg is None:
+                buckets[key] = {'bucket': key[0], 'exchange': ex, 'symbol': sym,
+                                'open': price, 'high': price, 'low': price, 'close': price,
+                                'samples': 1, 'turnover_24h': turnover}
+            else:
+                agg['high'] = max(agg['high'], price)
+                agg['low'] = min(agg['low'], price)
+                agg['close'] = price
+                agg['samples'] += 1
+                agg['turnover_24h'] = turnover
+        values = list(buckets.values())
+        for i in range(0, len(values), INSERT_CHUNK):
+            stmt = dialect_insert(model).values(values[i:i + INSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['bucket', 'exchange', 'symbol'],
+                set_={
+                    'high': case((stmt.excluded.high > model.high, stmt.excluded.high), else_=model.high),
+                    'low': case((stmt.excluded.low < model.low, stmt.excluded.low), else_=model.low),
+                    'close': stmt.excluded.close,
+                    'samples': model.samples + stmt.excluded.samples,
+                    'turnover_24h': stmt.excluded.turnover_24h,
+                }
+            )
+            db.session.execute(stmt)
+
+    # ── partitions & retention ────────────────────────────────────────────
+
+    @staticmethod
+    def _partitioned():
+        return db.engine.dialect.name == 'postgresql'
+
+    def _ensure_partitions(self, days):
+        """Create missing daily partitions, each in its own transaction (another worker may race us).
+
+        A day is remembered only once its partition is known to exist, so a
+        failed CREATE is retried on the next flush.
+        """
+        if not self._partitioned():
+            return
+        for day in sorted(days - self._partitions):
+            name = f'{PARTITION_PREFIX}{day:%Y%m%d}'
+            try:
+                db.session.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF ticker_history "
+                    f"FOR VALUES FROM ('{day}') TO ('{day + timedelta(days=1)}')"
+                ))
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                exists = db.session.execute(text('SELECT to_regclass(:name)'), {'name': name}).scalar()
+                db.session.rollback()
+                if exists is None:
+                    logger.warning(f'Ticker history partition {name} could not be created: {e}')
+                    continue
+            self._partitions.add(day)
+
+    def maintain(self):
+        """Create upcoming partitions and apply the retention policies."""
+        self._last_maintenance = time.time()
+        now = datetime.utcnow()
+        today = now.date()
+        self._ensure_partitions({today + timedelta(days=i) for i in range(PARTITIONS_AHEAD + 1)})
+
+        raw_cutoff = now - timedelta(days=RAW_RETENTION_DAYS)
+        if self._partitioned():
+            names = db.session.execute(text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'ticker_history'::regclass"
+            )).scalars().all()
+            for name in names:
+                try:
+                    day = datetime.strptime(name[len(PARTITION_PREFIX):], '%Y%m%d')
+                except ValueError:
+                    continue
+                # Drop a day only once all of it is past retention
+                if day + timedelta(days=1) <= raw_cutoff:
+                    db.session.execute(text(f'DROP TABLE IF EXISTS {name}'))
+                    self._partitions.discard(day.date())
+                    logger.info(f'Ticker history: dropped partition {name}')
+        else:
+            TickerHistory.query.filter(TickerHistory.ts < raw_cutoff).delete(synchronize_session=False)
+
+        for model, days in ((TickerRollup1m, MINUTE_RETENTION_DAYS), (TickerRollup1h, HOUR_RETENTION_DAYS)):
+            model.query.filter(model.bucket < now - timedelta(days=days)).delete(synchronize_session=False)
+        db.session.commit()
+
+    def status(self):
+        with self._lock:
+            queued = len(self._queue)
+        return dict(self.stats, pending=queued, enabled=ENABLED)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_history_writer():
+    """Return the process-wide ticker history writer."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = TickerHistoryWriter()
+    return _writer
+
+
+def record_tickers(exchange, changed, listed):
+    """Queue rows from save_tickers() for the history writer (no-op when disabled).
+
+    `changed` are the rows just written; `listed` is a callable returning
+    every row the exchange currently lists, recorded instead when the
+    exchange is due a heartbeat.
+    """
+    if not ENABLED:
+        return
+    writer = get_history_writer()
+    writer.record(listed() if writer.heartbeat_due(exchange) else changed)
+
+
+# ── queries ───────────────────────────────────────────────────────────────
+
+def spread_series(symbol, interval='1m', since=None, until=None, exchanges=None, min_spread=1.0):
+    """Cross-exchange spread of one symbol over time.
+
+    Each exchange's last price is carried forward until its next sample (for
+    at most the interval's fill limit), and at every point where some price
+    changed the max/min across exchanges is reported. Also returns how long
+    the spread stayed at or above `min_spread` percent.
+    """
+    model, time_attr, price_attr, width, fill_sec, _ = INTERVALS[interval]
+    time_col, price_col = getattr(model, time_attr), getattr(model, price_attr)
+    until = until or datetime.utcnow()
+
+    def query():
+        q = db.session.query(time_col, model.exchange, price_col).filter(model.symbol == symbol)
+        if exchanges:
+            q = q.filter(model.exchange.in_(exchanges))
+        return q
+
+    # Seed each exchange with its last price before the window
+    fill_from = since - timedelta(seconds=fill_sec)
+    latest = query().with_entities(model.exchange, db.func.max(time_col).label('last_t')).filter(
+        time_col >= fill_from, time_col < since
+    ).group_by(model.exchange).subquery()
+    seed = query().join(
+        latest, (model.exchange == latest.c.exchange) & (time_col == latest.c.last_t)
+    ).all()
+    rows = query().filter(time_col >= since, time_col <= until).order_by(time_col).all()
+
+    last = {ex: (price, ts) for ts, ex, price in seed}
+    times, points = [], []
+    i = 0
+    while i < len(rows):
+        t = rows[i][0]
+        while i < len(rows) and rows[i][0] == t:
+            last[rows[i][1]] = (rows[i][2], t)
+            i += 1
+        live = {ex: p for ex, (p, ts) in last.items() if (t - ts).total_seconds() <= fill_sec}
+        if len(live) < 2:
+            continue
+        max_ex = max(live, key=live.get)
+        min_ex = min(live, key=live.get)
+        times.append(t)
+        points.append({
+            't': t.isoformat(),
+            'max_price': live[max_ex], 'max_exchange': max_ex,
+            'min_price': live[min_ex], 'min_exchange': min_ex,
+            'spread_pct': round((live[max_ex] - live[min_ex]) / live[min_ex] * 100, 4),
+            'exchange_count': len(live)
+        })
+
+    # A point lasts until the next one; the last one for one bucket (or up to `until` for raw)
+    above = longest = run = 0.0
+    for n, (ts, point) in enumerate(zip(times, points)):
+        if n + 1 < len(times):
+            end = times[n + 1]
+        else:
+            end = min(until, ts + timedelta(seconds=width)) if width else until
+        duration = max((end - ts).total_seconds(), 0)
+        if point['spread_pct'] >= min_spread:
+            above += duration
+            run += duration
+            longest = max(longest, run)
+        else:
+            run = 0.0
+
+    return {
+        'symbol': symbol,
+        'interval': interval,
+        'since': since.isoformat(),
+        'until': until.isoformat(),
+        'points': points,
+        'persistence': {
+            'min_spread': min_spread,
+            'seconds_above': round(above),
+            'longest_run_sec': round(longest),
+            'current_run_sec': round(run)
+        }
+    }
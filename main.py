@@ -1,2 +1,5 @@
 from app import app
 import routes  # noqa: F401
+from scheduler import start_scheduler
+
+start_scheduler()
@@ -1,5 +1,6 @@
 from datetime import datetime
 from app import db
+import bookcodec
 import json
 
 
@@ -19,10 +20,23 @@ class SpotTicker(db.Model):
     turnover_24h = db.Column(db.Float, nullable=True)
     fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     
+    # Indexes follow the hot read paths (see scripts/explain_indexes.py); INCLUDE
+    # columns allow index-only scans on PostgreSQL, other backends ignore them.
+    # save_tickers() rewrites the value columns on every refresh and each index
+    # that carries one is rewritten with the row, so they are kept few and narrow.
     __table_args__ = (
         db.UniqueConstraint('exchange', 'symbol', name='unique_exchange_symbol'),
+        # Priced rows by symbol: arbitrage and reference indexes, scheduler, exchange focus
+        db.Index('ix_spot_tickers_priced', 'symbol', 'exchange',
+                 postgresql_include=['price', 'turnover_24h', 'base_currency'],
+                 postgresql_where=db.text('price > 0'), sqlite_where=db.text('price > 0')),
+        # Priced USDT rows grouped by coin: scope
+        db.Index('ix_spot_tickers_usdt_base', 'base_currency', 'exchange',
+                 postgresql_include=['symbol', 'price', 'turnover_24h'],
+                 postgresql_where=db.text("price > 0 AND quote_currency = 'USDT'"),
+                 sqlite_where=db.text("price > 0 AND quote_currency = 'USDT'")),
     )
-    
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -40,6 +54,12 @@ class SpotTicker(db.Model):
         }
 
 
+# Indexes dropped from the models; app.drop_retired_indexes() removes them from existing databases
+RETIRED_INDEXES = {
+    'spot_tickers': ('ix_spot_tickers_symbol_exchange', 'ix_spot_tickers_priced_symbol'),
+}
+
+
 class FetchLog(db.Model):
     __tablename__ = 'fetch_logs'
     
@@ -48,8 +68,14 @@ class FetchLog(db.Model):
     status = db.Column(db.String(20), nullable=False)
     pairs_count = db.Column(db.Integer, default=0)
     error_message = db.Column(db.Text, nullable=True)
+    duration_ms = db.Column(db.Integer, nullable=True)
     fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
-    
+
+    __table_args__ = (
+        db.Index('ix_fetch_logs_fetched_at', 'fetched_at'),
+        db.Index('ix_fetch_logs_exchange_fetched_at', 'exchange', 'fetched_at'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -57,10 +83,63 @@ class FetchLog(db.Model):
             'status': self.status,
             'pairs_count': self.pairs_count,
             'error_message': self.error_message,
+            'duration_ms': self.duration_ms,
             'fetched_at': self.fetched_at.isoformat() if self.fetched_at else None
         }
 
 
+class ExchangeStatus(db.Model):
+    """Latest fetch outcome per exchange, upserted by fetchlog.log_fetch()."""
+    __tablename__ = 'exchange_status'
+
+    exchange = db.Column(db.String(50), primary_key=True)
+    status = db.Column(db.String(20), nullable=False)
+    last_fetch = db.Column(db.DateTime, nullable=False)
+    last_success = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.DateTime, nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+    pairs_count = db.Column(db.Integer, nullable=False, default=0)
+    duration_ms = db.Column(db.Integer, nullable=True)
+    consecutive_failures = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'exchange': self.exchange,
+            'status': self.status,
+            'last_fetch': self.last_fetch.isoformat() if self.last_fetch else None,
+            'last_success': self.last_success.isoformat() if self.last_success else None,
+            'last_error': self.last_error.isoformat() if self.last_error else None,
+            'error_message': self.error_message,
+            'pairs_count': self.pairs_count,
+            'duration_ms': self.duration_ms,
+            'consecutive_failures': self.consecutive_failures
+        }
+
+
+class FetchLogHourly(db.Model):
+    """Per-exchange fetch attempts, successes and latency per hour."""
+    __tablename__ = 'fetch_logs_1h'
+
+    bucket = db.Column(db.DateTime, primary_key=True)
+    exchange = db.Column(db.String(50), primary_key=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    successes = db.Column(db.Integer, nullable=False, default=0)
+    timed = db.Column(db.Integer, nullable=False, default=0)      # attempts with a duration
+    total_duration_ms = db.Column(db.BigInteger, nullable=False, default=0)
+    max_duration_ms = db.Column(db.Integer, nullable=True)
+
+    def to_dict(self):
+        return {
+            'bucket': self.bucket.isoformat() if self.bucket else None,
+            'exchange': self.exchange,
+            'attempts': self.attempts,
+            'successes': self.successes,
+            'success_rate': round(self.successes / self.attempts * 100, 1) if self.attempts else None,
+            'avg_duration_ms': round(self.total_duration_ms / self.timed) if self.timed else None,
+            'max_duration_ms': self.max_duration_ms
+        }
+
+
 class MarketList(db.Model):
     __tablename__ = 'market_lists'
     
@@ -92,14 +171,23 @@ class OrderbookSnapshot(db.Model):
     symbol = db.Column(db.String(50), nullable=False)
     best_bid = db.Column(db.Float, nullable=True)
     best_ask = db.Column(db.Float, nullable=True)
-    bids = db.Column(db.JSON, nullable=True)
-    asks = db.Column(db.JSON, nullable=True)
+    # Levels packed by bookcodec: float64 (price, qty) pairs, best first
+    bid_levels = db.Column(db.LargeBinary, nullable=True)
+    ask_levels = db.Column(db.LargeBinary, nullable=True)
     fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
     __table_args__ = (
         db.UniqueConstraint('exchange', 'symbol', name='unique_ob_exchange_symbol'),
     )
 
+    @property
+    def bids(self):
+        return bookcodec.to_levels(self.bid_levels)
+
+    @property
+    def asks(self):
+        return bookcodec.to_levels(self.ask_levels)
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -111,3 +199,87 @@ class OrderbookSnapshot(db.Model):
             'asks': self.asks,
             'fetched_at': self.fetched_at.isoformat() if self.fetched_at else None
         }
+
+
+class OrderbookSnapshotHistory(db.Model):
+    """Past orderbook snapshots, appended by save_orderbook_snapshots().
+
+    Levels use the same packed format as OrderbookSnapshot. bookhistory.py
+    keeps the table bounded per (exchange, symbol).
+    """
+    __tablename__ = 'orderbook_snapshot_history'
+
+    fetched_at = db.Column(db.DateTime, primary_key=True)
+    exchange = db.Column(db.String(50), primary_key=True)
+    symbol = db.Column(db.String(50), primary_key=True)
+    best_bid = db.Column(db.Float, nullable=True)
+    best_ask = db.Column(db.Float, nullable=True)
+    bid_levels = db.Column(db.LargeBinary, nullable=True)
+    ask_levels = db.Column(db.LargeBinary, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_ob_history_symbol_fetched', 'symbol', 'fetched_at'),
+        db.Index('ix_ob_history_exchange_fetched', 'exchange', 'fetched_at'),
+    )
+
+
+class TickerHistory(db.Model):
+    """Append-only ticker samples written by history.py.
+
+    On PostgreSQL the table is range-partitioned by day on `ts`; history.py
+    creates the daily partitions and drops them once past retention.
+    """
+    __tablename__ = 'ticker_history'
+
+    ts = db.Column(db.DateTime, primary_key=True)
+    exchange = db.Column(db.String(50), primary_key=True)
+    symbol = db.Column(db.String(50), primary_key=True)
+    price = db.Column(db.Float, nullable=False)
+    volume_24h = db.Column(db.Float, nullable=True)
+    turnover_24h = db.Column(db.Float, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_ticker_history_symbol_ts', 'symbol', 'ts'),
+        {'postgresql_partition_by': 'RANGE (ts)'},
+    )
+
+
+class _TickerRollupMixin:
+    bucket = db.Column(db.DateTime, primary_key=True)
+    exchange = db.Column(db.String(50), primary_key=True)
+    symbol = db.Column(db.String(50), primary_key=True)
+    open = db.Column(db.Float, nullable=False)
+    high = db.Column(db.Float, nullable=False)
+    low = db.Column(db.Float, nullable=False)
+    close = db.Column(db.Float, nullable=False)
+    samples = db.Column(db.Integer, nullable=False, default=1)
+    turnover_24h = db.Column(db.Float, nullable=True)
+
+    def to_dict(self):
+        return {
+            'bucket': self.bucket.isoformat() if self.bucket else None,
+            'exchange': self.exchange,
+            'symbol': self.symbol,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'samples': self.samples,
+            'turnover_24h': self.turnover_24h
+        }
+
+
+class TickerRollup1m(_TickerRollupMixin, db.Model):
+    __tablename__ = 'ticker_history_1m'
+
+    __table_args__ = (
+        db.Index('ix_ticker_history_1m_symbol_bucket', 'symbol', 'bucket'),
+    )
+
+
+class TickerRollup1h(_TickerRollupMixin, db.Model):
+    __tablename__ = 'ticker_history_1h'
+
+    __table_args__ = (
+        db.Index('ix_ticker_history_1h_symbol_bucket', 'symbol', 'bucket'),
+    )
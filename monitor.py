@@ -0,0 +1,210 @@
+"""Server-side hub for the Kraken live monitor.
+
+One Kraken ticker subscription per process keeps the latest bid/ask for every
+catalog symbol. Rows are merged with the DB reference table (rebuilt every
+KRAKEN_MONITOR_REF_INTERVAL seconds) and the spreads are computed here, so
+browsers no longer open their own Kraken socket.
+
+Changed rows are batched every KRAKEN_MONITOR_FLUSH seconds. Each batch is
+serialized once and the same string is handed to every SSE viewer; a viewer
+that falls further behind than the retained history gets a fresh snapshot.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from app import app, db
+from adapters import get_adapter
+from adapters.kraken import KrakenTickerStream
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+FLUSH_SEC = _env_float('KRAKEN_MONITOR_FLUSH', 1.0)
+REF_INTERVAL_SEC = _env_float('KRAKEN_MONITOR_REF_INTERVAL', 60)
+HISTORY = 120          # batches kept for viewers that are briefly behind
+HEARTBEAT_SEC = 15
+
+
+def spread_fields(tick, ref):
+    """Kraken-vs-DB deviation for one symbol (same rules as the monitor table).
+
+    spread1: sell on Kraken — Kraken bid above the cheapest DB price.
+    spread2: buy on Kraken — most expensive DB price above the Kraken ask.
+    """
+    spread1 = spread2 = spread1_pct = spread2_pct = 0.0
+    if tick and ref:
+        min_price, max_price = ref.get('min_price'), ref.get('max_price')
+        if min_price and tick['bid'] > min_price:
+            spread1 = tick['bid'] - min_price
+            spread1_pct = spread1 / min_price * 100
+        if max_price and max_price > tick['ask']:
+            spread2 = max_price - tick['ask']
+            spread2_pct = spread2 / tick['ask'] * 100 if tick['ask'] > 0 else 0.0
+    return {'spread1': spread1, 'spread2': spread2,
+            'spread1_pct': spread1_pct, 'spread2_pct': spread2_pct}
+
+
+class KrakenMonitorHub:
+
+    def __init__(self):
+        self._stream = KrakenTickerStream(get_adapter('KRAKEN'), on_ticker=self._on_ticker)
+        self._cond = threading.Condition()
+        self._reference = {}
+        self._ref_refreshed_at = None
+        self._rows = {}               # symbol -> row dict
+        self._dirty = set()
+        self._batches = deque(maxlen=HISTORY)   # (version, serialized batch)
+        self._snapshot = (-1, None)             # (version, serialized snapshot)
+        self._viewers = 0
+        self._messages = 0
+        self._msg_rate = 0.0
+        self.version = 0
+        self._thread = None
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='kraken-monitor', daemon=True)
+                self._thread.start()
+
+    # ── ingestion ─────────────────────────────────────────────────────────
+
+    def _on_ticker(self, symbol, tick):
+        with self._cond:
+            self._messages += 1
+            self._dirty.add(symbol)
+
+    def refresh_reference(self):
+        from routes import kraken_reference
+        with app.app_context():
+            try:
+                reference = kraken_reference()
+            finally:
+                db.session.remove()
+        with self._cond:
+            symbols = set(self._rows) | set(self._stream.tickers)
+            self._dirty |= {s for s in symbols if reference.get(s) != self._reference.get(s)}
+            self._reference = reference
+            self._ref_refreshed_at = datetime.utcnow().isoformat()
+
+    def _row(self, symbol):
+        tick = self._stream.tickers.get(symbol)
+        ref = self._reference.get(symbol)
+        return dict(spread_fields(tick, ref), symbol=symbol, live=tick, ref=ref)
+
+    def _flush(self, elapsed):
+        self._msg_rate = round(self._messages / elapsed, 1) if elapsed > 0 else 0.0
+        self._messages = 0
+        status = self.status()
+        with self._cond:
+            rows = [self._row(symbol) for symbol in self._dirty]
+            self._dirty.clear()
+            for row in rows:
+                self._rows[row['symbol']] = row
+            self.version += 1
+            self._batches.append((self.version, json.dumps(
+                {'type': 'update', 'version': self.version, 'rows': rows, 'status': status}
+            )))
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            try:
+                self._stream.start()
+                break
+            except Exception as e:
+                logger.error(f'Kraken monitor: could not load pairs: {e}')
+                time.sleep(30)
+        last_ref = 0
+        last_flush = time.time()
+        while True:
+            now = time.time()
+            if now - last_ref >= REF_INTERVAL_SEC:
+                try:
+                    self.refresh_reference()
+                except Exception as e:
+                    logger.error(f'Kraken monitor: reference refresh failed: {e}')
+                last_ref = now
+            if self._dirty or now - last_flush >= HEARTBEAT_SEC:
+                self._flush(now - last_flush)
+                last_flush = now
+            time.sleep(FLUSH_SEC)
+
+    # ── fan-out ───────────────────────────────────────────────────────────
+
+    def status(self):
+        # Called outside self._cond: the stream thread holds its own lock while
+        # calling _on_ticker, so taking them in the other order could deadlock.
+        stream = self._stream.status()
+        return {
+            'connected': stream['connected'],
+            'subscribed': stream['symbols'],
+            'live': len(self._stream.tickers),
+            'msg_rate': self._msg_rate,
+            'ref_count': len(self._reference),
+            'ref_refreshed_at': self._ref_refreshed_at,
+            'viewers': self._viewers,
+        }
+
+    def snapshot(self):
+        """(version, serialized snapshot of every row); rebuilt at most once per version."""
+        status = self.status()
+        with self._cond:
+            if self._snapshot[0] != self.version:
+                self._snapshot = (self.version, json.dumps({
+                    'type': 'snapshot', 'version': self.version,
+                    'rows': list(self._rows.values()), 'status': status,
+                }))
+            return self._snapshot
+
+    def events(self):
+        """Yield serialized batches for one viewer; None means "send a keep-alive"."""
+        self.start()
+        with self._cond:
+            self._viewers += 1
+        try:
+            version, payload = self.snapshot()
+            yield payload
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self.version > version, HEARTBEAT_SEC)
+                    pending = [(v, p) for v, p in self._batches if v > version]
+                    latest = self.version
+                if latest == version:
+                    yield None
+                elif not pending or pending[0][0] != version + 1:
+                    version, payload = self.snapshot()
+                    yield payload
+                else:
+                    for _, payload in pending:
+                        yield payload
+                    version = latest
+        finally:
+            with self._cond:
+                self._viewers -= 1
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_monitor_hub():
+    """Return the process-wide Kraken monitor hub (its feed starts with the first viewer)."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = KrakenMonitorHub()
+    return _hub
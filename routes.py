@@ -1,9 +1,15 @@
 import logging
+import math
+import threading
 from datetime import datetime
 from flask import render_template, jsonify, request, send_from_directory
 from app import app, db
 from models import SpotTicker, FetchLog, MarketList, OrderbookSnapshot
-from adapters import LBankAdapter, HashKeyAdapter, BiconomyAdapter, MEXCAdapter, BitrueAdapter, AscendEXAdapter, BitMartAdapter, DexTradeAdapter, PoloniexAdapter, GateIOAdapter, NizaAdapter, XTAdapter, CoinstoreAdapter, VindaxAdapter, FameEXAdapter, BigOneAdapter, P2PB2BAdapter, DigiFinexAdapter, AzbitAdapter, LatokenAdapter, KrakenAdapter, BingXAdapter, BTSEAdapter, WhiteBitAdapter, HTXAdapter, BinanceAlphaAdapter, UZXAdapter
+from adapters import ADAPTERS, STREAMS, get_adapter, get_engine, get_stream, stream_orderbook
+from arbitrage import get_arbitrage_engine
+from history import record_tickers
+from bookhistory import record_books, maybe_prune as maybe_prune_books
+from fetchlog import log_fetch
 
 logger = logging.getLogger(__name__)
 
@@ -13,566 +19,240 @@ def favicon():
     return send_from_directory('static', 'favicon.png', mimetype='image/png')
 
 
-def get_adapter(exchange):
-    """Return an adapter instance for the given exchange name, or None."""
-    adapter_map = {
-        'LBANK': LBankAdapter, 'HASHKEY': HashKeyAdapter, 'BICONOMY': BiconomyAdapter,
-        'MEXC': MEXCAdapter, 'BITRUE': BitrueAdapter, 'ASCENDEX': AscendEXAdapter,
-        'BITMART': BitMartAdapter, 'DEXTRADE': DexTradeAdapter, 'POLONIEX': PoloniexAdapter,
-        'GATEIO': GateIOAdapter, 'NIZA': NizaAdapter, 'XT': XTAdapter,
-        'COINSTORE': CoinstoreAdapter, 'VINDAX': VindaxAdapter, 'FAMEEX': FameEXAdapter,
-        'BIGONE': BigOneAdapter, 'P2PB2B': P2PB2BAdapter, 'DIGIFINEX': DigiFinexAdapter,
-        'AZBIT': AzbitAdapter, 'LATOKEN': LatokenAdapter, 'KRAKEN': KrakenAdapter,
-        'BINGX': BingXAdapter, 'BTSE': BTSEAdapter, 'WHITEBIT': WhiteBitAdapter,
-        'HTX': HTXAdapter, 'BINANCEALPHA': BinanceAlphaAdapter, 'UZX': UZXAdapter,
-    }
-    cls = adapter_map.get(exchange.upper())
-    return cls() if cls else None
-
-
-def save_tickers(tickers, exchange_name):
-    SpotTicker.query.filter_by(exchange=exchange_name).delete()
-    
-    for ticker in tickers:
-        spot_ticker = SpotTicker(
-            exchange=ticker.exchange,
-            symbol=ticker.symbol,
-            base_currency=ticker.base_currency,
-            quote_currency=ticker.quote_currency,
-            price=ticker.price,
-            volume_24h=ticker.volume_24h,
-            high_24h=ticker.high_24h,
-            low_24h=ticker.low_24h,
-            change_24h=ticker.change_24h,
-            turnover_24h=ticker.turnover_24h,
-            fetched_at=datetime.utcnow()
-        )
-        db.session.add(spot_ticker)
-    
-    db.session.commit()
-
-
-def log_fetch(exchange_name, status, pairs_count=0, error_message=None):
-    log = FetchLog(
-        exchange=exchange_name,
-        status=status,
-        pairs_count=pairs_count,
-        error_message=error_message,
-        fetched_at=datetime.utcnow()
-    )
-    db.session.add(log)
-    db.session.commit()
-
-
-@app.route('/')
-def index():
-    return render_template('index.html')
-
-
-@app.route('/api/fetch/lbank', methods=['POST'])
-def fetch_lbank():
-    try:
-        adapter = LBankAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from LBANK'
-        })
-    except Exception as e:
-        log_fetch('LBANK', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'LBANK',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/hashkey', methods=['POST'])
-def fetch_hashkey():
-    try:
-        adapter = HashKeyAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from HashKey'
-        })
-    except Exception as e:
-        log_fetch('HASHKEY', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'HASHKEY',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/biconomy', methods=['POST'])
-def fetch_biconomy():
-    try:
-        adapter = BiconomyAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Biconomy'
-        })
-    except Exception as e:
-        log_fetch('BICONOMY', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BICONOMY',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/mexc', methods=['POST'])
-def fetch_mexc():
-    try:
-        adapter = MEXCAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from MEXC'
-        })
-    except Exception as e:
-        log_fetch('MEXC', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'MEXC',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/bitrue', methods=['POST'])
-def fetch_bitrue():
-    try:
-        adapter = BitrueAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Bitrue'
-        })
-    except Exception as e:
-        log_fetch('BITRUE', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BITRUE',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/ascendex', methods=['POST'])
-def fetch_ascendex():
-    try:
-        adapter = AscendEXAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from AscendEX'
-        })
-    except Exception as e:
-        log_fetch('ASCENDEX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'ASCENDEX',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/bitmart', methods=['POST'])
-def fetch_bitmart():
-    try:
-        adapter = BitMartAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from BitMart'
-        })
-    except Exception as e:
-        log_fetch('BITMART', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BITMART',
-            'message': str(e)
-        }), 500
+SYMBOL_COUNT_TTL_SEC = 30
 
-
-@app.route('/api/fetch/dextrade', methods=['POST'])
-def fetch_dextrade():
-    try:
-        adapter = DexTradeAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Dex-Trade'
-        })
-    except Exception as e:
-        log_fetch('DEXTRADE', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'DEXTRADE',
-            'message': str(e)
-        }), 500
+_symbol_count_cache = {'data': None, 'ts': 0}
 
 
-@app.route('/api/fetch/poloniex', methods=['POST'])
-def fetch_poloniex():
-    try:
-        adapter = PoloniexAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Poloniex'
-        })
-    except Exception as e:
-        log_fetch('POLONIEX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'POLONIEX',
-            'message': str(e)
-        }), 500
+def get_symbol_exchange_counts():
+    """Return {symbol: exchange_count} over all stored tickers (cached, invalidated on save)."""
+    import time as _time
+    now = _time.time()
+    if _symbol_count_cache['data'] is not None and now - _symbol_count_cache['ts'] < SYMBOL_COUNT_TTL_SEC:
+        return _symbol_count_cache['data']
+    from sqlalchemy import func
+    counts = dict(db.session.query(
+        SpotTicker.symbol, func.count(SpotTicker.exchange)
+    ).group_by(SpotTicker.symbol).all())
+    _symbol_count_cache['data'] = counts
+    _symbol_count_cache['ts'] = now
+    return counts
 
 
-@app.route('/api/fetch/gateio', methods=['POST'])
-def fetch_gateio():
-    try:
-        adapter = GateIOAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Gate.io'
-        })
-    except Exception as e:
-        log_fetch('GATEIO', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'GATEIO',
-            'message': str(e)
-        }), 500
+UPSERT_CHUNK_SIZE = 1000
 
+TICKER_UPSERT_COLUMNS = (
+    'base_currency', 'quote_currency', 'price', 'volume_24h', 'high_24h',
+    'low_24h', 'change_24h', 'turnover_24h', 'fetched_at',
+)
 
-@app.route('/api/fetch/niza', methods=['POST'])
-def fetch_niza():
-    try:
-        adapter = NizaAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Niza'
-        })
-    except Exception as e:
-        log_fetch('NIZA', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'NIZA',
-            'message': str(e)
-        }), 500
 
+def _dialect_insert(model):
+    """Return an INSERT supporting ON CONFLICT for the active database dialect."""
+    if db.engine.dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(model)
+
+
+TICKER_VALUE_COLUMNS = ('price', 'volume_24h', 'high_24h', 'low_24h', 'change_24h', 'turnover_24h')
+
+
+def _ticker_row(ticker, now):
+    return {
+        'exchange': ticker.exchange,
+        'symbol': ticker.symbol,
+        'base_currency': ticker.base_currency,
+        'quote_currency': ticker.quote_currency,
+        'price': ticker.price,
+        'volume_24h': ticker.volume_24h,
+        'high_24h': ticker.high_24h,
+        'low_24h': ticker.low_24h,
+        'change_24h': ticker.change_24h,
+        'turnover_24h': ticker.turnover_24h,
+        'fetched_at': now
+    }
 
-@app.route('/api/fetch/xt', methods=['POST'])
-def fetch_xt():
-    try:
-        adapter = XTAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from XT.com'
-        })
-    except Exception as e:
-        log_fetch('XT', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'XT',
-            'message': str(e)
-        }), 500
 
+def save_tickers(tickers, exchange_name):
+    """Persist only the tickers whose values changed since the last save.
+
+    Every row goes through chunked multi-row INSERT ... ON CONFLICT
+    (exchange, symbol) DO UPDATE statements whose WHERE clause skips rows
+    whose values are unchanged in the database, and RETURNING reports the
+    rows actually written. Symbols the exchange no longer lists are deleted,
+    all in one transaction. The database is the baseline, so writes made by
+    other processes are never mistaken for this one's. Unchanged rows are
+    not rewritten, so their fetched_at marks when the values last changed.
+    Returns per-refresh write stats.
+    """
+    from sqlalchemy import or_
+    now = datetime.utcnow()
+    latest = {ticker.symbol: ticker for ticker in tickers}
+    rows = [_ticker_row(ticker, now) for ticker in latest.values()]
 
-@app.route('/api/fetch/coinstore', methods=['POST'])
-def fetch_coinstore():
     try:
-        adapter = CoinstoreAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Coinstore'
-        })
-    except Exception as e:
-        log_fetch('COINSTORE', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'COINSTORE',
-            'message': str(e)
-        }), 500
-
+        stored = set(db.session.execute(
+            db.select(SpotTicker.symbol).where(SpotTicker.exchange == exchange_name)
+        ).scalars())
+        written = set()
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = _dialect_insert(SpotTicker).values(rows[i:i + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['exchange', 'symbol'],
+                set_={col: stmt.excluded[col] for col in TICKER_UPSERT_COLUMNS},
+                where=or_(*(getattr(SpotTicker, col).is_distinct_from(stmt.excluded[col])
+                            for col in TICKER_VALUE_COLUMNS))
+            ).returning(SpotTicker.symbol)
+            written.update(db.session.execute(stmt).scalars())
+
+        vanished = [sym for sym in stored if sym not in latest]
+        if vanished:
+            SpotTicker.query.filter(
+                SpotTicker.exchange == exchange_name,
+                SpotTicker.symbol.in_(vanished)
+            ).delete(synchronize_session=False)
 
-@app.route('/api/fetch/vindax', methods=['POST'])
-def fetch_vindax():
-    try:
-        adapter = VindaxAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Vindax'
-        })
-    except Exception as e:
-        log_fetch('VINDAX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'VINDAX',
-            'message': str(e)
-        }), 500
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    changed = [r for r in rows if r['symbol'] in written]
+    inserted = sum(1 for sym in written if sym not in stored)
+    _update_reference_index(exchange_name, changed, vanished)
+    get_arbitrage_engine().apply(exchange_name, changed, vanished)
+    record_tickers(exchange_name, changed, lambda: rows)
+    if inserted or vanished:
+        _symbol_count_cache['data'] = None
+
+    stats = {
+        'received': len(rows),
+        'inserted': inserted,
+        'updated': len(changed) - inserted,
+        'deleted': len(vanished),
+        'unchanged': len(rows) - len(changed),
+        'rows_written': len(changed) + len(vanished)
+    }
+    logger.info(f"{exchange_name}: wrote {stats['rows_written']} rows "
+                f"({stats['inserted']} new, {stats['updated']} changed, "
+                f"{stats['deleted']} removed, {stats['unchanged']} unchanged)")
+    return stats
 
 
-@app.route('/api/fetch/fameex', methods=['POST'])
-def fetch_fameex():
-    try:
-        adapter = FameEXAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from FameEX'
-        })
-    except Exception as e:
-        log_fetch('FAMEEX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'FAMEEX',
-            'message': str(e)
-        }), 500
+@app.route('/')
+def index():
+    return render_template('index.html')
 
 
-@app.route('/api/fetch/bigone', methods=['POST'])
-def fetch_bigone():
-    try:
-        adapter = BigOneAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from BigOne'
-        })
-    except Exception as e:
-        log_fetch('BIGONE', 'error', error_message=str(e))
+@app.route('/api/fetch/<exchange>', methods=['POST'])
+def fetch_exchange(exchange):
+    adapter = get_adapter(exchange)
+    if adapter is None:
         return jsonify({
             'status': 'error',
-            'exchange': 'BIGONE',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/p2pb2b', methods=['POST'])
-def fetch_p2pb2b():
+            'exchange': exchange.upper(),
+            'message': f'Unknown exchange: {exchange}'
+        }), 404
+    import time as _time
+    started = _time.time()
     try:
-        adapter = P2PB2BAdapter()
         tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from P2PB2B'
-        })
-    except Exception as e:
-        log_fetch('P2PB2B', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'P2PB2B',
-            'message': str(e)
-        }), 500
+        stats = save_tickers(tickers, adapter.exchange_name)
+        log_fetch(adapter.exchange_name, 'success', len(tickers),
+                  duration_ms=(_time.time() - started) * 1000)
 
-
-@app.route('/api/fetch/digifinex', methods=['POST'])
-def fetch_digifinex():
-    try:
-        adapter = DigiFinexAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
         return jsonify({
             'status': 'success',
             'exchange': adapter.exchange_name,
             'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from DigiFinex'
+            'stats': stats,
+            'coverage': adapter.last_coverage,
+            'message': f'Successfully fetched {len(tickers)} USDT pairs from {adapter.exchange_name}'
         })
     except Exception as e:
-        log_fetch('DIGIFINEX', 'error', error_message=str(e))
+        log_fetch(adapter.exchange_name, 'error', error_message=str(e),
+                  duration_ms=(_time.time() - started) * 1000)
         return jsonify({
             'status': 'error',
-            'exchange': 'DIGIFINEX',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/azbit', methods=['POST'])
-def fetch_azbit():
-    try:
-        adapter = AzbitAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
             'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Azbit'
-        })
-    except Exception as e:
-        log_fetch('AZBIT', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'AZBIT',
             'message': str(e)
         }), 500
 
 
-@app.route('/api/fetch/latoken', methods=['POST'])
-def fetch_latoken():
-    try:
-        adapter = LatokenAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from LATOKEN'
-        })
-    except Exception as e:
-        log_fetch('LATOKEN', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'LATOKEN',
-            'message': str(e)
-        }), 500
-
+def _sse(payload):
+    import json as _json
+    return f"data: {_json.dumps(payload)}\n\n"
 
 
-@app.route('/api/fetch/bingx', methods=['POST'])
-def fetch_bingx():
-    try:
-        adapter = BingXAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from BingX'
-        })
-    except Exception as e:
-        log_fetch('BINGX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BINGX',
-            'message': str(e)
-        }), 500
+@app.route('/api/fetch-all', methods=['POST'])
+def fetch_all_exchanges():
+    """Refresh every exchange's tickers concurrently, streaming results as SSE.
 
+    Each exchange is persisted as soon as its fetch completes; exchanges that
+    exceed their adapter's ticker_deadline are reported as timed out. The
+    logged duration_ms is per exchange: its own fetch (submit to completion)
+    plus its save, not time spent waiting on other exchanges.
+    """
+    import time as _time
+    from concurrent.futures import as_completed
+    from flask import Response, stream_with_context
+
+    data = request.get_json(silent=True) or {}
+    requested = [e.upper() for e in data.get('exchanges') or ADAPTERS]
+    adapters = [get_adapter(e) for e in requested if e in ADAPTERS]
+
+    def generate():
+        started = _time.time()
+        engine = get_engine()
+        futures, submitted, finished = {}, {}, {}
+        for a in adapters:
+            future = engine.submit(engine.fetch_tickers(a, timeout=a.ticker_deadline))
+            submitted[future] = _time.monotonic()
+            future.add_done_callback(lambda f: finished.setdefault(f, _time.monotonic()))
+            futures[future] = a
+        yield _sse({'type': 'start', 'total': len(futures),
+                    'exchanges': [a.exchange_name for a in adapters]})
+
+        done = 0
+        for future in as_completed(futures):
+            adapter = futures[future]
+            exchange = adapter.exchange_name
+            # This exchange's own fetch time, not the wait for earlier saves
+            fetch_sec = finished.get(future, _time.monotonic()) - submitted[future]
+            save_started = _time.monotonic()
+            try:
+                tickers = future.result()
+                stats = save_tickers(tickers, exchange)
+                log_fetch(exchange, 'success', len(tickers),
+                          duration_ms=(fetch_sec + _time.monotonic() - save_started) * 1000)
+                result = {
+                    'status': 'success',
+                    'pairs_count': len(tickers),
+                    'stats': stats,
+                    'coverage': adapter.last_coverage,
+                    'message': f'Successfully fetched {len(tickers)} USDT pairs'
+                }
+            except TimeoutError:
+                message = f'Timed out after {adapter.ticker_deadline:g}s'
+                log_fetch(exchange, 'error', error_message=message,
+                          duration_ms=(fetch_sec + _time.monotonic() - save_started) * 1000)
+                result = {'status': 'error', 'message': message}
+            except Exception as e:
+                log_fetch(exchange, 'error', error_message=str(e),
+                          duration_ms=(fetch_sec + _time.monotonic() - save_started) * 1000)
+                result = {'status': 'error', 'message': str(e)}
+            done += 1
+            yield _sse(dict(result, type='exchange', exchange=exchange,
+                            done=done, total=len(futures),
+                            elapsed=round(_time.time() - started, 1)))
 
-@app.route('/api/fetch/kraken', methods=['POST'])
-def fetch_kraken():
-    try:
-        adapter = KrakenAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
+        yield _sse({'type': 'done', 'total': len(futures),
+                    'duration': round(_time.time() - started, 1)})
 
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from Kraken'
-        })
-    except Exception as e:
-        log_fetch('KRAKEN', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'KRAKEN',
-            'message': str(e)
-        }), 500
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/tickers')
@@ -599,6 +279,8 @@ def get_tickers():
         '7': None
     }
     
+    symbol_counts = get_symbol_exchange_counts()
+    
     query = SpotTicker.query
     
     if exchange_filter:
@@ -608,8 +290,8 @@ def get_tickers():
         import re as _re
         _leveraged = _re.compile(r'\d+[LSls](USDT)?$')
         leveraged_symbols = [
-            t.symbol for t in SpotTicker.query.with_entities(SpotTicker.symbol).distinct()
-            if _leveraged.search(t.symbol.split('/')[0])
+            sym for sym in symbol_counts
+            if _leveraged.search(sym.split('/')[0])
         ]
         if leveraged_symbols:
             query = query.filter(SpotTicker.symbol.notin_(leveraged_symbols))
@@ -624,21 +306,24 @@ def get_tickers():
     
     if multi_exchange:
         from sqlalchemy import func
-        symbol_counts = db.session.query(
-            SpotTicker.symbol,
-            func.count(SpotTicker.exchange).label('exchange_count')
+        multi_symbols = db.session.query(
+            SpotTicker.symbol
         ).group_by(SpotTicker.symbol).having(func.count(SpotTicker.exchange) > 1).subquery()
         
-        query = query.join(symbol_counts, SpotTicker.symbol == symbol_counts.c.symbol)
+        query = query.join(multi_symbols, SpotTicker.symbol == multi_symbols.c.symbol)
     
-    blacklist_entries = MarketList.query.filter_by(list_type='blacklist').all()
-    whitelist_entries = MarketList.query.filter_by(list_type='whitelist').all()
-    walletlock_entries = MarketList.query.filter_by(list_type='wallet_lock').all()
-    blacklist_set = {(e.exchange, e.symbol) for e in blacklist_entries}
-    whitelist_set = {(e.exchange, e.symbol) for e in whitelist_entries}
-    walletlock_set = {(e.exchange, e.symbol) for e in walletlock_entries}
+    blacklist_set, whitelist_set, walletlock_set = set(), set(), set()
+    for ex, sym, list_type in db.session.query(
+        MarketList.exchange, MarketList.symbol, MarketList.list_type
+    ).all():
+        if list_type == 'blacklist':
+            blacklist_set.add((ex, sym))
+        elif list_type == 'whitelist':
+            whitelist_set.add((ex, sym))
+        elif list_type == 'wallet_lock':
+            walletlock_set.add((ex, sym))
     
-    from sqlalchemy import or_, and_, not_, tuple_
+    from sqlalchemy import or_, and_, not_
     
     if list_filter == 'hide_blacklist' and blacklist_set:
         blacklist_conditions = [and_(SpotTicker.exchange == ex, SpotTicker.symbol == sym) for ex, sym in blacklist_set]
@@ -656,12 +341,12 @@ def get_tickers():
         else:
             query = query.filter(db.literal(False))
     
-    total_records = SpotTicker.query.count()
     filtered_records = query.count()
     
-    from sqlalchemy import func
+    # comparablePairs comes from the cached symbol -> exchange count aggregate;
+    # only the exchange-scoped view needs that exchange's symbol list.
     if exchange_filter:
-        base_query = SpotTicker.query.filter(SpotTicker.exchange == exchange_filter)
+        base_query = db.session.query(SpotTicker.symbol).filter(SpotTicker.exchange == exchange_filter)
         if search_value:
             base_query = base_query.filter(
                 db.or_(
@@ -669,16 +354,9 @@ def get_tickers():
                     SpotTicker.base_currency.ilike(f'%{search_value}%')
                 )
             )
-        filtered_symbols = [t.symbol for t in base_query.all()]
-        multi_symbol_counts = db.session.query(
-            SpotTicker.symbol
-        ).filter(SpotTicker.symbol.in_(filtered_symbols)).group_by(SpotTicker.symbol).having(func.count(SpotTicker.exchange) > 1).all()
-        comparable_pairs = len(multi_symbol_counts)
+        comparable_pairs = sum(1 for (sym,) in base_query.all() if symbol_counts.get(sym, 0) > 1)
     else:
-        multi_symbol_counts = db.session.query(
-            SpotTicker.symbol
-        ).group_by(SpotTicker.symbol).having(func.count(SpotTicker.exchange) > 1).all()
-        comparable_pairs = len(multi_symbol_counts)
+        comparable_pairs = sum(1 for c in symbol_counts.values() if c > 1)
     
     order_col = column_map.get(order_column, SpotTicker.symbol)
     if order_col is not None:
@@ -691,14 +369,14 @@ def get_tickers():
     
     tickers = query.offset(start).limit(length).all()
     
-    all_tickers = SpotTicker.query.all()
+    # Peers are looked up only for the symbols on the current page
     symbol_map = {}
-    for t in all_tickers:
-        if t.symbol not in symbol_map:
-            symbol_map[t.symbol] = {}
-        ticker_data = t.to_dict()
-        ticker_data['is_blacklisted'] = (t.exchange, t.symbol) in blacklist_set
-        symbol_map[t.symbol][t.exchange] = ticker_data
+    page_symbols = {t.symbol for t in tickers}
+    if page_symbols:
+        for t in SpotTicker.query.filter(SpotTicker.symbol.in_(page_symbols)).all():
+            ticker_data = t.to_dict()
+            ticker_data['is_blacklisted'] = (t.exchange, t.symbol) in blacklist_set
+            symbol_map.setdefault(t.symbol, {})[t.exchange] = ticker_data
     
     data = []
     for t in tickers:
@@ -733,366 +411,59 @@ def get_logs():
     })
 
 
+@app.route('/api/logs/hourly')
+def get_logs_hourly():
+    """Hourly fetch success rate and latency per exchange (`exchange`, `hours`)."""
+    from fetchlog import hourly
+    exchange = request.args.get('exchange', '').upper() or None
+    hours = min(max(request.args.get('hours', 24, type=int), 1), 24 * 90)
+    return jsonify({'status': 'success', 'data': [r.to_dict() for r in hourly(exchange, hours)]})
+
+
 @app.route('/api/status')
 def get_status():
-    lbank_log = FetchLog.query.filter_by(exchange='LBANK').order_by(FetchLog.fetched_at.desc()).first()
-    hashkey_log = FetchLog.query.filter_by(exchange='HASHKEY').order_by(FetchLog.fetched_at.desc()).first()
-    biconomy_log = FetchLog.query.filter_by(exchange='BICONOMY').order_by(FetchLog.fetched_at.desc()).first()
-    mexc_log = FetchLog.query.filter_by(exchange='MEXC').order_by(FetchLog.fetched_at.desc()).first()
-    bitrue_log = FetchLog.query.filter_by(exchange='BITRUE').order_by(FetchLog.fetched_at.desc()).first()
-    ascendex_log = FetchLog.query.filter_by(exchange='ASCENDEX').order_by(FetchLog.fetched_at.desc()).first()
-    bitmart_log = FetchLog.query.filter_by(exchange='BITMART').order_by(FetchLog.fetched_at.desc()).first()
-    dextrade_log = FetchLog.query.filter_by(exchange='DEXTRADE').order_by(FetchLog.fetched_at.desc()).first()
-    poloniex_log = FetchLog.query.filter_by(exchange='POLONIEX').order_by(FetchLog.fetched_at.desc()).first()
-    gateio_log = FetchLog.query.filter_by(exchange='GATEIO').order_by(FetchLog.fetched_at.desc()).first()
-    niza_log = FetchLog.query.filter_by(exchange='NIZA').order_by(FetchLog.fetched_at.desc()).first()
-    xt_log = FetchLog.query.filter_by(exchange='XT').order_by(FetchLog.fetched_at.desc()).first()
-    coinstore_log = FetchLog.query.filter_by(exchange='COINSTORE').order_by(FetchLog.fetched_at.desc()).first()
-    vindax_log = FetchLog.query.filter_by(exchange='VINDAX').order_by(FetchLog.fetched_at.desc()).first()
-    fameex_log = FetchLog.query.filter_by(exchange='FAMEEX').order_by(FetchLog.fetched_at.desc()).first()
-    bigone_log = FetchLog.query.filter_by(exchange='BIGONE').order_by(FetchLog.fetched_at.desc()).first()
-    p2pb2b_log = FetchLog.query.filter_by(exchange='P2PB2B').order_by(FetchLog.fetched_at.desc()).first()
-    digifinex_log = FetchLog.query.filter_by(exchange='DIGIFINEX').order_by(FetchLog.fetched_at.desc()).first()
-    azbit_log = FetchLog.query.filter_by(exchange='AZBIT').order_by(FetchLog.fetched_at.desc()).first()
-    latoken_log = FetchLog.query.filter_by(exchange='LATOKEN').order_by(FetchLog.fetched_at.desc()).first()
-    kraken_log = FetchLog.query.filter_by(exchange='KRAKEN').order_by(FetchLog.fetched_at.desc()).first()
-    bingx_log = FetchLog.query.filter_by(exchange='BINGX').order_by(FetchLog.fetched_at.desc()).first()
-    btse_log = FetchLog.query.filter_by(exchange='BTSE').order_by(FetchLog.fetched_at.desc()).first()
-    whitebit_log = FetchLog.query.filter_by(exchange='WHITEBIT').order_by(FetchLog.fetched_at.desc()).first()
-    htx_log = FetchLog.query.filter_by(exchange='HTX').order_by(FetchLog.fetched_at.desc()).first()
-    binancealpha_log = FetchLog.query.filter_by(exchange='BINANCEALPHA').order_by(FetchLog.fetched_at.desc()).first()
-    uzx_log = FetchLog.query.filter_by(exchange='UZX').order_by(FetchLog.fetched_at.desc()).first()
-    
-    lbank_count = SpotTicker.query.filter_by(exchange='LBANK').count()
-    hashkey_count = SpotTicker.query.filter_by(exchange='HASHKEY').count()
-    biconomy_count = SpotTicker.query.filter_by(exchange='BICONOMY').count()
-    mexc_count = SpotTicker.query.filter_by(exchange='MEXC').count()
-    bitrue_count = SpotTicker.query.filter_by(exchange='BITRUE').count()
-    ascendex_count = SpotTicker.query.filter_by(exchange='ASCENDEX').count()
-    bitmart_count = SpotTicker.query.filter_by(exchange='BITMART').count()
-    dextrade_count = SpotTicker.query.filter_by(exchange='DEXTRADE').count()
-    poloniex_count = SpotTicker.query.filter_by(exchange='POLONIEX').count()
-    gateio_count = SpotTicker.query.filter_by(exchange='GATEIO').count()
-    niza_count = SpotTicker.query.filter_by(exchange='NIZA').count()
-    xt_count = SpotTicker.query.filter_by(exchange='XT').count()
-    coinstore_count = SpotTicker.query.filter_by(exchange='COINSTORE').count()
-    vindax_count = SpotTicker.query.filter_by(exchange='VINDAX').count()
-    fameex_count = SpotTicker.query.filter_by(exchange='FAMEEX').count()
-    bigone_count = SpotTicker.query.filter_by(exchange='BIGONE').count()
-    p2pb2b_count = SpotTicker.query.filter_by(exchange='P2PB2B').count()
-    digifinex_count = SpotTicker.query.filter_by(exchange='DIGIFINEX').count()
-    azbit_count = SpotTicker.query.filter_by(exchange='AZBIT').count()
-    latoken_count = SpotTicker.query.filter_by(exchange='LATOKEN').count()
-    kraken_count = SpotTicker.query.filter_by(exchange='KRAKEN').count()
-    bingx_count = SpotTicker.query.filter_by(exchange='BINGX').count()
-    btse_count = SpotTicker.query.filter_by(exchange='BTSE').count()
-    whitebit_count = SpotTicker.query.filter_by(exchange='WHITEBIT').count()
-    htx_count = SpotTicker.query.filter_by(exchange='HTX').count()
-    binancealpha_count = SpotTicker.query.filter_by(exchange='BINANCEALPHA').count()
-    uzx_count = SpotTicker.query.filter_by(exchange='UZX').count()
-    
-    exchanges = ['LBANK', 'HASHKEY', 'BICONOMY', 'MEXC', 'BITRUE', 'ASCENDEX', 
-                 'BITMART', 'DEXTRADE', 'POLONIEX', 'GATEIO', 'NIZA', 'XT', 
-                 'COINSTORE', 'VINDAX', 'FAMEEX', 'BIGONE', 'P2PB2B', 'DIGIFINEX', 'AZBIT', 'LATOKEN', 'KRAKEN', 'BINGX', 'BTSE', 'WHITEBIT', 'HTX', 'BINANCEALPHA', 'UZX']
-    
     from sqlalchemy import func
-    blacklist_counts = dict(db.session.query(
-        MarketList.exchange, func.count(MarketList.id)
-    ).filter_by(list_type='blacklist').group_by(MarketList.exchange).all())
-    
-    whitelist_counts = dict(db.session.query(
-        MarketList.exchange, func.count(MarketList.id)
-    ).filter_by(list_type='whitelist').group_by(MarketList.exchange).all())
-    
-    walletlock_counts = dict(db.session.query(
-        MarketList.exchange, func.count(MarketList.id)
-    ).filter_by(list_type='wallet_lock').group_by(MarketList.exchange).all())
-    
-    return jsonify({
-        'lbank': {
-            'last_fetch': lbank_log.fetched_at.isoformat() if lbank_log else None,
-            'status': lbank_log.status if lbank_log else 'never',
-            'pairs_count': lbank_count,
-            'blacklist_count': blacklist_counts.get('LBANK', 0),
-            'whitelist_count': whitelist_counts.get('LBANK', 0),
-            'walletlock_count': walletlock_counts.get('LBANK', 0)
-        },
-        'hashkey': {
-            'last_fetch': hashkey_log.fetched_at.isoformat() if hashkey_log else None,
-            'status': hashkey_log.status if hashkey_log else 'never',
-            'pairs_count': hashkey_count,
-            'blacklist_count': blacklist_counts.get('HASHKEY', 0),
-            'whitelist_count': whitelist_counts.get('HASHKEY', 0),
-            'walletlock_count': walletlock_counts.get('HASHKEY', 0)
-        },
-        'biconomy': {
-            'last_fetch': biconomy_log.fetched_at.isoformat() if biconomy_log else None,
-            'status': biconomy_log.status if biconomy_log else 'never',
-            'pairs_count': biconomy_count,
-            'blacklist_count': blacklist_counts.get('BICONOMY', 0),
-            'whitelist_count': whitelist_counts.get('BICONOMY', 0),
-            'walletlock_count': walletlock_counts.get('BICONOMY', 0)
-        },
-        'mexc': {
-            'last_fetch': mexc_log.fetched_at.isoformat() if mexc_log else None,
-            'status': mexc_log.status if mexc_log else 'never',
-            'pairs_count': mexc_count,
-            'blacklist_count': blacklist_counts.get('MEXC', 0),
-            'whitelist_count': whitelist_counts.get('MEXC', 0),
-            'walletlock_count': walletlock_counts.get('MEXC', 0)
-        },
-        'bitrue': {
-            'last_fetch': bitrue_log.fetched_at.isoformat() if bitrue_log else None,
-            'status': bitrue_log.status if bitrue_log else 'never',
-            'pairs_count': bitrue_count,
-            'blacklist_count': blacklist_counts.get('BITRUE', 0),
-            'whitelist_count': whitelist_counts.get('BITRUE', 0),
-            'walletlock_count': walletlock_counts.get('BITRUE', 0)
-        },
-        'ascendex': {
-            'last_fetch': ascendex_log.fetched_at.isoformat() if ascendex_log else None,
-            'status': ascendex_log.status if ascendex_log else 'never',
-            'pairs_count': ascendex_count,
-            'blacklist_count': blacklist_counts.get('ASCENDEX', 0),
-            'whitelist_count': whitelist_counts.get('ASCENDEX', 0),
-            'walletlock_count': walletlock_counts.get('ASCENDEX', 0)
-        },
-        'bitmart': {
-            'last_fetch': bitmart_log.fetched_at.isoformat() if bitmart_log else None,
-            'status': bitmart_log.status if bitmart_log else 'never',
-            'pairs_count': bitmart_count,
-            'blacklist_count': blacklist_counts.get('BITMART', 0),
-            'whitelist_count': whitelist_counts.get('BITMART', 0),
-            'walletlock_count': walletlock_counts.get('BITMART', 0)
-        },
-        'dextrade': {
-            'last_fetch': dextrade_log.fetched_at.isoformat() if dextrade_log else None,
-            'status': dextrade_log.status if dextrade_log else 'never',
-            'pairs_count': dextrade_count,
-            'blacklist_count': blacklist_counts.get('DEXTRADE', 0),
-            'whitelist_count': whitelist_counts.get('DEXTRADE', 0),
-            'walletlock_count': walletlock_counts.get('DEXTRADE', 0)
-        },
-        'poloniex': {
-            'last_fetch': poloniex_log.fetched_at.isoformat() if poloniex_log else None,
-            'status': poloniex_log.status if poloniex_log else 'never',
-            'pairs_count': poloniex_count,
-            'blacklist_count': blacklist_counts.get('POLONIEX', 0),
-            'whitelist_count': whitelist_counts.get('POLONIEX', 0),
-            'walletlock_count': walletlock_counts.get('POLONIEX', 0)
-        },
-        'gateio': {
-            'last_fetch': gateio_log.fetched_at.isoformat() if gateio_log else None,
-            'status': gateio_log.status if gateio_log else 'never',
-            'pairs_count': gateio_count,
-            'blacklist_count': blacklist_counts.get('GATEIO', 0),
-            'whitelist_count': whitelist_counts.get('GATEIO', 0),
-            'walletlock_count': walletlock_counts.get('GATEIO', 0)
-        },
-        'niza': {
-            'last_fetch': niza_log.fetched_at.isoformat() if niza_log else None,
-            'status': niza_log.status if niza_log else 'never',
-            'pairs_count': niza_count,
-            'blacklist_count': blacklist_counts.get('NIZA', 0),
-            'whitelist_count': whitelist_counts.get('NIZA', 0),
-            'walletlock_count': walletlock_counts.get('NIZA', 0)
-        },
-        'xt': {
-            'last_fetch': xt_log.fetched_at.isoformat() if xt_log else None,
-            'status': xt_log.status if xt_log else 'never',
-            'pairs_count': xt_count,
-            'blacklist_count': blacklist_counts.get('XT', 0),
-            'whitelist_count': whitelist_counts.get('XT', 0),
-            'walletlock_count': walletlock_counts.get('XT', 0)
-        },
-        'coinstore': {
-            'last_fetch': coinstore_log.fetched_at.isoformat() if coinstore_log else None,
-            'status': coinstore_log.status if coinstore_log else 'never',
-            'pairs_count': coinstore_count,
-            'blacklist_count': blacklist_counts.get('COINSTORE', 0),
-            'whitelist_count': whitelist_counts.get('COINSTORE', 0),
-            'walletlock_count': walletlock_counts.get('COINSTORE', 0)
-        },
-        'vindax': {
-            'last_fetch': vindax_log.fetched_at.isoformat() if vindax_log else None,
-            'status': vindax_log.status if vindax_log else 'never',
-            'pairs_count': vindax_count,
-            'blacklist_count': blacklist_counts.get('VINDAX', 0),
-            'whitelist_count': whitelist_counts.get('VINDAX', 0),
-            'walletlock_count': walletlock_counts.get('VINDAX', 0)
-        },
-        'fameex': {
-            'last_fetch': fameex_log.fetched_at.isoformat() if fameex_log else None,
-            'status': fameex_log.status if fameex_log else 'never',
-            'pairs_count': fameex_count,
-            'blacklist_count': blacklist_counts.get('FAMEEX', 0),
-            'whitelist_count': whitelist_counts.get('FAMEEX', 0),
-            'walletlock_count': walletlock_counts.get('FAMEEX', 0)
-        },
-        'bigone': {
-            'last_fetch': bigone_log.fetched_at.isoformat() if bigone_log else None,
-            'status': bigone_log.status if bigone_log else 'never',
-            'pairs_count': bigone_count,
-            'blacklist_count': blacklist_counts.get('BIGONE', 0),
-            'whitelist_count': whitelist_counts.get('BIGONE', 0),
-            'walletlock_count': walletlock_counts.get('BIGONE', 0)
-        },
-        'p2pb2b': {
-            'last_fetch': p2pb2b_log.fetched_at.isoformat() if p2pb2b_log else None,
-            'status': p2pb2b_log.status if p2pb2b_log else 'never',
-            'pairs_count': p2pb2b_count,
-            'blacklist_count': blacklist_counts.get('P2PB2B', 0),
-            'whitelist_count': whitelist_counts.get('P2PB2B', 0),
-            'walletlock_count': walletlock_counts.get('P2PB2B', 0)
-        },
-        'digifinex': {
-            'last_fetch': digifinex_log.fetched_at.isoformat() if digifinex_log else None,
-            'status': digifinex_log.status if digifinex_log else 'never',
-            'pairs_count': digifinex_count,
-            'blacklist_count': blacklist_counts.get('DIGIFINEX', 0),
-            'whitelist_count': whitelist_counts.get('DIGIFINEX', 0),
-            'walletlock_count': walletlock_counts.get('DIGIFINEX', 0)
-        },
-        'azbit': {
-            'last_fetch': azbit_log.fetched_at.isoformat() if azbit_log else None,
-            'status': azbit_log.status if azbit_log else 'never',
-            'pairs_count': azbit_count,
-            'blacklist_count': blacklist_counts.get('AZBIT', 0),
-            'whitelist_count': whitelist_counts.get('AZBIT', 0),
-            'walletlock_count': walletlock_counts.get('AZBIT', 0)
-        },
-        'latoken': {
-            'last_fetch': latoken_log.fetched_at.isoformat() if latoken_log else None,
-            'status': latoken_log.status if latoken_log else 'never',
-            'pairs_count': latoken_count,
-            'blacklist_count': blacklist_counts.get('LATOKEN', 0),
-            'whitelist_count': whitelist_counts.get('LATOKEN', 0),
-            'walletlock_count': walletlock_counts.get('LATOKEN', 0)
-        },
-        'kraken': {
-            'last_fetch': kraken_log.fetched_at.isoformat() if kraken_log else None,
-            'status': kraken_log.status if kraken_log else 'never',
-            'pairs_count': kraken_count,
-            'blacklist_count': blacklist_counts.get('KRAKEN', 0),
-            'whitelist_count': whitelist_counts.get('KRAKEN', 0),
-            'walletlock_count': walletlock_counts.get('KRAKEN', 0)
-        },
-        'bingx': {
-            'last_fetch': bingx_log.fetched_at.isoformat() if bingx_log else None,
-            'status': bingx_log.status if bingx_log else 'never',
-            'pairs_count': bingx_count,
-            'blacklist_count': blacklist_counts.get('BINGX', 0),
-            'whitelist_count': whitelist_counts.get('BINGX', 0),
-            'walletlock_count': walletlock_counts.get('BINGX', 0)
-        },
-        'btse': {
-            'last_fetch': btse_log.fetched_at.isoformat() if btse_log else None,
-            'status': btse_log.status if btse_log else 'never',
-            'pairs_count': btse_count,
-            'blacklist_count': blacklist_counts.get('BTSE', 0),
-            'whitelist_count': whitelist_counts.get('BTSE', 0),
-            'walletlock_count': walletlock_counts.get('BTSE', 0)
-        },
-        'whitebit': {
-            'last_fetch': whitebit_log.fetched_at.isoformat() if whitebit_log else None,
-            'status': whitebit_log.status if whitebit_log else 'never',
-            'pairs_count': whitebit_count,
-            'blacklist_count': blacklist_counts.get('WHITEBIT', 0),
-            'whitelist_count': whitelist_counts.get('WHITEBIT', 0),
-            'walletlock_count': walletlock_counts.get('WHITEBIT', 0)
-        },
-        'htx': {
-            'last_fetch': htx_log.fetched_at.isoformat() if htx_log else None,
-            'status': htx_log.status if htx_log else 'never',
-            'pairs_count': htx_count,
-            'blacklist_count': blacklist_counts.get('HTX', 0),
-            'whitelist_count': whitelist_counts.get('HTX', 0),
-            'walletlock_count': walletlock_counts.get('HTX', 0)
-        },
-        'binancealpha': {
-            'last_fetch': binancealpha_log.fetched_at.isoformat() if binancealpha_log else None,
-            'status': binancealpha_log.status if binancealpha_log else 'never',
-            'pairs_count': binancealpha_count,
-            'blacklist_count': blacklist_counts.get('BINANCEALPHA', 0),
-            'whitelist_count': whitelist_counts.get('BINANCEALPHA', 0),
-            'walletlock_count': walletlock_counts.get('BINANCEALPHA', 0)
-        },
-        'uzx': {
-            'last_fetch': uzx_log.fetched_at.isoformat() if uzx_log else None,
-            'status': uzx_log.status if uzx_log else 'never',
-            'pairs_count': uzx_count,
-            'blacklist_count': blacklist_counts.get('UZX', 0),
-            'whitelist_count': whitelist_counts.get('UZX', 0),
-            'walletlock_count': walletlock_counts.get('UZX', 0)
+    from fetchlog import exchange_statuses
+
+    # One exchange_status row per exchange, kept current by log_fetch()
+    statuses = exchange_statuses()
+
+    list_counts = {}
+    for ex, list_type, count in db.session.query(
+        MarketList.exchange, MarketList.list_type, func.count(MarketList.id)
+    ).group_by(MarketList.exchange, MarketList.list_type).all():
+        list_counts[(ex, list_type)] = count
+
+    result = {}
+    for exchange in ADAPTERS:
+        st = statuses.get(exchange)
+        result[exchange.lower()] = {
+            'last_fetch': st.last_fetch.isoformat() if st else None,
+            'status': st.status if st else 'never',
+            'pairs_count': st.pairs_count if st else 0,
+            'duration_ms': st.duration_ms if st else None,
+            'consecutive_failures': st.consecutive_failures if st else 0,
+            'blacklist_count': list_counts.get((exchange, 'blacklist'), 0),
+            'whitelist_count': list_counts.get((exchange, 'whitelist'), 0),
+            'walletlock_count': list_counts.get((exchange, 'wallet_lock'), 0)
         }
-    })
+
+    return jsonify(result)
 
 
 @app.route('/api/depth/<exchange>/<path:symbol>')
 def get_depth(exchange, symbol):
     """Get mini orderbook depth (top 5 bids/asks with total USDT)"""
     try:
-        if exchange.upper() == 'LBANK':
-            adapter = LBankAdapter()
-        elif exchange.upper() == 'HASHKEY':
-            adapter = HashKeyAdapter()
-        elif exchange.upper() == 'BICONOMY':
-            adapter = BiconomyAdapter()
-        elif exchange.upper() == 'MEXC':
-            adapter = MEXCAdapter()
-        elif exchange.upper() == 'BITRUE':
-            adapter = BitrueAdapter()
-        elif exchange.upper() == 'ASCENDEX':
-            adapter = AscendEXAdapter()
-        elif exchange.upper() == 'BITMART':
-            adapter = BitMartAdapter()
-        elif exchange.upper() == 'DEXTRADE':
-            adapter = DexTradeAdapter()
-        elif exchange.upper() == 'POLONIEX':
-            adapter = PoloniexAdapter()
-        elif exchange.upper() == 'GATEIO':
-            adapter = GateIOAdapter()
-        elif exchange.upper() == 'NIZA':
-            adapter = NizaAdapter()
-        elif exchange.upper() == 'XT':
-            adapter = XTAdapter()
-        elif exchange.upper() == 'COINSTORE':
-            adapter = CoinstoreAdapter()
-        elif exchange.upper() == 'VINDAX':
-            adapter = VindaxAdapter()
-        elif exchange.upper() == 'FAMEEX':
-            adapter = FameEXAdapter()
-        elif exchange.upper() == 'BIGONE':
-            adapter = BigOneAdapter()
-        elif exchange.upper() == 'P2PB2B':
-            adapter = P2PB2BAdapter()
-        elif exchange.upper() == 'DIGIFINEX':
-            adapter = DigiFinexAdapter()
-        elif exchange.upper() == 'AZBIT':
-            adapter = AzbitAdapter()
-        elif exchange.upper() == 'LATOKEN':
-            adapter = LatokenAdapter()
-        elif exchange.upper() == 'KRAKEN':
-            adapter = KrakenAdapter()
-        elif exchange.upper() == 'BINGX':
-            adapter = BingXAdapter()
-        elif exchange.upper() == 'BTSE':
-            adapter = BTSEAdapter()
-        elif exchange.upper() == 'WHITEBIT':
-            adapter = WhiteBitAdapter()
-        elif exchange.upper() == 'HTX':
-            adapter = HTXAdapter()
-        elif exchange.upper() == 'BINANCEALPHA':
-            adapter = BinanceAlphaAdapter()
-        elif exchange.upper() == 'UZX':
-            adapter = UZXAdapter()
-        else:
+        adapter = get_adapter(exchange)
+        if adapter is None:
             return jsonify({
                 'status': 'error',
                 'message': f'Unknown exchange: {exchange}'
             }), 400
         
-        orderbook = adapter.fetch_orderbook(symbol, limit=5)
+        orderbook = stream_orderbook(exchange, symbol, 5) or get_engine().run(
+            get_engine().fetch_orderbook(adapter, symbol, 5))
         
         def get_price_amount(entry):
             if isinstance(entry, dict):
@@ -1145,67 +516,15 @@ def get_orderbook(exchange, symbol):
     try:
         limit = request.args.get('limit', 20, type=int)
         
-        if exchange.upper() == 'LBANK':
-            adapter = LBankAdapter()
-        elif exchange.upper() == 'HASHKEY':
-            adapter = HashKeyAdapter()
-        elif exchange.upper() == 'BICONOMY':
-            adapter = BiconomyAdapter()
-        elif exchange.upper() == 'MEXC':
-            adapter = MEXCAdapter()
-        elif exchange.upper() == 'BITRUE':
-            adapter = BitrueAdapter()
-        elif exchange.upper() == 'ASCENDEX':
-            adapter = AscendEXAdapter()
-        elif exchange.upper() == 'BITMART':
-            adapter = BitMartAdapter()
-        elif exchange.upper() == 'DEXTRADE':
-            adapter = DexTradeAdapter()
-        elif exchange.upper() == 'POLONIEX':
-            adapter = PoloniexAdapter()
-        elif exchange.upper() == 'GATEIO':
-            adapter = GateIOAdapter()
-        elif exchange.upper() == 'NIZA':
-            adapter = NizaAdapter()
-        elif exchange.upper() == 'XT':
-            adapter = XTAdapter()
-        elif exchange.upper() == 'COINSTORE':
-            adapter = CoinstoreAdapter()
-        elif exchange.upper() == 'VINDAX':
-            adapter = VindaxAdapter()
-        elif exchange.upper() == 'FAMEEX':
-            adapter = FameEXAdapter()
-        elif exchange.upper() == 'BIGONE':
-            adapter = BigOneAdapter()
-        elif exchange.upper() == 'P2PB2B':
-            adapter = P2PB2BAdapter()
-        elif exchange.upper() == 'DIGIFINEX':
-            adapter = DigiFinexAdapter()
-        elif exchange.upper() == 'AZBIT':
-            adapter = AzbitAdapter()
-        elif exchange.upper() == 'LATOKEN':
-            adapter = LatokenAdapter()
-        elif exchange.upper() == 'KRAKEN':
-            adapter = KrakenAdapter()
-        elif exchange.upper() == 'BINGX':
-            adapter = BingXAdapter()
-        elif exchange.upper() == 'BTSE':
-            adapter = BTSEAdapter()
-        elif exchange.upper() == 'WHITEBIT':
-            adapter = WhiteBitAdapter()
-        elif exchange.upper() == 'HTX':
-            adapter = HTXAdapter()
-        elif exchange.upper() == 'BINANCEALPHA':
-            adapter = BinanceAlphaAdapter()
-        elif exchange.upper() == 'UZX':
-            adapter = UZXAdapter()
-        else:
+        adapter = get_adapter(exchange)
+        if adapter is None:
             return jsonify({
                 'status': 'error',
                 'message': f'Unknown exchange: {exchange}'
             }), 400
         
-        orderbook = adapter.fetch_orderbook(symbol, limit)
+        orderbook = stream_orderbook(exchange, symbol, limit) or get_engine().run(
+            get_engine().fetch_orderbook(adapter, symbol, limit))
         
         return jsonify({
             'status': 'success',
@@ -1285,129 +604,14 @@ def toggle_market_list():
             list_type=list_type
         )
         db.session.add(new_entry)
-        db.session.commit()
-        return jsonify({
-            'status': 'success',
-            'action': 'added',
-            'exchange': exchange,
-            'symbol': symbol,
-            'list_type': list_type
-        })
-
-
-@app.route('/api/fetch/btse', methods=['POST'])
-def fetch_btse():
-    try:
-        adapter = BTSEAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from BTSE'
-        })
-    except Exception as e:
-        log_fetch('BTSE', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BTSE',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/whitebit', methods=['POST'])
-def fetch_whitebit():
-    try:
-        adapter = WhiteBitAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from WhiteBit'
-        })
-    except Exception as e:
-        log_fetch('WHITEBIT', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'WHITEBIT',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/binancealpha', methods=['POST'])
-def fetch_binancealpha():
-    try:
-        adapter = BinanceAlphaAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} pairs from Binance Alpha'
-        })
-    except Exception as e:
-        log_fetch('BINANCEALPHA', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'BINANCEALPHA',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/htx', methods=['POST'])
-def fetch_htx():
-    try:
-        adapter = HTXAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from HTX'
-        })
-    except Exception as e:
-        log_fetch('HTX', 'error', error_message=str(e))
-        return jsonify({
-            'status': 'error',
-            'exchange': 'HTX',
-            'message': str(e)
-        }), 500
-
-
-@app.route('/api/fetch/uzx', methods=['POST'])
-def fetch_uzx():
-    try:
-        adapter = UZXAdapter()
-        tickers = adapter.fetch_usdt_tickers()
-        save_tickers(tickers, adapter.exchange_name)
-        log_fetch(adapter.exchange_name, 'success', len(tickers))
-
-        return jsonify({
-            'status': 'success',
-            'exchange': adapter.exchange_name,
-            'pairs_count': len(tickers),
-            'message': f'Successfully fetched {len(tickers)} USDT pairs from UZX'
-        })
-    except Exception as e:
-        log_fetch('UZX', 'error', error_message=str(e))
+        db.session.commit()
         return jsonify({
-            'status': 'error',
-            'exchange': 'UZX',
-            'message': str(e)
-        }), 500
+            'status': 'success',
+            'action': 'added',
+            'exchange': exchange,
+            'symbol': symbol,
+            'list_type': list_type
+        })
 
 
 _poloniex_currency_cache = {'data': None, 'ts': 0}
@@ -1454,8 +658,11 @@ def get_scope():
     exclude_leveraged = request.args.get('exclude_leveraged', 'true') == 'true'
     leveraged_pattern = re.compile(r'\d+[LSls](USDT)?$')
 
-    all_tickers = SpotTicker.query.filter(
-        SpotTicker.price.isnot(None),
+    # Column query so PostgreSQL can answer it from ix_spot_tickers_usdt_base alone
+    all_tickers = db.session.query(
+        SpotTicker.base_currency, SpotTicker.exchange, SpotTicker.symbol,
+        SpotTicker.price, SpotTicker.turnover_24h
+    ).filter(
         SpotTicker.price > 0,
         SpotTicker.quote_currency == 'USDT'
     ).all()
@@ -1491,79 +698,50 @@ def get_scope():
     return jsonify({'status': 'success', 'data': result})
 
 
-@app.route('/api/scope/depth', methods=['POST'])
-def get_scope_depth():
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    data = request.get_json()
-    if not data:
-        return jsonify({'status': 'error', 'message': 'No data'}), 400
-
-    coin = data.get('coin', '')
-    avg_price = float(data.get('avg_price', 0))
-    exchanges = data.get('exchanges', [])
-
-    if not coin or avg_price <= 0 or not exchanges:
-        return jsonify({'status': 'error', 'message': 'Invalid input'}), 400
+def _scope_error_entry(exchange, error):
+    return {'exchange': exchange, 'error': error,
+            'bid_vol_above_avg': 0, 'ask_vol_below_avg': 0,
+            'best_bid': None, 'best_ask': None, 'bid_levels': [], 'ask_levels': []}
 
-    def fetch_one(exch_info):
-        exchange = exch_info['exchange']
-        symbol = exch_info['symbol']
-        adapter = get_adapter(exchange)
-        if not adapter or not hasattr(adapter, 'fetch_orderbook'):
-            return {'exchange': exchange, 'error': 'No adapter',
-                    'bid_vol_above_avg': 0, 'ask_vol_below_avg': 0,
-                    'best_bid': None, 'best_ask': None, 'bid_levels': [], 'ask_levels': []}
-        try:
-            ob = adapter.fetch_orderbook(symbol, limit=20)
-            # bids/asks are [[price, amount], ...] lists
-            bids = sorted(
-                [{'price': float(b[0]), 'qty': float(b[1])} for b in ob.bids if len(b) >= 2],
-                key=lambda x: -x['price']
-            )
-            asks = sorted(
-                [{'price': float(a[0]), 'qty': float(a[1])} for a in ob.asks if len(a) >= 2],
-                key=lambda x: x['price']
-            )
 
-            # Best bid = highest bid on this exchange (top of book)
-            best_bid = bids[0]['price'] if bids else None
-            bid_vol_usd = sum(b['price'] * b['qty'] for b in bids[:5])
-            bid_levels = [{'price': b['price'], 'qty': b['qty'],
-                           'usd': round(b['price'] * b['qty'], 2)} for b in bids[:6]]
-
-            # Best ask = lowest ask on this exchange (top of book)
-            best_ask = asks[0]['price'] if asks else None
-            ask_vol_usd = sum(a['price'] * a['qty'] for a in asks[:5])
-            ask_levels = [{'price': a['price'], 'qty': a['qty'],
-                           'usd': round(a['price'] * a['qty'], 2)} for a in asks[:6]]
-
-            return {
-                'exchange': exchange,
-                'best_bid': best_bid,
-                'bid_vol_above_avg': round(bid_vol_usd, 2),
-                'bid_levels': bid_levels,
-                'best_ask': best_ask,
-                'ask_vol_below_avg': round(ask_vol_usd, 2),
-                'ask_levels': ask_levels,
-                'error': None
-            }
-        except Exception as e:
-            logger.error(f'Scope depth {exchange}/{coin}: {e}')
-            return {'exchange': exchange, 'error': str(e),
-                    'bid_vol_above_avg': 0, 'ask_vol_below_avg': 0,
-                    'best_bid': None, 'best_ask': None, 'bid_levels': [], 'ask_levels': []}
+def _scope_depth_entry(exchange, ob):
+    """Summarise one exchange's orderbook for the scope views."""
+    # bids/asks are [[price, amount], ...] lists
+    bids = sorted(
+        [{'price': float(b[0]), 'qty': float(b[1])} for b in ob.bids if len(b) >= 2],
+        key=lambda x: -x['price']
+    )
+    asks = sorted(
+        [{'price': float(a[0]), 'qty': float(a[1])} for a in ob.asks if len(a) >= 2],
+        key=lambda x: x['price']
+    )
 
-    results = []
-    with ThreadPoolExecutor(max_workers=min(len(exchanges), 8)) as executor:
-        futures = {executor.submit(fetch_one, e): e for e in exchanges}
-        for future in as_completed(futures):
-            r = future.result()
-            if r:
-                results.append(r)
+    # Best bid = highest bid on this exchange (top of book)
+    best_bid = bids[0]['price'] if bids else None
+    bid_vol_usd = sum(b['price'] * b['qty'] for b in bids[:5])
+    bid_levels = [{'price': b['price'], 'qty': b['qty'],
+                   'usd': round(b['price'] * b['qty'], 2)} for b in bids[:6]]
+
+    # Best ask = lowest ask on this exchange (top of book)
+    best_ask = asks[0]['price'] if asks else None
+    ask_vol_usd = sum(a['price'] * a['qty'] for a in asks[:5])
+    ask_levels = [{'price': a['price'], 'qty': a['qty'],
+                   'usd': round(a['price'] * a['qty'], 2)} for a in asks[:6]]
+
+    return {
+        'exchange': exchange,
+        'best_bid': best_bid,
+        'bid_vol_above_avg': round(bid_vol_usd, 2),
+        'bid_levels': bid_levels,
+        'best_ask': best_ask,
+        'ask_vol_below_avg': round(ask_vol_usd, 2),
+        'ask_levels': ask_levels,
+        'error': None
+    }
 
-    fee_pct = float(data.get('fee_pct', 0.4))
 
+def _scope_spread(results, fee_pct):
+    """Return (best_sell, best_buy, real_spread, net_spread) across exchange entries."""
     sell_opps = [r for r in results if r['best_bid'] is not None]
     buy_opps  = [r for r in results if r['best_ask'] is not None]
     best_sell = max(sell_opps, key=lambda x: x['best_bid']) if sell_opps else None
@@ -1577,6 +755,118 @@ def get_scope_depth():
             (best_sell['best_bid'] - best_buy['best_ask']) / best_buy['best_ask'] * 100, 3
         )
         net_spread = round(real_spread - fee_pct, 3)
+    return best_sell, best_buy, real_spread, net_spread
+
+
+EXECUTABLE_TARGET_USDT = 100.0
+EXECUTABLE_MAX_PAIRS = 5
+
+
+def _executable_options(data, fee_pct):
+    """(target_usdt, per-exchange taker fees, default fee per leg) from a scope request body.
+
+    `fee_pct` is the round-trip fee the scope views already use, so each leg
+    defaults to half of it; `fees` may override individual venues. Raises
+    ValueError for non-numeric or non-finite values.
+    """
+    target = _finite_float(data, 'target_usdt', 0.0)
+    if target <= 0:
+        target = EXECUTABLE_TARGET_USDT
+    fees = data.get('fees') or {}
+    if not isinstance(fees, dict):
+        raise ValueError('fees must be an object of exchange -> fee_pct')
+    overrides = {}
+    for exchange, fee in fees.items():
+        try:
+            fee = _finite_float({'fee': fee}, 'fee')
+        except ValueError:
+            raise ValueError(f'fees.{exchange} must be a finite number')
+        if fee is not None:
+            overrides[str(exchange).upper()] = fee
+    return target, overrides, fee_pct / 2
+
+
+def _scope_executable(books, target, fees, default_fee):
+    """Size-aware summary for one coin from {exchange: (bid BookSide, ask BookSide)}."""
+    from execution import executable_spreads
+    pairs = executable_spreads(books, target, fees, default_fee)
+    return {
+        'target_usdt': target,
+        'best': pairs[0] if pairs else None,
+        'pairs': pairs[:EXECUTABLE_MAX_PAIRS],
+        'pair_count': len(pairs)
+    }
+
+
+def _entry_books(results, books):
+    """{exchange: (bid BookSide, ask BookSide)} for the entries whose fetch succeeded."""
+    return {r['exchange']: b for r, b in zip(results, books) if b is not None and not r.get('error')}
+
+
+def _fetch_scope_depths(pairs, coin_of=None):
+    """Fetch orderbooks for (exchange, symbol) pairs through the shared adapter engine.
+
+    Pairs with a live streamed book are served from memory; the rest go out
+    over REST. Returns (entries, books) in input order: one scope depth entry
+    per pair, and the full fetched depth as (bid BookSide, ask BookSide), or
+    None where the fetch failed. Entries only carry the top levels for
+    display, so executable sizes must come from the books.
+    """
+    from execution import BookSide
+    jobs, slots = [], []
+    entries = [None] * len(pairs)
+    books = [None] * len(pairs)
+    for i, (exchange, symbol) in enumerate(pairs):
+        adapter = get_adapter(exchange)
+        if not adapter:
+            entries[i] = _scope_error_entry(exchange, 'No adapter')
+            continue
+        streamed = stream_orderbook(exchange, symbol, 20)
+        if streamed is not None:
+            entries[i] = _scope_depth_entry(exchange, streamed)
+            books[i] = (BookSide.bids(streamed.bids), BookSide.asks(streamed.asks))
+            continue
+        jobs.append((adapter, symbol))
+        slots.append(i)
+
+    for i, ob in zip(slots, get_engine().fetch_orderbooks(jobs, limit=20)):
+        exchange, symbol = pairs[i]
+        try:
+            if isinstance(ob, BaseException):
+                raise ob
+            entries[i] = _scope_depth_entry(exchange, ob)
+            books[i] = (BookSide.bids(ob.bids), BookSide.asks(ob.asks))
+        except Exception as e:
+            coin = coin_of(i) if coin_of else symbol
+            logger.error(f'Scope depth {exchange}/{coin}: {e}')
+            entries[i] = _scope_error_entry(exchange, str(e))
+    return entries, books
+
+
+@app.route('/api/scope/depth', methods=['POST'])
+def get_scope_depth():
+    data = request.get_json()
+    if not data:
+        return jsonify({'status': 'error', 'message': 'No data'}), 400
+
+    coin = data.get('coin', '')
+    exchanges = data.get('exchanges', [])
+    try:
+        avg_price = _finite_float(data, 'avg_price', 0.0)
+        fee_pct = _finite_float(data, 'fee_pct', 0.4)
+        exec_options = _executable_options(data, fee_pct)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    if not coin or avg_price <= 0 or not exchanges:
+        return jsonify({'status': 'error', 'message': 'Invalid input'}), 400
+
+    results, books = _fetch_scope_depths(
+        [(e['exchange'], e['symbol']) for e in exchanges], coin_of=lambda i: coin
+    )
+
+    best_sell, best_buy, real_spread, net_spread = _scope_spread(results, fee_pct)
+    executable = _scope_executable(_entry_books(results, books), *exec_options)
 
     results.sort(key=lambda x: x['bid_vol_above_avg'], reverse=True)
 
@@ -1589,14 +879,13 @@ def get_scope_depth():
         'best_buy': best_buy,
         'real_spread': real_spread,
         'net_spread': net_spread,
+        'executable': executable,
         'fee_pct': fee_pct
     })
 
 
 @app.route('/api/scope/fetch-all', methods=['POST'])
 def get_scope_fetch_all():
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     data = request.get_json()
     if not data:
         return jsonify({'status': 'error', 'message': 'No data'}), 400
@@ -1605,108 +894,52 @@ def get_scope_fetch_all():
     if not coins:
         return jsonify({'status': 'error', 'message': 'No coins provided'}), 400
 
-    def fetch_coin_depth(coin_info):
-        coin = coin_info['coin']
-        avg_price = float(coin_info['avg_price'])
-        exchanges = coin_info['exchanges']
-
-        def fetch_one(exch_info):
-            exchange = exch_info['exchange']
-            symbol = exch_info['symbol']
-            adapter = get_adapter(exchange)
-            if not adapter or not hasattr(adapter, 'fetch_orderbook'):
-                return {'exchange': exchange, 'error': 'No adapter',
-                        'bid_vol_above_avg': 0, 'ask_vol_below_avg': 0,
-                        'best_bid': None, 'best_ask': None, 'bid_levels': [], 'ask_levels': []}
-            try:
-                ob = adapter.fetch_orderbook(symbol, limit=20)
-                # bids/asks are [[price, amount], ...] lists
-                bids = sorted(
-                    [{'price': float(b[0]), 'qty': float(b[1])} for b in ob.bids if len(b) >= 2],
-                    key=lambda x: -x['price']
-                )
-                asks = sorted(
-                    [{'price': float(a[0]), 'qty': float(a[1])} for a in ob.asks if len(a) >= 2],
-                    key=lambda x: x['price']
-                )
-                # Best bid = highest bid on this exchange (top of book)
-                best_bid = bids[0]['price'] if bids else None
-                bid_vol_usd = sum(b['price'] * b['qty'] for b in bids[:5])
-                bid_levels = [{'price': b['price'], 'qty': b['qty'],
-                               'usd': round(b['price'] * b['qty'], 2)} for b in bids[:6]]
-                # Best ask = lowest ask on this exchange (top of book)
-                best_ask = asks[0]['price'] if asks else None
-                ask_vol_usd = sum(a['price'] * a['qty'] for a in asks[:5])
-                ask_levels = [{'price': a['price'], 'qty': a['qty'],
-                               'usd': round(a['price'] * a['qty'], 2)} for a in asks[:6]]
-                return {
-                    'exchange': exchange,
-                    'best_bid': best_bid,
-                    'bid_vol_above_avg': round(bid_vol_usd, 2),
-                    'bid_levels': bid_levels,
-                    'best_ask': best_ask,
-                    'ask_vol_below_avg': round(ask_vol_usd, 2),
-                    'ask_levels': ask_levels,
-                    'error': None
-                }
-            except Exception as e:
-                logger.error(f'Scope depth {exchange}/{coin}: {e}')
-                return {'exchange': exchange, 'error': str(e),
-                        'bid_vol_above_avg': 0, 'ask_vol_below_avg': 0,
-                        'best_bid': None, 'best_ask': None, 'bid_levels': [], 'ask_levels': []}
-
-        results = []
-        with ThreadPoolExecutor(max_workers=min(len(exchanges), 6)) as ex:
-            futs = {ex.submit(fetch_one, e): e for e in exchanges}
-            for fut in as_completed(futs):
-                r = fut.result()
-                if r:
-                    results.append(r)
-
-        fee_pct = float(data.get('fee_pct', 0.4))
-
-        sell_opps = [r for r in results if r['best_bid'] is not None]
-        buy_opps  = [r for r in results if r['best_ask'] is not None]
-        best_sell = max(sell_opps, key=lambda x: x['best_bid']) if sell_opps else None
-        cross_buy_opps = [r for r in buy_opps if not best_sell or r['exchange'] != best_sell['exchange']]
-        best_buy = min(cross_buy_opps, key=lambda x: x['best_ask']) if cross_buy_opps else None
-
-        real_spread = None
-        net_spread  = None
-        if best_sell and best_buy and best_buy['best_ask'] > 0:
-            real_spread = round(
-                (best_sell['best_bid'] - best_buy['best_ask']) / best_buy['best_ask'] * 100, 3
-            )
-            net_spread = round(real_spread - fee_pct, 3)
-
-        results.sort(key=lambda x: x['bid_vol_above_avg'], reverse=True)
-
-        return {
-            'coin': coin,
-            'avg_price': avg_price,
-            'results': results,
-            'best_sell': best_sell,
-            'best_buy': best_buy,
-            'real_spread': real_spread,
-            'net_spread': net_spread,
-            'fee_pct': fee_pct
-        }
+    try:
+        fee_pct = _finite_float(data, 'fee_pct', 0.4)
+        exec_options = _executable_options(data, fee_pct)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    # Flatten every (coin, exchange) pair into one batch for the engine
+    pairs, owners = [], []
+    for coin_info in coins:
+        for exch_info in coin_info['exchanges']:
+            pairs.append((exch_info['exchange'], exch_info['symbol']))
+            owners.append(coin_info['coin'])
+    entries, books = _fetch_scope_depths(pairs, coin_of=lambda i: owners[i])
+
+    by_coin, books_by_coin = {}, {}
+    for coin_name, entry, book in zip(owners, entries, books):
+        by_coin.setdefault(coin_name, []).append(entry)
+        books_by_coin.setdefault(coin_name, []).append(book)
 
     all_results = {}
-    with ThreadPoolExecutor(max_workers=min(len(coins), 10)) as executor:
-        future_map = {executor.submit(fetch_coin_depth, c): c['coin'] for c in coins}
-        for future in as_completed(future_map):
-            coin_name = future_map[future]
-            try:
-                result = future.result()
-                all_results[coin_name] = result
-            except Exception as e:
-                logger.error(f'fetch-all coin {coin_name}: {e}')
-                all_results[coin_name] = {
-                    'coin': coin_name, 'avg_price': 0,
-                    'results': [], 'best_sell': None, 'best_buy': None,
-                    'real_spread': None, 'net_spread': None, 'fee_pct': 0.4
-                }
+    for coin_info in coins:
+        coin_name = coin_info['coin']
+        try:
+            results = by_coin.get(coin_name, [])
+            best_sell, best_buy, real_spread, net_spread = _scope_spread(results, fee_pct)
+            executable = _scope_executable(_entry_books(results, books_by_coin.get(coin_name, [])),
+                                           *exec_options)
+            results.sort(key=lambda x: x['bid_vol_above_avg'], reverse=True)
+            all_results[coin_name] = {
+                'coin': coin_name,
+                'avg_price': _finite_float(coin_info, 'avg_price', 0.0),
+                'results': results,
+                'best_sell': best_sell,
+                'best_buy': best_buy,
+                'real_spread': real_spread,
+                'net_spread': net_spread,
+                'executable': executable,
+                'fee_pct': fee_pct
+            }
+        except Exception as e:
+            logger.error(f'fetch-all coin {coin_name}: {e}')
+            all_results[coin_name] = {
+                'coin': coin_name, 'avg_price': 0,
+                'results': [], 'best_sell': None, 'best_buy': None,
+                'real_spread': None, 'net_spread': None, 'executable': None, 'fee_pct': 0.4
+            }
 
     return jsonify({'status': 'success', 'data': all_results})
 
@@ -1743,9 +976,60 @@ def market_fetch_status():
     return jsonify({'status': 'success', 'data': result})
 
 
+def parse_snapshot_book(ob):
+    """Reduce an orderbook (or the exception raised fetching it) to snapshot fields.
+
+    Returns (bids, asks, best_bid, best_ask, error) with the top 5 levels per side.
+    """
+    if isinstance(ob, BaseException):
+        return None, None, None, None, str(ob)
+    try:
+        bids = [[float(b[0]), float(b[1])] for b in ob.bids[:5] if len(b) >= 2]
+        asks = [[float(a[0]), float(a[1])] for a in ob.asks[:5] if len(a) >= 2]
+    except Exception as e:
+        return None, None, None, None, str(e)
+    if not bids or not asks:
+        return None, None, None, None, 'empty orderbook'
+    return bids, asks, bids[0][0], asks[0][0], None
+
+
+def save_orderbook_snapshots(exchange, snap_updates):
+    """Upsert (symbol, bids, asks, best_bid, best_ask) snapshot rows for one exchange.
+
+    Levels are stored packed (see bookcodec) through chunked
+    INSERT ... ON CONFLICT (exchange, symbol) DO UPDATE statements; the same
+    rows are appended to the bounded snapshot history (see bookhistory).
+    """
+    import bookcodec
+    if not snap_updates:
+        return
+    now = datetime.utcnow()
+    rows = [{
+        'exchange': exchange, 'symbol': symbol,
+        'bid_levels': bookcodec.encode_bids(bids),
+        'ask_levels': bookcodec.encode_asks(asks),
+        'best_bid': best_bid, 'best_ask': best_ask,
+        'fetched_at': now
+    } for symbol, bids, asks, best_bid, best_ask in snap_updates]
+    try:
+        for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = _dialect_insert(OrderbookSnapshot).values(rows[i:i + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['exchange', 'symbol'],
+                set_={col: stmt.excluded[col] for col in
+                      ('bid_levels', 'ask_levels', 'best_bid', 'best_ask', 'fetched_at')}
+            )
+            db.session.execute(stmt)
+        record_books(rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    maybe_prune_books(exchange)
+
+
 @app.route('/api/market-fetch/<exchange>', methods=['POST'])
 def do_market_fetch(exchange):
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     exch_upper = exchange.upper()
     adapter = get_adapter(exch_upper)
     if not adapter:
@@ -1763,67 +1047,26 @@ def do_market_fetch(exchange):
     if not tickers:
         return jsonify({'status': 'error', 'message': 'Tidak ada ticker. Fetch harga dulu di halaman utama.'}), 400
 
-    import time as _time
-
-    def fetch_ob(symbol):
-        for attempt in range(2):  # 1 retry on 429
-            try:
-                ob = adapter.fetch_orderbook(symbol, limit=5)
-                bids = [[float(b[0]), float(b[1])] for b in ob.bids[:5] if len(b) >= 2]
-                asks = [[float(a[0]), float(a[1])] for a in ob.asks[:5] if len(a) >= 2]
-                if not bids or not asks:
-                    return symbol, None, None, None, None, 'empty orderbook'
-                best_bid = bids[0][0]
-                best_ask = asks[0][0]
-                return symbol, bids, asks, best_bid, best_ask, None
-            except Exception as e:
-                err_str = str(e)
-                if '429' in err_str and attempt == 0:
-                    _time.sleep(1.5)  # back off and retry once on rate limit
-                    continue
-                return symbol, None, None, None, None, err_str
-        return symbol, None, None, None, None, 'max retries exceeded'
-
     success = 0
     failed = 0
     start = datetime.utcnow()
     snap_updates = []
 
-    # 8 workers — enough parallelism without triggering rate limits
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = {executor.submit(fetch_ob, t.symbol): t.symbol for t in tickers}
-        for future in as_completed(futures):
-            symbol, bids, asks, best_bid, best_ask, err = future.result()
-            if err:
-                failed += 1
-            else:
-                snap_updates.append((symbol, bids, asks, best_bid, best_ask))
-                success += 1
+    # The engine caps in-flight requests per exchange (adapter.max_concurrency);
+    # 429 backoff and retries happen in the adapter's shared rate limiter.
+    symbols = [t.symbol for t in tickers]
+    parsed = dict(zip(symbols, map(parse_snapshot_book, get_engine().fetch_orderbooks(
+        [(adapter, s) for s in symbols], limit=5
+    ))))
 
-    # Bulk upsert
-    from sqlalchemy.orm.attributes import flag_modified
-    now = datetime.utcnow()
-    existing = {s.symbol: s for s in
-                OrderbookSnapshot.query.filter_by(exchange=exch_upper).all()}
-    for symbol, bids, asks, best_bid, best_ask in snap_updates:
-        if symbol in existing:
-            snap = existing[symbol]
-            snap.bids = bids
-            snap.asks = asks
-            snap.best_bid = best_bid
-            snap.best_ask = best_ask
-            snap.fetched_at = now
-            flag_modified(snap, 'bids')
-            flag_modified(snap, 'asks')
+    for symbol, (bids, asks, best_bid, best_ask, err) in parsed.items():
+        if err:
+            failed += 1
         else:
-            snap = OrderbookSnapshot(
-                exchange=exch_upper, symbol=symbol,
-                bids=bids, asks=asks,
-                best_bid=best_bid, best_ask=best_ask,
-                fetched_at=now
-            )
-            db.session.add(snap)
-    db.session.commit()
+            snap_updates.append((symbol, bids, asks, best_bid, best_ask))
+            success += 1
+
+    save_orderbook_snapshots(exch_upper, snap_updates)
 
     duration = round((datetime.utcnow() - start).total_seconds(), 1)
     return jsonify({
@@ -1835,6 +1078,110 @@ def do_market_fetch(exchange):
 STALE_THRESHOLD_SEC = 300  # 5 minutes — snapshots older than this are flagged
 
 
+@app.route('/api/scheduler/status')
+def scheduler_status():
+    from scheduler import get_scheduler
+    sched = get_scheduler()
+    if sched is None:
+        return jsonify({'status': 'success', 'running': False})
+    return jsonify({'status': 'success', 'running': True, 'data': sched.status()})
+
+
+@app.route('/api/history/spread')
+def history_spread():
+    """Cross-exchange spread of one symbol over time from the ticker history rollups."""
+    from datetime import timedelta
+    from history import INTERVALS, spread_series
+
+    symbol = request.args.get('symbol', '').upper()
+    interval = request.args.get('interval', '1m')
+    if not symbol or interval not in INTERVALS:
+        return jsonify({'status': 'error', 'message': f'symbol and interval ({", ".join(INTERVALS)}) required'}), 400
+
+    max_window = INTERVALS[interval][-1]
+    hours = request.args.get('hours', 24, type=float)
+    min_spread = request.args.get('min_spread', 1.0, type=float)
+    if not (math.isfinite(hours) and math.isfinite(min_spread)):
+        return jsonify({'status': 'error', 'message': 'hours and min_spread must be finite numbers'}), 400
+    window = min(timedelta(hours=max(hours, 0.1)), max_window)
+    exchanges = [e.strip().upper() for e in request.args.get('exchanges', '').split(',') if e.strip()]
+    since = datetime.utcnow() - window
+
+    data = spread_series(symbol, interval, since=since, exchanges=exchanges or None,
+                         min_spread=min_spread)
+    return jsonify({'status': 'success', 'data': data})
+
+
+@app.route('/api/history/status')
+def history_status():
+    from history import get_history_writer
+    return jsonify({'status': 'success', 'data': get_history_writer().status()})
+
+
+@app.route('/api/streams/status')
+def streams_status():
+    """Connection and book health of every enabled WebSocket depth feed."""
+    data = {name.lower(): get_stream(name).status() for name in STREAMS if get_stream(name)}
+    return jsonify({'status': 'success', 'data': data})
+
+
+def _scope_coin_result(coin, avg_price, snaps, now, fee_pct, exec_options):
+    """Scope result for one coin from stored snapshots (current or historical) as of `now`."""
+    import bookcodec
+    from execution import BookSide
+    results = []
+    books = {}
+    for snap in snaps:
+        # Packed levels are stored best first: no per-level parsing or re-sorting
+        bid_flat = bookcodec.decode(snap.bid_levels)
+        ask_flat = bookcodec.decode(snap.ask_levels)
+        if not bid_flat or not ask_flat:
+            continue
+        books[snap.exchange] = (BookSide.from_packed(bid_flat), BookSide.from_packed(ask_flat))
+        best_bid = bid_flat[0]
+        bid_vol_usd = sum(bid_flat[i] * bid_flat[i + 1] for i in range(0, min(len(bid_flat), 10), 2))
+        bid_levels = [{'price': bid_flat[i], 'qty': bid_flat[i + 1],
+                       'usd': round(bid_flat[i] * bid_flat[i + 1], 2)}
+                      for i in range(0, min(len(bid_flat), 12), 2)]
+        best_ask = ask_flat[0]
+        ask_vol_usd = sum(ask_flat[i] * ask_flat[i + 1] for i in range(0, min(len(ask_flat), 10), 2))
+        ask_levels = [{'price': ask_flat[i], 'qty': ask_flat[i + 1],
+                       'usd': round(ask_flat[i] * ask_flat[i + 1], 2)}
+                      for i in range(0, min(len(ask_flat), 12), 2)]
+        snap_age = round((now - snap.fetched_at).total_seconds()) if snap.fetched_at else None
+        is_stale = snap_age is not None and snap_age > STALE_THRESHOLD_SEC
+        results.append({
+            'exchange': snap.exchange,
+            'best_bid': best_bid,
+            'bid_vol_above_avg': round(bid_vol_usd, 2),
+            'bid_levels': bid_levels,
+            'best_ask': best_ask,
+            'ask_vol_below_avg': round(ask_vol_usd, 2),
+            'ask_levels': ask_levels,
+            'snap_age_sec': snap_age,
+            'is_stale': is_stale,
+            'error': None
+        })
+
+    # Require ≥2 exchanges with actual snapshot data
+    if len(results) < 2:
+        best_sell = best_buy = real_spread = net_spread = executable = None
+    else:
+        executable = _scope_executable(books, *exec_options)
+        best_sell, best_buy, real_spread, net_spread = _scope_spread(results, fee_pct)
+
+    results.sort(key=lambda x: x['bid_vol_above_avg'], reverse=True)
+    return {
+        'coin': coin, 'avg_price': avg_price,
+        'results': results,
+        'best_sell': best_sell, 'best_buy': best_buy,
+        'real_spread': real_spread,
+        'net_spread': net_spread,
+        'executable': executable,
+        'fee_pct': fee_pct
+    }
+
+
 @app.route('/api/scope/from-db', methods=['POST'])
 def get_scope_from_db():
     from collections import defaultdict
@@ -1845,8 +1192,12 @@ def get_scope_from_db():
     if not coins:
         return jsonify({'status': 'error', 'message': 'No coins'}), 400
 
-    fee_pct = float(data.get('fee_pct', 0.4))
-    coin_map = {c['coin']: float(c['avg_price']) for c in coins}
+    try:
+        fee_pct = _finite_float(data, 'fee_pct', 0.4)
+        exec_options = _executable_options(data, fee_pct)
+        coin_map = {c['coin']: _finite_float(c, 'avg_price', 0.0) for c in coins}
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     symbols_needed = [f"{coin}/USDT" for coin in coin_map]
 
     # Query ALL snapshots for needed symbols — ignore frontend exchange list entirely
@@ -1863,78 +1214,9 @@ def get_scope_from_db():
     latest_ts = max((s.fetched_at for s in all_snaps), default=None)
     now = datetime.utcnow()
 
-    all_results = {}
-    for coin, avg_price in coin_map.items():
-        symbol = f"{coin}/USDT"
-        snap_list = snaps_by_symbol.get(symbol, [])
-
-        results = []
-        for snap in snap_list:
-            if not snap.bids or not snap.asks:
-                continue
-            try:
-                bids = sorted(
-                    [{'price': float(b[0]), 'qty': float(b[1])} for b in snap.bids if len(b) >= 2],
-                    key=lambda x: -x['price']
-                )
-                asks = sorted(
-                    [{'price': float(a[0]), 'qty': float(a[1])} for a in snap.asks if len(a) >= 2],
-                    key=lambda x: x['price']
-                )
-            except (TypeError, IndexError):
-                continue
-            if not bids or not asks:
-                continue
-            best_bid = bids[0]['price']
-            bid_vol_usd = sum(b['price'] * b['qty'] for b in bids[:5])
-            bid_levels = [{'price': b['price'], 'qty': b['qty'],
-                           'usd': round(b['price'] * b['qty'], 2)} for b in bids[:6]]
-            best_ask = asks[0]['price']
-            ask_vol_usd = sum(a['price'] * a['qty'] for a in asks[:5])
-            ask_levels = [{'price': a['price'], 'qty': a['qty'],
-                           'usd': round(a['price'] * a['qty'], 2)} for a in asks[:6]]
-            snap_age = round((now - snap.fetched_at).total_seconds()) if snap.fetched_at else None
-            is_stale = snap_age is not None and snap_age > STALE_THRESHOLD_SEC
-            results.append({
-                'exchange': snap.exchange,
-                'best_bid': best_bid,
-                'bid_vol_above_avg': round(bid_vol_usd, 2),
-                'bid_levels': bid_levels,
-                'best_ask': best_ask,
-                'ask_vol_below_avg': round(ask_vol_usd, 2),
-                'ask_levels': ask_levels,
-                'snap_age_sec': snap_age,
-                'is_stale': is_stale,
-                'error': None
-            })
-
-        # Require ≥2 exchanges with actual snapshot data
-        if len(results) < 2:
-            best_sell = best_buy = real_spread = net_spread = None
-        else:
-            sell_opps = [r for r in results if r['best_bid'] is not None]
-            buy_opps  = [r for r in results if r['best_ask'] is not None]
-            best_sell = max(sell_opps, key=lambda x: x['best_bid']) if sell_opps else None
-            cross_buy = [r for r in buy_opps if not best_sell or r['exchange'] != best_sell['exchange']]
-            best_buy  = min(cross_buy, key=lambda x: x['best_ask']) if cross_buy else None
-
-            real_spread = None
-            net_spread  = None
-            if best_sell and best_buy and best_buy['best_ask'] > 0:
-                real_spread = round(
-                    (best_sell['best_bid'] - best_buy['best_ask']) / best_buy['best_ask'] * 100, 3
-                )
-                net_spread = round(real_spread - fee_pct, 3)
-
-        results.sort(key=lambda x: x['bid_vol_above_avg'], reverse=True)
-        all_results[coin] = {
-            'coin': coin, 'avg_price': avg_price,
-            'results': results,
-            'best_sell': best_sell, 'best_buy': best_buy,
-            'real_spread': real_spread,
-            'net_spread': net_spread,
-            'fee_pct': fee_pct
-        }
+    all_results = {coin: _scope_coin_result(coin, avg_price, snaps_by_symbol.get(f"{coin}/USDT", []),
+                                            now, fee_pct, exec_options)
+                   for coin, avg_price in coin_map.items()}
 
     return jsonify({
         'status': 'success',
@@ -1944,88 +1226,157 @@ def get_scope_from_db():
     })
 
 
+def _parse_utc(value):
+    """Naive UTC datetime from an ISO-8601 string (a trailing Z or offset is converted), or None."""
+    from datetime import timezone
+    try:
+        ts = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+@app.route('/api/scope/replay', methods=['POST'])
+def scope_replay():
+    """/api/scope/from-db as it would have answered at a past `at` timestamp (UTC)."""
+    from collections import defaultdict
+    from bookhistory import books_at
+    data = request.get_json()
+    if not data:
+        return jsonify({'status': 'error', 'message': 'No data'}), 400
+    coins = data.get('coins', [])
+    if not coins:
+        return jsonify({'status': 'error', 'message': 'No coins'}), 400
+    at = _parse_utc(data.get('at', ''))
+    if at is None:
+        return jsonify({'status': 'error', 'message': 'at must be an ISO-8601 timestamp'}), 400
+
+    try:
+        fee_pct = _finite_float(data, 'fee_pct', 0.4)
+        exec_options = _executable_options(data, fee_pct)
+        coin_map = {c['coin']: _finite_float(c, 'avg_price', 0.0) for c in coins}
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    snaps = books_at([f"{coin}/USDT" for coin in coin_map], at)
+    snaps_by_symbol = defaultdict(list)
+    for s in snaps:
+        snaps_by_symbol[s.symbol].append(s)
+    latest_ts = max((s.fetched_at for s in snaps), default=None)
+
+    all_results = {coin: _scope_coin_result(coin, avg_price, snaps_by_symbol.get(f"{coin}/USDT", []),
+                                            at, fee_pct, exec_options)
+                   for coin, avg_price in coin_map.items()}
+
+    return jsonify({
+        'status': 'success',
+        'data': all_results,
+        'source': 'history',
+        'at': at.isoformat(),
+        'snapshot_time': latest_ts.isoformat() if latest_ts else None
+    })
+
+
+@app.route('/api/scope/replay/timeline')
+def scope_replay_timeline():
+    """Top-of-book spread of one coin at every stored snapshot time, to tell lasting gaps from blips."""
+    from datetime import timedelta
+    from bookhistory import spread_timeline
+
+    coin = request.args.get('coin', '').upper()
+    if not coin:
+        return jsonify({'status': 'error', 'message': 'coin required'}), 400
+    until = _parse_utc(request.args['until']) if request.args.get('until') else datetime.utcnow()
+    if until is None:
+        return jsonify({'status': 'error', 'message': 'until must be an ISO-8601 timestamp'}), 400
+    minutes = request.args.get('minutes', 60, type=float)
+    since = until - timedelta(minutes=max(minutes, 1))
+
+    data = spread_timeline(f"{coin}/USDT", since, until, STALE_THRESHOLD_SEC)
+    return jsonify({'status': 'success', 'coin': coin, 'data': data})
+
+
 @app.route('/arbitrage')
 def arbitrage():
     return render_template('arbitrage.html')
 
 
-@app.route('/api/arbitrage')
-def get_arbitrage():
-    import re
-    from sqlalchemy import func
+ARBITRAGE_SORT_COLUMNS = {'symbol', 'exchanges', 'spread', 'turnover'}
 
-    exclude_leveraged = request.args.get('exclude_leveraged', 'true') == 'true'
-    leveraged_pattern = re.compile(r'\d+[LSls](USDT)?$')
 
-    arb_blacklist = {e.symbol for e in MarketList.query.filter_by(exchange='ARB', list_type='blacklist').all()}
-    arb_wishlist = {e.symbol for e in MarketList.query.filter_by(exchange='ARB', list_type='whitelist').all()}
+def _finite_float(data, name, default=None):
+    """Finite float `data[name]` (query args or a JSON body); missing or empty gives `default`.
 
-    subq = db.session.query(
-        SpotTicker.symbol,
-        func.count(SpotTicker.exchange).label('exchange_count')
-    ).filter(
-        SpotTicker.price.isnot(None),
-        SpotTicker.price > 0
-    ).group_by(SpotTicker.symbol).having(
-        func.count(SpotTicker.exchange) >= 2
-    ).subquery()
+    Raises ValueError naming the field for malformed, inf and nan values.
+    """
+    value = data.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value):
+        raise ValueError(f'{name} must be a finite number')
+    return value
 
-    tickers = db.session.query(SpotTicker).join(
-        subq, SpotTicker.symbol == subq.c.symbol
-    ).filter(
-        SpotTicker.price.isnot(None),
-        SpotTicker.price > 0
-    ).all()
 
-    grouped = {}
-    for t in tickers:
-        if exclude_leveraged and leveraged_pattern.search(t.base_currency):
-            continue
-        if t.symbol not in grouped:
-            grouped[t.symbol] = []
-        grouped[t.symbol].append(t)
+def _float_arg(name, default=None):
+    """Finite float query arg; missing, malformed, inf and nan values give `default`."""
+    try:
+        return _finite_float(request.args, name, default)
+    except ValueError:
+        return default
 
-    results = []
-    for symbol, entries in grouped.items():
-        valid_entries = [e for e in entries if e.price and e.price > 0]
-        if len(valid_entries) < 2:
-            continue
 
-        exchange_count = len(valid_entries)
-        max_entry = max(valid_entries, key=lambda e: e.price)
-        min_entry = min(valid_entries, key=lambda e: e.price)
+@app.route('/api/arbitrage')
+def get_arbitrage():
+    """Ranked cross-exchange spreads, filtered and paginated server-side.
 
-        spread_pct = ((max_entry.price - min_entry.price) / min_entry.price) * 100
+    Rows come from the in-memory ArbitrageEngine (see arbitrage.py). Without
+    `per_page` every matching row is returned, as before.
+    """
+    exclude_leveraged = request.args.get('exclude_leveraged', 'true') == 'true'
+    sort = request.args.get('sort', 'spread')
+    if sort not in ARBITRAGE_SORT_COLUMNS:
+        sort = 'spread'
+    exclude_exchanges = {e.strip().upper() for e in request.args.get('exclude_exchanges', '').split(',') if e.strip()}
 
-        total_turnover = sum(e.turnover_24h for e in valid_entries if e.turnover_24h)
+    arb_blacklist = {e.symbol for e in MarketList.query.filter_by(exchange='ARB', list_type='blacklist').all()}
+    arb_wishlist = {e.symbol for e in MarketList.query.filter_by(exchange='ARB', list_type='whitelist').all()}
 
-        exchange_list = sorted([{
-            'exchange': e.exchange,
-            'price': e.price,
-            'turnover_24h': e.turnover_24h,
-            'change_24h': e.change_24h
-        } for e in valid_entries], key=lambda x: x['price'], reverse=True)
+    rows, summary = get_arbitrage_engine().view(
+        exclude_leveraged=exclude_leveraged,
+        min_spread=_float_arg('min_spread', 0.0),
+        max_spread=_float_arg('max_spread'),
+        min_exchanges=max(2, request.args.get('min_exchanges', 2, type=int)),
+        min_volume=_float_arg('min_volume', 0.0),
+        max_volume=_float_arg('max_volume'),
+        list_filter=request.args.get('list_filter', ''),
+        exclude_exchanges=exclude_exchanges,
+        search=request.args.get('q', '').upper().strip(),
+        sort=sort,
+        descending=request.args.get('order', 'desc') != 'asc',
+        blacklist=arb_blacklist,
+        wishlist=arb_wishlist
+    )
 
-        results.append({
-            'symbol': symbol,
-            'base_currency': valid_entries[0].base_currency,
-            'exchange_count': exchange_count,
-            'max_price': max_entry.price,
-            'max_exchange': max_entry.exchange,
-            'max_turnover': max_entry.turnover_24h,
-            'min_price': min_entry.price,
-            'min_exchange': min_entry.exchange,
-            'min_turnover': min_entry.turnover_24h,
-            'spread_pct': round(spread_pct, 4),
-            'total_turnover': total_turnover,
-            'exchanges': exchange_list,
-            'is_blacklisted': symbol in arb_blacklist,
-            'is_wishlisted': symbol in arb_wishlist
-        })
+    per_page = request.args.get('per_page', type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
+    if per_page:
+        per_page = min(max(per_page, 1), 500)
+        selected = rows[(page - 1) * per_page:page * per_page]
+    else:
+        selected = rows
 
-    results.sort(key=lambda x: x['spread_pct'], reverse=True)
+    results = [dict(r, is_blacklisted=r['symbol'] in arb_blacklist,
+                    is_wishlisted=r['symbol'] in arb_wishlist) for r in selected]
 
-    return jsonify({'status': 'success', 'data': results, 'count': len(results)})
+    return jsonify({'status': 'success', 'data': results, 'count': len(results),
+                    'total': len(rows), 'page': page, 'per_page': per_page,
+                    'summary': summary})
 
 
 @app.route('/exchange-focus')
@@ -2049,7 +1400,9 @@ def get_exchange_focus():
 
     anchor_map = {t.symbol: t for t in anchor_tickers}
 
-    other_tickers = SpotTicker.query.filter(
+    other_tickers = db.session.query(
+        SpotTicker.symbol, SpotTicker.exchange, SpotTicker.price, SpotTicker.turnover_24h
+    ).filter(
         SpotTicker.symbol.in_(list(anchor_map.keys())),
         SpotTicker.exchange != exchange,
         SpotTicker.price.isnot(None),
@@ -2117,12 +1470,6 @@ def get_market_list():
 
 # ─── Kraken Live Monitor ──────────────────────────────────────────────────────
 
-import time as _time
-import requests as _req
-
-_kraken_pairs_cache = {'data': None, 'ts': 0}
-
-
 @app.route('/kraken-monitor')
 def kraken_monitor():
     return render_template('kraken_monitor.html')
@@ -2130,60 +1477,106 @@ def kraken_monitor():
 
 @app.route('/api/kraken-monitor/pairs')
 def kraken_monitor_pairs():
-    """Return Kraken WS symbol → display symbol mapping (cached 5 min)."""
-    global _kraken_pairs_cache
-    now = _time.time()
-    if _kraken_pairs_cache['data'] and (now - _kraken_pairs_cache['ts']) < 300:
-        return jsonify(_kraken_pairs_cache['data'])
-
-    BASE_RENAME = {
-        'XBT': 'BTC', 'XDG': 'DOGE', 'XET': 'ETH',
-        'XXBT': 'BTC', 'XETH': 'ETH', 'XXRP': 'XRP',
-        'XLTC': 'LTC', 'XXLM': 'XLM', 'XZEC': 'ZEC', 'XXMR': 'XMR',
-    }
-
+    """Return Kraken WS symbol → display symbol mapping (shared AssetPairs catalog)."""
     try:
-        resp = _req.get('https://api.kraken.com/0/public/AssetPairs', timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-
-        pairs = {}
-        for info in data.get('result', {}).values():
-            wsname = info.get('wsname', '')
-            if not wsname or '/' not in wsname:
-                continue
-            raw_base = info.get('base', '')
-            quote = info.get('quote', '')
-            base = BASE_RENAME.get(raw_base, raw_base)
-
-            if quote == 'USDT':
-                display = f"{base}/USDT"
-            elif quote in ('ZUSD', 'USD'):
-                display = f"{base}/USDT"
-            else:
-                continue
-
-            pairs[wsname] = display
-
-        result = {'status': 'success', 'pairs': pairs, 'count': len(pairs)}
-        _kraken_pairs_cache = {'data': result, 'ts': now}
-        return jsonify(result)
-
+        pairs = get_adapter('KRAKEN').ws_symbols()
+        return jsonify({'status': 'success', 'pairs': pairs, 'count': len(pairs)})
     except Exception as e:
         logger.error(f"kraken-monitor/pairs error: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+@app.route('/api/kraken-monitor/stream')
+def kraken_monitor_stream():
+    """SSE feed of monitor rows: one snapshot, then only rows whose price or reference changed."""
+    from flask import Response, stream_with_context
+    from monitor import get_monitor_hub
+
+    def generate():
+        for payload in get_monitor_hub().events():
+            yield f"data: {payload}\n\n" if payload else ": keep-alive\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 @app.route('/api/kraken-monitor/reference')
 def kraken_monitor_reference():
-    """Return reference price from highest-volume non-Kraken exchanges in DB.
+    """Return reference prices from high-volume non-Kraken exchanges (see _reference_row).
+
+    The payload is serialized once per index change and carries an ETag
+    derived from the rows alone, so polls are answered with 304 until the
+    reference data itself changes (re-priming identical rows keeps it).
+    """
+    payload, etag = _reference_payload()
+    response = app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+# Reference index for the Kraken monitor: symbol -> {exchange: entry} for every
+# non-Kraken ticker with a price, plus the derived row per symbol. save_tickers()
+# patches only the symbols an exchange changed; the whole index is re-primed
+# from the DB after REFERENCE_INDEX_TTL_SEC so other workers' writes are picked up.
+REFERENCE_INDEX_TTL_SEC = 300
+
+_reference_index = {'ts': 0, 'entries': {}, 'rows': {}, 'payload': None, 'etag': None,
+                    'refreshed_at': None}
+_reference_lock = threading.Lock()
+
+
+def _reference_entry(exchange, price, turnover, fetched_at):
+    return {
+        'exchange': exchange,
+        'price': price,
+        'turnover_24h': turnover or 0,
+        'fetched_at': fetched_at.isoformat() if fetched_at else None
+    }
+
+
+def _reference_row(sym, entries):
+    """Reference row for one symbol from its per-exchange entries.
 
     Logic: use SpotTicker last-price sorted by turnover_24h DESC.
     High-volume exchanges represent the reliable global market price.
     Exchanges with zero or null turnover are used only as fallback when no
     volume data is available for a symbol.
     """
-    # Query all SpotTicker rows excluding Kraken, with price > 0
+    # Prefer entries with actual volume; if none, fall back to all entries
+    with_vol = [e for e in entries if e['turnover_24h'] > 0]
+    working = with_vol if with_vol else list(entries)
+
+    # Sort by turnover descending — highest volume = most reliable reference.
+    # Ties break by exchange so a re-primed index yields identical rows.
+    working.sort(key=lambda x: (-x['turnover_24h'], x['exchange']))
+
+    # Reference price = from the highest-volume exchange (global market price)
+    top = working[0]
+
+    # min_price = cheapest available (buy here, sell higher at Kraken)
+    # max_price = most expensive available (sell here after buying cheap at Kraken)
+    min_e = min(working, key=lambda x: x['price'])
+    max_e = max(working, key=lambda x: x['price'])
+
+    return {
+        'symbol': sym,
+        'ref_price':          top['price'],
+        'ref_exchange':       top['exchange'],
+        'ref_turnover':       top['turnover_24h'],
+        'min_price':          min_e['price'],
+        'max_price':          max_e['price'],
+        'min_price_exchange': min_e['exchange'],
+        'max_price_exchange': max_e['exchange'],
+        'exchange_count':     len(working),
+        'source':             'spot_volume' if with_vol else 'spot_novolume',
+        'top_exchanges':      working[:5]
+    }
+
+
+def _prime_reference_index():
+    """Rebuild the whole index from SpotTicker (caller holds _reference_lock)."""
+    import time as _time
     spot_rows = db.session.query(
         SpotTicker.symbol,
         SpotTicker.exchange,
@@ -2196,46 +1589,79 @@ def kraken_monitor_reference():
         SpotTicker.price > 0
     ).all()
 
-    # Group by symbol
-    by_symbol = {}
+    entries = {}
     for row in spot_rows:
-        by_symbol.setdefault(row.symbol, []).append({
-            'exchange': row.exchange,
-            'price': row.price,
-            'turnover_24h': row.turnover_24h or 0,
-            'fetched_at': row.fetched_at.isoformat() if row.fetched_at else None
-        })
+        entries.setdefault(row.symbol, {})[row.exchange] = _reference_entry(
+            row.exchange, row.price, row.turnover_24h, row.fetched_at)
+
+    _reference_index.update(
+        ts=_time.time(),
+        entries=entries,
+        rows={sym: _reference_row(sym, by_ex.values()) for sym, by_ex in entries.items()},
+        payload=None
+    )
+
+
+def _reference_rows():
+    """Current rows, re-priming the index when it is cold or older than the TTL."""
+    import time as _time
+    if _time.time() - _reference_index['ts'] >= REFERENCE_INDEX_TTL_SEC:
+        _prime_reference_index()
+    return _reference_index['rows']
+
+
+def _update_reference_index(exchange_name, changed, vanished):
+    """Patch the index with one exchange's saved rows; O(changed symbols)."""
+    if exchange_name == 'KRAKEN' or not (changed or vanished):
+        return
+    with _reference_lock:
+        if not _reference_index['ts']:
+            return  # not primed yet; the first read loads everything
+        entries = _reference_index['entries']
+        rows = _reference_index['rows']
+        touched = set(vanished)
+        for sym in vanished:
+            entries.get(sym, {}).pop(exchange_name, None)
+        for r in changed:
+            sym = r['symbol']
+            touched.add(sym)
+            if r['price'] and r['price'] > 0:
+                entries.setdefault(sym, {})[exchange_name] = _reference_entry(
+                    exchange_name, r['price'], r['turnover_24h'], r['fetched_at'])
+            else:
+                entries.get(sym, {}).pop(exchange_name, None)
+        for sym in touched:
+            by_ex = entries.get(sym)
+            if by_ex:
+                rows[sym] = _reference_row(sym, by_ex.values())
+            else:
+                entries.pop(sym, None)
+                rows.pop(sym, None)
+        _reference_index['payload'] = None
 
-    result = {}
-    for sym, entries in by_symbol.items():
-        # Prefer entries with actual volume; if none, fall back to all entries
-        with_vol = [e for e in entries if e['turnover_24h'] > 0]
-        working = with_vol if with_vol else entries
-
-        # Sort by turnover descending — highest volume = most reliable reference
-        working.sort(key=lambda x: x['turnover_24h'], reverse=True)
-
-        # Reference price = from the highest-volume exchange (global market price)
-        top = working[0]
-
-        # min_price = cheapest available (buy here, sell higher at Kraken)
-        # max_price = most expensive available (sell here after buying cheap at Kraken)
-        min_e = min(working, key=lambda x: x['price'])
-        max_e = max(working, key=lambda x: x['price'])
-
-        result[sym] = {
-            'symbol': sym,
-            'ref_price':          top['price'],
-            'ref_exchange':       top['exchange'],
-            'ref_turnover':       top['turnover_24h'],
-            'min_price':          min_e['price'],
-            'max_price':          max_e['price'],
-            'min_price_exchange': min_e['exchange'],
-            'max_price_exchange': max_e['exchange'],
-            'exchange_count':     len(working),
-            'source':             'spot_volume' if with_vol else 'spot_novolume',
-            'top_exchanges':      working[:5]
-        }
 
-    return jsonify({'status': 'success', 'data': result, 'count': len(result),
-                    'refreshed_at': datetime.utcnow().isoformat()})
+def _reference_payload():
+    """(serialized response body, ETag), rebuilt only after the index changed.
+
+    The ETag hashes the rows only; `refreshed_at` in the body is when that
+    hash last changed, so body and ETag stay consistent.
+    """
+    import hashlib
+    import json
+    with _reference_lock:
+        rows = _reference_rows()
+        if _reference_index['payload'] is None:
+            etag = hashlib.sha1(json.dumps(rows, sort_keys=True).encode()).hexdigest()
+            if etag != _reference_index['etag']:
+                _reference_index['etag'] = etag
+                _reference_index['refreshed_at'] = datetime.utcnow().isoformat()
+            _reference_index['payload'] = json.dumps(
+                {'status': 'success', 'data': rows, 'count': len(rows),
+                 'refreshed_at': _reference_index['refreshed_at']}, sort_keys=True)
+        return _reference_index['payload'], _reference_index['etag']
+
+
+def kraken_reference():
+    """Reference rows keyed by symbol (a shallow copy; rows are replaced, not mutated)."""
+    with _reference_lock:
+        return dict(_reference_rows())
@@ -0,0 +1,262 @@
+"""In-process background refresher for SpotTicker and OrderbookSnapshot.
+
+Disabled unless SCHEDULER_ENABLED=1. Only one process per host runs it (an
+exclusive lock on SCHEDULER_LOCK_FILE), so it is safe to enable under a
+multi-worker gunicorn.
+
+Tickers are refreshed per exchange every SCHEDULER_TICKER_INTERVAL seconds.
+Orderbook snapshots are refreshed per (exchange, symbol) on a cadence picked
+by priority:
+
+- hot:    the symbol showed a cross-exchange spread >= SCHEDULER_HOT_SPREAD_PCT
+          within the last SCHEDULER_HOT_WINDOW seconds
+- active: 24h turnover on that exchange >= SCHEDULER_ACTIVE_TURNOVER
+- idle:   everything else
+
+Each exchange gets at most <EXCHANGE>_ORDERBOOK_BUDGET (default
+SCHEDULER_ORDERBOOK_BUDGET) orderbook requests per minute; due symbols are
+served hot first, then by turnover.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from app import app, db
+from models import SpotTicker, OrderbookSnapshot
+from adapters import ADAPTERS, get_adapter, get_engine
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+TICK_SEC = _env_float('SCHEDULER_TICK', 5)
+TICKER_INTERVAL_SEC = _env_float('SCHEDULER_TICKER_INTERVAL', 120)
+HOT_INTERVAL_SEC = _env_float('SCHEDULER_HOT_INTERVAL', 60)
+ACTIVE_INTERVAL_SEC = _env_float('SCHEDULER_ACTIVE_INTERVAL', 180)
+IDLE_INTERVAL_SEC = _env_float('SCHEDULER_IDLE_INTERVAL', 1800)
+HOT_SPREAD_PCT = _env_float('SCHEDULER_HOT_SPREAD_PCT', 1.0)
+HOT_WINDOW_SEC = _env_float('SCHEDULER_HOT_WINDOW', 900)
+ACTIVE_TURNOVER = _env_float('SCHEDULER_ACTIVE_TURNOVER', 50000)
+ORDERBOOK_BUDGET_PER_MIN = _env_float('SCHEDULER_ORDERBOOK_BUDGET', 60)
+PLAN_INTERVAL_SEC = _env_float('SCHEDULER_PLAN_INTERVAL', 60)
+LOCK_FILE = os.environ.get('SCHEDULER_LOCK_FILE', '/tmp/arbit-scheduler.lock')
+
+
+class Scheduler:
+
+    def __init__(self):
+        self._engine = get_engine()
+        self._last_ticker = {}        # exchange -> last ticker refresh start (epoch)
+        self._ticker_jobs = {}        # exchange -> Future of a ticker refresh
+        self._book_jobs = {}          # exchange -> (symbols, Future of orderbook batch)
+        self._budget = {}             # exchange -> (window_start, requests used)
+        self._candidates = {}         # exchange -> [(symbol, turnover)]
+        self._snap_ts = {}            # (exchange, symbol) -> last snapshot (epoch)
+        self._spread_seen = {}        # symbol -> last time a hot spread was seen (epoch)
+        self._plan_ts = 0
+        self.stats = {'ticker_runs': 0, 'orderbook_requests': 0, 'orderbook_failures': 0,
+                      'last_tick': None, 'started_at': datetime.utcnow().isoformat()}
+
+    # ── planning ──────────────────────────────────────────────────────────
+
+    def _plan(self, now):
+        """Reload candidate symbols, snapshot ages and hot spreads from the DB."""
+        from sqlalchemy import func
+
+        candidates = {}
+        for ex, sym, turnover in db.session.query(
+            SpotTicker.exchange, SpotTicker.symbol, SpotTicker.turnover_24h
+        ).filter(SpotTicker.price > 0).all():
+            if ex in ADAPTERS:
+                candidates.setdefault(ex, []).append((sym, turnover or 0))
+        self._candidates = candidates
+
+        for ex, sym, fetched_at in db.session.query(
+            OrderbookSnapshot.exchange, OrderbookSnapshot.symbol, OrderbookSnapshot.fetched_at
+        ).all():
+            ts = (fetched_at - datetime(1970, 1, 1)).total_seconds() if fetched_at else 0
+            key = (ex, sym)
+            self._snap_ts[key] = max(self._snap_ts.get(key, 0), ts)
+
+        for sym, lo, hi in db.session.query(
+            SpotTicker.symbol, func.min(SpotTicker.price), func.max(SpotTicker.price)
+        ).filter(SpotTicker.price > 0).group_by(SpotTicker.symbol).having(
+            func.count(SpotTicker.exchange) >= 2
+        ).all():
+            if lo and (hi - lo) / lo * 100 >= HOT_SPREAD_PCT:
+                self._spread_seen[sym] = now
+
+        self._plan_ts = now
+
+    def _interval(self, symbol, turnover, now):
+        if now - self._spread_seen.get(symbol, 0) <= HOT_WINDOW_SEC:
+            return HOT_INTERVAL_SEC, 0
+        if turnover >= ACTIVE_TURNOVER:
+            return ACTIVE_INTERVAL_SEC, 1
+        return IDLE_INTERVAL_SEC, 2
+
+    def _take_budget(self, exchange, wanted, now):
+        budget = _env_float(f'{exchange}_ORDERBOOK_BUDGET', ORDERBOOK_BUDGET_PER_MIN)
+        window_start, used = self._budget.get(exchange, (now, 0))
+        if now - window_start >= 60:
+            window_start, used = now, 0
+        granted = max(0, min(wanted, int(budget) - used))
+        self._budget[exchange] = (window_start, used + granted)
+        return granted
+
+    # ── jobs ──────────────────────────────────────────────────────────────
+
+    def _collect(self):
+        from routes import save_tickers, log_fetch, parse_snapshot_book, save_orderbook_snapshots
+
+        for exchange, future in list(self._ticker_jobs.items()):
+            if not future.done():
+                continue
+            del self._ticker_jobs[exchange]
+            # Measured from submission, so it includes up to one tick of collection delay
+            duration_ms = (time.time() - self._last_ticker[exchange]) * 1000
+            try:
+                tickers = future.result()
+                save_tickers(tickers, exchange)
+                log_fetch(exchange, 'success', len(tickers), duration_ms=duration_ms)
+            except Exception as e:
+                message = str(e) or type(e).__name__
+                logger.error(f'Scheduler ticker refresh {exchange}: {message}')
+                log_fetch(exchange, 'error', error_message=message, duration_ms=duration_ms)
+            self.stats['ticker_runs'] += 1
+
+        for exchange, (symbols, future) in list(self._book_jobs.items()):
+            if not future.done():
+                continue
+            del self._book_jobs[exchange]
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f'Scheduler orderbook batch {exchange}: {e}')
+                continue
+            updates = []
+            for symbol, ob in zip(symbols, results):
+                bids, asks, best_bid, best_ask, err = parse_snapshot_book(ob)
+                if err:
+                    self.stats['orderbook_failures'] += 1
+                else:
+                    updates.append((symbol, bids, asks, best_bid, best_ask))
+            if updates:
+                save_orderbook_snapshots(exchange, updates)
+                stamp = time.time()
+                for symbol, *_ in updates:
+                    self._snap_ts[(exchange, symbol)] = stamp
+
+    def _schedule_tickers(self, now):
+        for exchange in ADAPTERS:
+            if exchange in self._ticker_jobs:
+                continue
+            if now - self._last_ticker.get(exchange, 0) < TICKER_INTERVAL_SEC:
+                continue
+            adapter = get_adapter(exchange)
+            self._last_ticker[exchange] = now
+            self._ticker_jobs[exchange] = self._engine.submit(
+                self._engine.fetch_tickers(adapter, timeout=adapter.ticker_deadline)
+            )
+
+    def _schedule_orderbooks(self, now):
+        for exchange, rows in self._candidates.items():
+            if exchange in self._book_jobs:
+                continue
+            due = []
+            for symbol, turnover in rows:
+                interval, tier = self._interval(symbol, turnover, now)
+                if now - self._snap_ts.get((exchange, symbol), 0) >= interval:
+                    due.append((tier, -turnover, symbol))
+            if not due:
+                continue
+            due.sort()
+            granted = self._take_budget(exchange, len(due), now)
+            if not granted:
+                continue
+            symbols = [symbol for _, _, symbol in due[:granted]]
+            adapter = get_adapter(exchange)
+            self._book_jobs[exchange] = (symbols, self._engine.submit(
+                self._gather_books(adapter, symbols)
+            ))
+            self.stats['orderbook_requests'] += len(symbols)
+
+    async def _gather_books(self, adapter, symbols):
+        import asyncio
+        return await asyncio.gather(
+            *(self._engine.fetch_orderbook(adapter, s, 5) for s in symbols),
+            return_exceptions=True
+        )
+
+    def tick(self):
+        now = time.time()
+        with app.app_context():
+            try:
+                self._collect()
+                if now - self._plan_ts >= PLAN_INTERVAL_SEC:
+                    self._plan(now)
+                self._schedule_tickers(now)
+                self._schedule_orderbooks(now)
+            except Exception as e:
+                db.session.rollback()
+                logger.exception(f'Scheduler tick failed: {e}')
+            finally:
+                db.session.remove()
+        self.stats['last_tick'] = datetime.utcnow().isoformat()
+
+    def run_forever(self):
+        logger.info('Background scheduler started')
+        while True:
+            self.tick()
+            time.sleep(TICK_SEC)
+
+    def status(self):
+        now = time.time()
+        hot = sum(1 for ts in self._spread_seen.values() if now - ts <= HOT_WINDOW_SEC)
+        return dict(self.stats,
+                    hot_symbols=hot,
+                    ticker_jobs=sorted(self._ticker_jobs),
+                    orderbook_jobs={ex: len(syms) for ex, (syms, _) in self._book_jobs.items()},
+                    config={
+                        'ticker_interval': TICKER_INTERVAL_SEC,
+                        'hot_interval': HOT_INTERVAL_SEC,
+                        'active_interval': ACTIVE_INTERVAL_SEC,
+                        'idle_interval': IDLE_INTERVAL_SEC,
+                        'hot_spread_pct': HOT_SPREAD_PCT,
+                        'active_turnover': ACTIVE_TURNOVER,
+                        'orderbook_budget_per_min': ORDERBOOK_BUDGET_PER_MIN,
+                    })
+
+
+_scheduler = None
+_lock_handle = None
+
+
+def get_scheduler():
+    return _scheduler
+
+
+def start_scheduler():
+    """Start the scheduler thread if enabled and this process wins the host lock."""
+    global _scheduler, _lock_handle
+    if _scheduler is not None or os.environ.get('SCHEDULER_ENABLED') != '1':
+        return None
+    try:
+        import fcntl
+        handle = open(LOCK_FILE, 'w')
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (ImportError, OSError):
+        logger.info('Scheduler already running in another process; not starting here')
+        return None
+    _lock_handle = handle
+    _scheduler = Scheduler()
+    threading.Thread(target=_scheduler.run_forever, name='scheduler', daemon=True).start()
+    return _scheduler
@@ -0,0 +1,145 @@
+"""EXPLAIN ANALYZE the spot_tickers queries behind each API endpoint, with and without its indexes.
+
+Every endpoint below is called once through the Flask test client while the
+SELECTs it sends to spot_tickers are captured. Each captured statement is
+then explained twice inside a transaction that is always rolled back:
+"before" with the model's secondary indexes on spot_tickers dropped, and
+"after" with any missing ones created. The database is left as it was.
+
+PostgreSQL runs EXPLAIN (ANALYZE, BUFFERS) and reports the top plan node,
+execution time and shared buffers read. Other backends (SQLite) report
+EXPLAIN QUERY PLAN and wall time. DROP/CREATE INDEX lock spot_tickers for
+the duration of each explain, so run this against a copy or off-peak.
+
+    DATABASE_URL=postgresql://... python scripts/explain_indexes.py [--runs 5] [--json out.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.schema import CreateIndex  # noqa: E402
+
+from app import app, db  # noqa: E402
+from models import SpotTicker  # noqa: E402
+import routes  # noqa: E402,F401  (registers the endpoints)
+
+ENDPOINTS = [
+    ('arbitrage', 'GET', '/api/arbitrage?per_page=100', None),
+    ('tickers', 'GET', '/api/tickers?draw=1&start=0&length=50&multi_exchange=true', None),
+    ('exchange-focus', 'GET', '/api/exchange-focus?exchange=MEXC', None),
+    ('scope', 'GET', '/api/scope', None),
+    ('kraken-reference', 'GET', '/api/kraken-monitor/reference', None),
+    ('status', 'GET', '/api/status', None),
+    ('market-fetch-status', 'GET', '/api/market-fetch/status', None),
+]
+
+
+def _capture():
+    """[(endpoint, statement, parameters)] for the spot_tickers SELECTs each endpoint issues."""
+    captured = []
+    current = {'name': None}
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if current['name'] and statement.lstrip().upper().startswith('SELECT') and 'spot_tickers' in statement:
+            captured.append((current['name'], statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_execute)
+    try:
+        client = app.test_client()
+        for name, method, path, body in ENDPOINTS:
+            current['name'] = name
+            resp = client.open(path, method=method, json=body)
+            if resp.status_code >= 400:
+                print(f'  {name}: HTTP {resp.status_code}, skipped', file=sys.stderr)
+                captured = [c for c in captured if c[0] != name]
+        current['name'] = None
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_execute)
+    return captured
+
+
+def _set_indexes(cursor, present):
+    """Drop (present=False) or create (present=True) the model's non-unique spot_tickers indexes."""
+    for index in SpotTicker.__table__.indexes:
+        if present:
+            cursor.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=db.engine.dialect)))
+        else:
+            cursor.execute(f'DROP INDEX IF EXISTS {index.name}')
+
+
+def _explain(cursor, statement, parameters, runs):
+    if db.engine.dialect.name == 'postgresql':
+        times, plan = [], None
+        for _ in range(runs):
+            cursor.execute('EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ' + statement, parameters)
+            result = cursor.fetchone()[0]
+            result = json.loads(result) if isinstance(result, str) else result
+            plan = result[0]
+            times.append(plan['Execution Time'])
+        top = plan['Plan']
+        return {
+            'ms': round(statistics.median(times), 3),
+            'node': top['Node Type'] + (f" on {top['Index Name']}" if 'Index Name' in top else ''),
+            'buffers': top.get('Shared Hit Blocks', 0) + top.get('Shared Read Blocks', 0),
+            'plan': plan
+        }
+    cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+    plan = [row[-1] for row in cursor.fetchall()]
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        cursor.execute(statement, parameters)
+        cursor.fetchall()
+        times.append((time.perf_counter() - start) * 1000)
+    return {'ms': round(statistics.median(times), 3), 'node': plan[0] if plan else '', 'buffers': None,
+            'plan': plan}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5, help='executions per statement (median is reported)')
+    parser.add_argument('--json', help='also write full plans to this file')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if db.engine.dialect.name == 'postgresql':
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql('ANALYZE spot_tickers')
+        captured = _capture()
+        report = []
+        raw = db.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            for name, statement, parameters in captured:
+                entry = {'endpoint': name, 'sql': statement}
+                for label, present in (('before', False), ('after', True)):
+                    try:
+                        if db.engine.dialect.name != 'postgresql':
+                            cursor.execute('BEGIN')  # sqlite3 would autocommit the DDL otherwise
+                        _set_indexes(cursor, present)
+                        entry[label] = _explain(cursor, statement, parameters, args.runs)
+                    finally:
+                        raw.rollback()
+                report.append(entry)
+        finally:
+            raw.close()
+
+    print(f"{'endpoint':<20} {'before ms':>10} {'after ms':>10} {'buffers':>15}  plan (before -> after)")
+    for e in report:
+        b, a = e['before'], e['after']
+        buffers = f"{b['buffers']} -> {a['buffers']}" if b['buffers'] is not None else '-'
+        print(f"{e['endpoint']:<20} {b['ms']:>10} {a['ms']:>10} {buffers:>15}  {b['node']} -> {a['node']}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f'Full plans written to {args.json}')
+
+
+if __name__ == '__main__':
+    main()
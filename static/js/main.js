@@ -381,7 +381,6 @@ function updateExchangeColumnVisibility() {
 }
 
 async function fetchAll() {
-    const exchanges = ['lbank', 'hashkey', 'biconomy', 'mexc', 'bitrue', 'ascendex', 'bitmart', 'dextrade', 'poloniex', 'gateio', 'niza', 'xt', 'coinstore', 'vindax', 'fameex', 'bigone', 'p2pb2b', 'digifinex', 'azbit', 'latoken', 'kraken', 'bingx', 'btse', 'whitebit', 'htx', 'binancealpha', 'uzx'];
     const fetchAllBtn = document.getElementById('btn-fetch-all');
     const progressEl = fetchAllBtn.querySelector('.fetch-all-progress');
     const labelEl = fetchAllBtn.querySelector('.fetch-all-label');
@@ -390,44 +389,58 @@ async function fetchAll() {
     fetchAllBtn.classList.add('loading');
     labelEl.textContent = 'Fetching...';
 
-    let done = 0;
-    const total = exchanges.length;
+    const setButtonLoading = (exchange, loading) => {
+        const btn = document.getElementById(`btn-${exchange.toLowerCase()}`);
+        if (!btn) return;
+        btn.classList.toggle('loading', loading);
+        btn.disabled = loading;
+    };
 
-    try {
-        for (const exchange of exchanges) {
-            progressEl.textContent = `${done}/${total}`;
-
-            const btn = document.getElementById(`btn-${exchange}`);
-            if (btn) {
-                btn.classList.add('loading');
-                btn.disabled = true;
+    const handleEvent = async (event) => {
+        if (event.type === 'start') {
+            event.exchanges.forEach(ex => setButtonLoading(ex, true));
+            progressEl.textContent = `0/${event.total}`;
+        } else if (event.type === 'exchange') {
+            setButtonLoading(event.exchange, false);
+            progressEl.textContent = `${event.done}/${event.total}`;
+            if (event.status === 'success') {
+                showToast(`${event.exchange}: ${event.message}${coverageNote(event.coverage)}`, 'success');
+            } else {
+                showToast(`${event.exchange} Error: ${event.message}`, 'error');
             }
+            await loadStatus();
+        } else if (event.type === 'done') {
+            dataTable.ajax.reload();
+            showToast(`All exchanges fetched in ${event.duration}s!`, 'success');
+        }
+    };
 
-            try {
-                const response = await fetch(`/api/fetch/${exchange}`, { method: 'POST' });
-                const data = await response.json();
-                if (data.status === 'success') {
-                    showToast(`${exchange.toUpperCase()}: ${data.message}`, 'success');
-                } else {
-                    showToast(`${exchange.toUpperCase()} Error: ${data.message}`, 'error');
-                }
-            } catch (error) {
-                showToast(`${exchange.toUpperCase()} failed: ${error.message}`, 'error');
-            } finally {
-                if (btn) {
-                    btn.classList.remove('loading');
-                    btn.disabled = false;
+    try {
+        // Server streams one SSE event per exchange as soon as it is persisted
+        const response = await fetch('/api/fetch-all', { method: 'POST' });
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const chunks = buffer.split('\n\n');
+            buffer = chunks.pop();
+            for (const chunk of chunks) {
+                if (chunk.startsWith('data: ')) {
+                    await handleEvent(JSON.parse(chunk.slice(6)));
                 }
             }
-
-            done++;
-            progressEl.textContent = `${done}/${total}`;
-            await loadStatus();
         }
-
-        dataTable.ajax.reload();
-        showToast('All exchanges fetched!', 'success');
+    } catch (error) {
+        showToast(`Fetch all failed: ${error.message}`, 'error');
     } finally {
+        document.querySelectorAll('.fetch-btn.loading').forEach(btn => {
+            btn.classList.remove('loading');
+            btn.disabled = false;
+        });
         fetchAllBtn.disabled = false;
         fetchAllBtn.classList.remove('loading');
         labelEl.textContent = 'Fetch All';
@@ -435,6 +448,11 @@ async function fetchAll() {
     }
 }
 
+function coverageNote(coverage) {
+    if (!coverage) return '';
+    return ` (${coverage.fetched}/${coverage.listed} pairs, ${coverage.failed} failed)`;
+}
+
 async function fetchData(exchange) {
     const btn = document.getElementById(`btn-${exchange}`);
     btn.classList.add('loading');
@@ -447,7 +465,7 @@ async function fetchData(exchange) {
         const data = await response.json();
         
         if (data.status === 'success') {
-            showToast(`${data.message}`, 'success');
+            showToast(`${data.message}${coverageNote(data.coverage)}`, 'success');
             dataTable.ajax.reload();
             await loadStatus();
         } else {
@@ -466,38 +484,10 @@ async function loadStatus() {
         const response = await fetch('/api/status');
         const data = await response.json();
         
-        updateStatusDisplay('lbank', data.lbank);
-        updateStatusDisplay('hashkey', data.hashkey);
-        updateStatusDisplay('biconomy', data.biconomy);
-        updateStatusDisplay('mexc', data.mexc);
-        updateStatusDisplay('bitrue', data.bitrue);
-        updateStatusDisplay('ascendex', data.ascendex);
-        updateStatusDisplay('bitmart', data.bitmart);
-        updateStatusDisplay('dextrade', data.dextrade);
-        updateStatusDisplay('poloniex', data.poloniex);
-        updateStatusDisplay('gateio', data.gateio);
-        updateStatusDisplay('niza', data.niza);
-        updateStatusDisplay('xt', data.xt);
-        updateStatusDisplay('coinstore', data.coinstore);
-        updateStatusDisplay('vindax', data.vindax);
-        updateStatusDisplay('fameex', data.fameex);
-        updateStatusDisplay('bigone', data.bigone);
-        updateStatusDisplay('p2pb2b', data.p2pb2b);
-        updateStatusDisplay('digifinex', data.digifinex);
-        updateStatusDisplay('azbit', data.azbit);
-        updateStatusDisplay('latoken', data.latoken);
-        updateStatusDisplay('kraken', data.kraken);
-        updateStatusDisplay('bingx', data.bingx);
-        updateStatusDisplay('btse', data.btse);
-        updateStatusDisplay('whitebit', data.whitebit);
-        updateStatusDisplay('htx', data.htx);
-        updateStatusDisplay('binancealpha', data.binancealpha);
-        updateStatusDisplay('uzx', data.uzx);
-        
         let totalMarkets = 0;
-        const exchanges = ['lbank', 'hashkey', 'biconomy', 'mexc', 'bitrue', 'ascendex', 'bitmart', 'dextrade', 'poloniex', 'gateio', 'niza', 'xt', 'coinstore', 'vindax', 'fameex', 'bigone', 'p2pb2b', 'digifinex', 'azbit', 'latoken', 'kraken', 'bingx', 'btse', 'whitebit', 'htx', 'binancealpha', 'uzx'];
-        exchanges.forEach(ex => {
-            if (data[ex] && data[ex].pairs_count) {
+        Object.keys(data).forEach(ex => {
+            updateStatusDisplay(ex, data[ex]);
+            if (data[ex].pairs_count) {
                 totalMarkets += data[ex].pairs_count;
             }
         });
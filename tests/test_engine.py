@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from adapters.base import BaseAdapter, NormalizedOrderbook
+from adapters.engine import AdapterEngine
+
+
+class StuckSession:
+    """Stands in for requests.Session: each get() blocks for its timeout, then raises."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        time.sleep(timeout)
+        raise TimeoutError('read timed out')
+
+
+class SlowAdapter(BaseAdapter):
+    DEPTH_DEADLINE = 0.3
+    MAX_CONCURRENCY = 2
+    RATE_LIMIT = 1000.0
+    RATE_BURST = 1000.0
+
+    def __init__(self, name='SLOWTEST'):
+        self._name = name
+        self.stuck = StuckSession()
+        self.finished = threading.Event()
+
+    @property
+    def exchange_name(self):
+        return self._name
+
+    @property
+    def session(self):
+        return self.stuck
+
+    def fetch_usdt_tickers(self):
+        return []
+
+    def fetch_orderbook(self, symbol, limit=20):
+        try:
+            self._get('https://example.invalid/depth', kind='depth', timeout=60)
+            return NormalizedOrderbook(exchange=self.exchange_name, symbol=symbol, asks=[], bids=[])
+        finally:
+            self.finished.set()
+
+
+def test_orderbook_deadline_bounds_the_adapter_thread():
+    engine = AdapterEngine(max_workers=4)
+    adapter = SlowAdapter()
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        engine.run(engine.fetch_orderbook(adapter, 'X/USDT'))
+    # The request timeout was cut from 60s to the deadline, so the worker finishes too
+    assert adapter.finished.wait(1.0)
+    assert time.monotonic() - started < 1.5
+    assert adapter.stuck.timeouts and max(adapter.stuck.timeouts) <= adapter.DEPTH_DEADLINE
+
+
+def test_fetch_orderbooks_returns_exceptions_within_batch_bound():
+    engine = AdapterEngine(max_workers=4)
+    adapter = SlowAdapter('SLOWBATCH')
+    jobs = [(adapter, f'C{i}/USDT') for i in range(3)]
+    assert engine.batch_timeout(jobs) == pytest.approx(2 * 0.3 + 5)
+    results = engine.fetch_orderbooks(jobs)
+    assert len(results) == 3
+    assert all(isinstance(r, TimeoutError) for r in results)
+
+
+def test_run_cancels_on_timeout():
+    import asyncio
+    engine = AdapterEngine(max_workers=1)
+    cancelled = threading.Event()
+
+    async def forever():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        engine.run(forever(), timeout=0.1)
+    assert cancelled.wait(1.0)
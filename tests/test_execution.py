@@ -0,0 +1,151 @@
+import pytest
+
+import bookcodec
+from execution import BookSide, executable_spreads, max_profitable, pair_execution
+
+
+def test_bookside_sorts_and_drops_bad_levels():
+    bids = BookSide.bids([[98, 1], ['x', 1], [99, 2], [100, 0], [97]])
+    assert bids.prices == [99.0, 98.0]
+    assert bids.cum_qty == [2.0, 3.0]
+    assert bids.cum_notional == [198.0, 296.0]
+    assert bids.best == 99.0
+    assert bids.notional == 296.0
+
+
+def test_bookside_from_packed_matches_levels():
+    levels = [[101, 2], [100, 1]]
+    packed = BookSide.from_packed(bookcodec.decode(bookcodec.encode_asks(levels)))
+    parsed = BookSide.asks(levels)
+    assert list(packed.prices) == parsed.prices
+    assert packed.cum_notional == parsed.cum_notional
+
+
+def test_empty_bookside():
+    side = BookSide.asks([])
+    assert side.best is None
+    assert side.notional == 0.0
+    assert side.qty_for_notional(1) is None
+    assert side.notional_for_qty(1) is None
+
+
+def test_qty_for_notional_walks_levels():
+    asks = BookSide.asks([[100, 1], [101, 2]])
+    assert asks.qty_for_notional(50) == pytest.approx(0.5)
+    assert asks.qty_for_notional(100) == pytest.approx(1.0)
+    assert asks.qty_for_notional(200) == pytest.approx(1 + 100 / 101)
+    assert asks.qty_for_notional(302) == pytest.approx(3.0)
+
+
+def test_qty_for_notional_thin_book():
+    asks = BookSide.asks([[100, 1], [101, 2]])
+    assert asks.qty_for_notional(303) is None
+
+
+def test_notional_for_qty_walks_levels():
+    bids = BookSide.bids([[99, 1], [98, 1]])
+    assert bids.notional_for_qty(0.5) == pytest.approx(49.5)
+    assert bids.notional_for_qty(1.5) == pytest.approx(99 + 0.5 * 98)
+    assert bids.notional_for_qty(2) == pytest.approx(197)
+    assert bids.notional_for_qty(2.5) is None
+
+
+def test_max_profitable_stops_when_margin_is_gone():
+    asks = BookSide.asks([[100, 1], [102, 1]])
+    bids = BookSide.bids([[103, 1.5], [101, 1]])
+    size, profit = max_profitable(asks, bids, 0, 0)
+    # 1 @ 100 -> 103, then 0.5 @ 102 -> 103; 102 -> 101 no longer pays
+    assert size == pytest.approx(100 + 0.5 * 102)
+    assert profit == pytest.approx(3 + 0.5)
+
+
+def test_max_profitable_applies_fees():
+    asks = BookSide.asks([[100, 1], [102, 1]])
+    bids = BookSide.bids([[103, 1.5], [101, 1]])
+    size, profit = max_profitable(asks, bids, 1, 1)
+    # 103 * 0.99 = 101.97 beats 100 * 1.01 but not 102 * 1.01
+    assert size == pytest.approx(100)
+    assert profit == pytest.approx(101.97 - 101)
+
+
+def test_max_profitable_no_cross():
+    asks = BookSide.asks([[100, 1]])
+    bids = BookSide.bids([[99, 1]])
+    assert max_profitable(asks, bids, 0, 0) == (0.0, 0.0)
+
+
+def test_pair_execution_fees_per_leg():
+    asks = BookSide.asks([[100, 2]])
+    bids = BookSide.bids([[102, 2]])
+    r = pair_execution('A', asks, 'B', bids, 100, 0.1, 0.1)
+    assert r['filled']
+    assert r['vwap_buy'] == pytest.approx(100)
+    assert r['vwap_sell'] == pytest.approx(102)
+    assert r['gross_spread_pct'] == pytest.approx(2.0)
+    # 102 * 0.999 - 100 * 1.001
+    assert r['profit_usdt'] == pytest.approx(1.8, abs=0.01)
+    assert r['net_spread_pct'] == pytest.approx(1.798)
+    assert r['buy_slippage_pct'] == 0
+    assert r['sell_slippage_pct'] == 0
+
+
+def test_pair_execution_slippage():
+    asks = BookSide.asks([[100, 0.5], [110, 10]])
+    bids = BookSide.bids([[120, 10]])
+    r = pair_execution('A', asks, 'B', bids, 105, 0, 0)
+    qty = 0.5 + 55 / 110
+    assert r['filled']
+    assert r['vwap_buy'] == pytest.approx(105 / qty)
+    assert r['buy_slippage_pct'] == pytest.approx(round((105 / qty - 100) / 100 * 100, 3))
+
+
+def test_pair_execution_thin_book_is_unfilled():
+    asks = BookSide.asks([[100, 1], [101, 2]])
+    bids = BookSide.bids([[110, 10]])
+    r = pair_execution('A', asks, 'B', bids, 1000, 0, 0)
+    assert not r['filled']
+    assert r['net_spread_pct'] is None
+    assert r['buy_depth_usdt'] == 302
+    assert r['max_size_usdt'] == 302
+
+
+def test_pair_execution_thin_sell_side_is_unfilled():
+    asks = BookSide.asks([[100, 10]])
+    bids = BookSide.bids([[110, 0.5]])
+    r = pair_execution('A', asks, 'B', bids, 100, 0, 0)
+    assert not r['filled']
+    assert r['max_size_usdt'] == 50
+
+
+def test_executable_spreads_skips_non_crossing_and_orders_best_first():
+    books = {
+        'A': (BookSide.bids([[99, 10]]), BookSide.asks([[100, 10]])),
+        'B': (BookSide.bids([[105, 10]]), BookSide.asks([[106, 10]])),
+        'C': (BookSide.bids([[102, 10]]), BookSide.asks([[103, 10]])),
+    }
+    pairs = executable_spreads(books, 100, default_fee=0)
+    assert [(p['buy_exchange'], p['sell_exchange']) for p in pairs] == [('A', 'B'), ('A', 'C'), ('C', 'B')]
+    assert all(p['filled'] for p in pairs)
+
+
+def test_executable_spreads_fee_overrides():
+    books = {
+        'A': (BookSide.bids([[99, 10]]), BookSide.asks([[100, 10]])),
+        'B': (BookSide.bids([[102, 10]]), BookSide.asks([[103, 10]])),
+    }
+    [default] = executable_spreads(books, 100, default_fee=0.1)
+    [override] = executable_spreads(books, 100, fees={'A': 0.5}, default_fee=0.1)
+    assert default['profit_usdt'] == pytest.approx(102 * 0.999 - 100.1, abs=0.01)
+    assert override['profit_usdt'] == pytest.approx(102 * 0.999 - 100.5, abs=0.01)
+
+
+def test_executable_spreads_unfilled_after_filled():
+    books = {
+        'A': (BookSide.bids([[90, 10]]), BookSide.asks([[100, 0.1]])),
+        'B': (BookSide.bids([[110, 10]]), BookSide.asks([[120, 10]])),
+        'C': (BookSide.bids([[101, 10]]), BookSide.asks([[100.5, 10]])),
+    }
+    pairs = executable_spreads(books, 100, default_fee=0)
+    # A's asks hold only 10 USDT: its pairs come last, ranked by max profit
+    assert [(p['buy_exchange'], p['sell_exchange'], p['filled']) for p in pairs] == [
+        ('C', 'B', True), ('A', 'B', False), ('A', 'C', False)]
@@ -0,0 +1,47 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from adapters.ratelimit import MAX_RESET_DELAY, _reset_delay, retry_after
+
+
+def test_retry_after_seconds():
+    assert retry_after({'Retry-After': '12'}) == 12.0
+    assert retry_after({'Retry-After': '-3'}) == 0.0
+    assert retry_after({}) is None
+    assert retry_after({'Retry-After': 'soon'}) is None
+
+
+def test_retry_after_http_date():
+    delay = retry_after({'Retry-After': formatdate(time.time() + 60, usegmt=True)})
+    assert 55 <= delay <= 60
+
+
+def test_retry_after_far_future_http_date_is_capped(caplog):
+    far = formatdate(time.time() + 30 * 86400, usegmt=True)
+    with caplog.at_level('WARNING', logger='adapters.ratelimit'):
+        assert retry_after({'Retry-After': far}) == MAX_RESET_DELAY
+    assert 'capping' in caplog.text
+
+
+def test_retry_after_huge_seconds_and_nan_are_capped():
+    assert retry_after({'Retry-After': '1e9'}) == MAX_RESET_DELAY
+    assert retry_after({'Retry-After': 'nan'}) == MAX_RESET_DELAY
+
+
+@pytest.mark.parametrize('value, expected', [
+    (30, 30),
+    (5e8, MAX_RESET_DELAY),
+    (-1, 0.0),
+])
+def test_reset_delay_relative(value, expected):
+    assert _reset_delay(value) == expected
+
+
+def test_reset_delay_epoch_seconds_and_millis():
+    now = time.time()
+    assert 8 <= _reset_delay(now + 10) <= 10
+    assert 8 <= _reset_delay((now + 10) * 1000) <= 10
+    assert _reset_delay(now + 86400) == MAX_RESET_DELAY
+    assert _reset_delay(now - 5) == 0.0
@@ -0,0 +1,220 @@
+import pytest
+
+from adapters.gateio import GateIOAdapter, GateIOStream
+from adapters.kraken import KrakenAdapter, KrakenBook, KrakenStream
+from adapters.poloniex import PoloniexAdapter, PoloniexStream
+from adapters.streaming import L2Book
+
+
+class Recorder:
+    """Mixin that records resync requests and sent messages instead of using a socket."""
+
+    def __init__(self, adapter):
+        super().__init__(adapter)
+        self.resynced = []
+        self.sent = []
+
+    def on_resync(self, venue_symbol):
+        self.resynced.append(venue_symbol)
+
+    def _send(self, messages):
+        self.sent.extend(messages)
+
+
+class GateRecorder(Recorder, GateIOStream):
+    pass
+
+
+class PoloniexRecorder(Recorder, PoloniexStream):
+    pass
+
+
+class KrakenRecorder(Recorder, KrakenStream):
+    pass
+
+
+def _watching(stream, venue_symbol):
+    stream._symbols[venue_symbol] = 0.0
+    return stream
+
+
+# ── L2Book ────────────────────────────────────────────────────────────────
+
+def test_l2book_reset_replaces_levels_and_syncs():
+    book = L2Book()
+    book.update([[1, 1]], [[2, 1]])
+    assert not book.synced
+    book.reset([['100', '1'], ['99', '2']], [['101', '3']], seq=7)
+    assert book.synced
+    assert book.seq == 7
+    assert book.bids == {100.0: 1.0, 99.0: 2.0}
+    assert book.asks == {101.0: 3.0}
+
+
+def test_l2book_update_sets_and_removes_levels():
+    book = L2Book()
+    book.reset([[100, 1], [99, 2]], [[101, 3]], seq=1)
+    book.update([[100, 0], [98, 5]], [[101, 4], [102, 1]], seq=2)
+    assert book.bids == {99.0: 2.0, 98.0: 5.0}
+    assert book.asks == {101.0: 4.0, 102.0: 1.0}
+    assert book.seq == 2
+    book.update([], [], seq=None)
+    assert book.seq == 2
+
+
+def test_l2book_truncate_keeps_best_levels():
+    book = L2Book()
+    book.reset([[p, 1] for p in range(90, 100)], [[p, 1] for p in range(100, 110)])
+    book.truncate(3)
+    assert sorted(book.bids) == [97.0, 98.0, 99.0]
+    assert sorted(book.asks) == [100.0, 101.0, 102.0]
+    assert book.top(2) == ([[99.0, 1.0], [98.0, 1.0]], [[100.0, 1.0], [101.0, 1.0]])
+
+
+# ── Gate.io U/u chaining ──────────────────────────────────────────────────
+
+def _gate_update(first, last, bids=(), asks=()):
+    return {'channel': 'spot.order_book_update', 'event': 'update',
+            'result': {'s': 'BTC_USDT', 'U': first, 'u': last, 'b': list(bids), 'a': list(asks)}}
+
+
+@pytest.fixture
+def gate():
+    stream = _watching(GateRecorder(GateIOAdapter()), 'BTC_USDT')
+    stream._book('BTC_USDT').reset([[100, 1]], [[101, 1]], seq=10)
+    return stream
+
+
+def test_gate_contiguous_update_applies(gate):
+    gate.handle_message(_gate_update(11, 12, bids=[[100, 2]]))
+    book = gate._books['BTC_USDT']
+    assert book.seq == 12
+    assert book.bids == {100.0: 2.0}
+    assert gate.resynced == []
+
+
+def test_gate_stale_update_is_skipped(gate):
+    gate.handle_message(_gate_update(5, 9, bids=[[100, 9]]))
+    assert gate._books['BTC_USDT'].bids == {100.0: 1.0}
+    assert gate.resynced == []
+
+
+def test_gate_gap_marks_unsynced_and_resyncs(gate):
+    gate.handle_message(_gate_update(13, 14, bids=[[100, 2]]))
+    book = gate._books['BTC_USDT']
+    assert not book.synced
+    assert book.bids == {100.0: 1.0}
+    assert gate.resynced == ['BTC_USDT']
+    assert gate.stats['resyncs'] == 1
+
+
+def test_gate_buffers_until_snapshot():
+    stream = _watching(GateRecorder(GateIOAdapter()), 'BTC_USDT')
+    stream.on_resync = lambda symbol: stream._pending.setdefault(symbol, [])
+    stream.handle_message(_gate_update(1, 2))
+    stream.handle_message(_gate_update(3, 4))
+    assert [u['u'] for u in stream._pending['BTC_USDT']] == [2, 4]
+    assert not stream._books['BTC_USDT'].synced
+
+
+# ── Poloniex lastId chaining ──────────────────────────────────────────────
+
+def _polo(action, id_, last_id=None, bids=(), asks=()):
+    return {'channel': 'book_lv2', 'action': action,
+            'data': [{'symbol': 'BTC_USDT', 'id': id_, 'lastId': last_id,
+                      'bids': list(bids), 'asks': list(asks)}]}
+
+
+def test_poloniex_chained_update_applies():
+    stream = _watching(PoloniexRecorder(PoloniexAdapter()), 'BTC_USDT')
+    stream.handle_message(_polo('snapshot', 5, bids=[['100', '1']], asks=[['101', '1']]))
+    stream.handle_message(_polo('update', 6, last_id=5, asks=[['101', '0'], ['102', '2']]))
+    book = stream._books['BTC_USDT']
+    assert book.synced and book.seq == 6
+    assert book.asks == {102.0: 2.0}
+    assert stream.resynced == []
+
+
+def test_poloniex_gap_marks_unsynced_and_resyncs():
+    stream = _watching(PoloniexRecorder(PoloniexAdapter()), 'BTC_USDT')
+    stream.handle_message(_polo('snapshot', 5, bids=[['100', '1']], asks=[['101', '1']]))
+    stream.handle_message(_polo('update', 8, last_id=7, bids=[['100', '3']]))
+    book = stream._books['BTC_USDT']
+    assert not book.synced
+    assert book.bids == {100.0: 1.0}
+    assert stream.resynced == ['BTC_USDT']
+    # Updates are ignored until the next snapshot
+    stream.handle_message(_polo('update', 9, last_id=8, bids=[['100', '4']]))
+    assert book.bids == {100.0: 1.0}
+    stream.handle_message(_polo('snapshot', 10, bids=[['99', '1']], asks=[['101', '1']]))
+    assert stream._books['BTC_USDT'].synced
+
+
+# ── Kraken checksum ───────────────────────────────────────────────────────
+
+# Example book from Kraken's v1 checksum documentation
+KRAKEN_ASKS = [[f"0.{p:05d}", "0.00000500"] for p in range(5005, 5055, 5)]
+KRAKEN_BIDS = [[f"0.{p:05d}", "0.00000500"]
+               for p in (5000, 4995, 4990, 4980, 4975, 4970, 4965, 4960, 4955, 4950)]
+KRAKEN_CHECKSUM = 974947235
+
+
+def test_kraken_checksum_matches_documented_example():
+    book = KrakenBook()
+    book.reset(KRAKEN_BIDS, KRAKEN_ASKS)
+    assert book.checksum() == KRAKEN_CHECKSUM
+
+
+def test_kraken_checksum_ignores_levels_past_top_ten_and_truncation():
+    book = KrakenBook()
+    book.reset(KRAKEN_BIDS + [["0.04000", "1.00000000"]], KRAKEN_ASKS + [["0.06000", "1.00000000"]])
+    assert book.checksum() == KRAKEN_CHECKSUM
+    book.truncate(10)
+    assert len(book.raw_bids) == len(book.raw_asks) == 10
+    assert book.checksum() == KRAKEN_CHECKSUM
+
+
+def _kraken_stream():
+    stream = _watching(KrakenRecorder(KrakenAdapter()), 'XBT/USD')
+    stream.handle_message([1, {'as': KRAKEN_ASKS, 'bs': KRAKEN_BIDS}, 'book-25', 'XBT/USD'])
+    return stream
+
+
+def test_kraken_update_with_matching_checksum_keeps_book():
+    stream = _kraken_stream()
+    book = stream._books['XBT/USD']
+    # Remove and re-add the best ask: same book, same checksum
+    stream.handle_message([1, {'a': [["0.05005", "0.00000000", "1"]]}, 'book-25', 'XBT/USD'])
+    stream.handle_message([1, {'a': [["0.05005", "0.00000500", "2"]], 'c': str(KRAKEN_CHECKSUM)},
+                           'book-25', 'XBT/USD'])
+    assert book.synced
+    assert stream.resynced == []
+
+
+def test_kraken_checksum_mismatch_marks_unsynced_and_resyncs():
+    stream = _kraken_stream()
+    stream.handle_message([1, {'b': [["0.05000", "0.00000600", "1"]], 'c': str(KRAKEN_CHECKSUM)},
+                           'book-25', 'XBT/USD'])
+    assert not stream._books['XBT/USD'].synced
+    assert stream.resynced == ['XBT/USD']
+
+
+def test_kraken_resync_resubscribes():
+    stream = _watching(KrakenStream(KrakenAdapter()), 'XBT/USD')
+    sent = []
+    stream._send = sent.extend
+    stream.on_resync('XBT/USD')
+    assert [m['event'] for m in sent] == ['unsubscribe', 'subscribe']
+    assert all(m['pair'] == ['XBT/USD'] for m in sent)
+
+
+# ── eviction ──────────────────────────────────────────────────────────────
+
+def test_eviction_drops_display_names():
+    stream = PoloniexRecorder(PoloniexAdapter())
+    stream.MAX_SYMBOLS = 2
+    stream._thread = object()   # do not connect
+    for i, symbol in enumerate(['A_USDT', 'B_USDT', 'C_USDT']):
+        stream._watch(symbol, symbol.replace('_', '/'))
+        stream._symbols[symbol] = float(i)
+    assert set(stream._symbols) == set(stream._display) == {'B_USDT', 'C_USDT'}